@@ -12,7 +12,7 @@ from hopper import config
 from hopper.lodes import ID_ALPHABET, ID_LEN, current_time_ms
 
 
-@dataclass
+@dataclass(slots=True)
 class BacklogItem:
     """A backlog item."""
 
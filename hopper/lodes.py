@@ -35,6 +35,7 @@ Lodes are plain dicts with these fields:
 
 import json
 import os
+import re
 import secrets
 import time
 import uuid
@@ -184,22 +185,18 @@ def get_worktree_dir(lode_id: str) -> Path:
     return config.worktree_root() / lode_id
 
 
+# One numstat row: "<additions>\t<deletions>\t<path>". Binary files report "-"
+# counts and never match.
+_NUMSTAT_ROW_RE = re.compile(r"^\s*([0-9]+)\t([0-9]+)\t.*\S", re.MULTILINE)
+
+
 def parse_diff_numstat_totals(text: str) -> tuple[int, int]:
     """Parse git numstat output and return (total_additions, total_deletions)."""
     total_additions = 0
     total_deletions = 0
-    for raw_line in text.splitlines():
-        line = raw_line.strip()
-        if not line:
-            continue
-        parts = line.split("\t", 2)
-        if len(parts) != 3:
-            continue
-        additions, deletions, _filename = parts
-        if not additions.isdigit() or not deletions.isdigit():
-            continue
-        total_additions += int(additions)
-        total_deletions += int(deletions)
+    for match in _NUMSTAT_ROW_RE.finditer(text):
+        total_additions += int(match[1])
+        total_deletions += int(match[2])
     return (total_additions, total_deletions)
 
 
@@ -630,23 +627,22 @@ STATUS_SHIPPED = "✓"
 STATUS_GATED = "◇"  # open diamond — paused at gate, awaiting user review
 STATUS_DISCONNECTED = "⊘"  # circled division slash — runner not connected
 
+# State -> icon for active lodes; unlisted states count as running work
+_STATE_ICONS = {
+    "new": STATUS_NEW,
+    "error": STATUS_ERROR,
+    "stuck": STATUS_STUCK,
+}
+
 
 def lode_icon(lode: dict) -> str:
     """Derive the status icon for a lode based on its state, stage, and active flag."""
     stage = lode.get("stage", "mill")
     state = lode.get("state", "new")
     if stage == "shipped":
-        icon = STATUS_SHIPPED
-    elif state == "new":
-        icon = STATUS_NEW
-    elif state == "error":
-        icon = STATUS_ERROR
-    elif state == "gated":
-        icon = STATUS_GATED
-    elif state == "stuck":
-        icon = STATUS_STUCK
-    else:
-        icon = STATUS_RUNNING
-    if not lode.get("active", False) and stage != "shipped" and state != "gated":
-        icon = STATUS_DISCONNECTED
-    return icon
+        return STATUS_SHIPPED
+    if state == "gated":
+        return STATUS_GATED
+    if not lode.get("active", False):
+        return STATUS_DISCONNECTED
+    return _STATE_ICONS.get(state, STATUS_RUNNING)
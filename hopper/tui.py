@@ -4,9 +4,8 @@
 """TUI for managing coding agents using Textual."""
 
 import os
-import re
 import time
-from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 from rich.text import Text
@@ -42,18 +41,24 @@ from hopper.lodes import (
     STATUS_RUNNING,
     STATUS_SHIPPED,
     STATUS_STUCK,
-    compute_runtime_ms,
     current_time_ms,
     format_age,
-    format_duration_ms,
     format_uptime,
     get_lode_dir,
     get_worktree_dir,
-    lode_icon,
     read_diff_totals,
 )
 from hopper.projects import Project, find_project, load_projects, touch_project
 from hopper.tmux import capture_pane, rename_window
+from hopper.tui_format import (
+    format_diff_stat,
+    format_diff_summary,
+    format_project_label,
+    format_stage_text,
+    format_status_label,
+    format_status_text,
+    lode_to_row,
+)
 
 # Claude Code-inspired theme
 # Colors derived from Claude Code's terminal UI (ANSI bright colors)
@@ -81,103 +86,9 @@ HINT_LODE = "_hint_lode"
 HINT_BACKLOG = "_hint_backlog"
 SHIPPED_24H_MS = 24 * 60 * 60 * 1000
 
-# Status -> color mapping (shared by icon and text formatting)
-STATUS_COLORS = {
-    STATUS_RUNNING: "bright_green",
-    STATUS_STUCK: "bright_yellow",
-    STATUS_ERROR: "bright_red",
-    STATUS_GATED: "bright_cyan",
-    STATUS_NEW: "bright_black",
-    STATUS_SHIPPED: "bright_green",
-    STATUS_DISCONNECTED: "bright_red",
-}
-
 STAGE_ORDER = {"mill": 0, "refine": 1, "ship": 2, "shipped": 3}
 
 
-@dataclass
-class Row:
-    """A row in a table."""
-
-    id: str
-    stage: str  # "mill", "refine", "ship", or "shipped"
-    age: str  # formatted age string
-    run: str  # formatted cumulative runtime
-    # STATUS_RUNNING, STATUS_STUCK, STATUS_NEW, STATUS_ERROR, STATUS_GATED,
-    # STATUS_SHIPPED, STATUS_DISCONNECTED
-    status: str
-    project: str = ""  # Project name
-    title: str = ""  # Short human-readable lode title
-    status_text: str = ""  # Human-readable status text
-
-
-def lode_to_row(lode: dict) -> Row:
-    """Convert a lode dict to a display row."""
-    status = lode_icon(lode)
-    stage = lode.get("stage", "mill")
-    status_text = lode.get("status", "")
-    progress_text = lode.get("last_progress_summary", "")
-    spawn_status = status_text.startswith(("spawn refused: ", "spawn failed: "))
-    if lode.get("active") and progress_text and not spawn_status:
-        status_text = progress_text
-
-    return Row(
-        id=lode["id"],
-        stage=stage,
-        age=format_age(lode["created_at"]),
-        run=format_duration_ms(compute_runtime_ms(lode)),
-        status=status,
-        project=lode.get("project", ""),
-        title=lode.get("title", ""),
-        status_text=status_text,
-    )
-
-
-def format_status_text(status: str) -> Text:
-    """Format a status icon with color using Rich Text."""
-    return Text(status, style=STATUS_COLORS.get(status, ""))
-
-
-def strip_ansi(text: str) -> str:
-    """Remove ANSI escape codes from text."""
-    return re.sub(r"\x1b\[[0-9;]*m", "", text)
-
-
-def format_status_label(label: str, status: str) -> Text:
-    """Format status text with color matching the status icon."""
-    cleaned = strip_ansi(label.replace("\n", " ")) if label else ""
-    return Text(cleaned, style=STATUS_COLORS.get(status, ""))
-
-
-def format_stage_text(stage: str) -> Text:
-    """Format a stage indicator with color using Rich Text."""
-    if stage == "mill":
-        return Text(stage, style="bright_blue")
-    elif stage == "refine":
-        return Text(stage, style="bright_yellow")
-    elif stage == "ship":
-        return Text(stage, style="bright_green")
-    elif stage == "shipped":
-        return Text(stage, style="bright_green")
-    return Text(stage)
-
-
-def format_diff_summary(diff: str) -> Text:
-    """Format a diff summary like '+30 -8' with green additions and red deletions."""
-    if not diff:
-        return Text("")
-    parts = diff.split(" ")
-    text = Text()
-    text.append(parts[0], "bright_green")
-    text.append(" ")
-    text.append(parts[1], "bright_red")
-    return text
-
-
-def _picker_option_label(project: Project) -> str:
-    return f"{project.name} (disabled)" if project.disabled else project.name
-
-
 class ProjectPickerScreen(ModalScreen[Project | None]):
     """Modal screen for picking a project."""
 
@@ -224,7 +135,7 @@ class ProjectPickerScreen(ModalScreen[Project | None]):
     def compose(self) -> ComposeResult:
         with Vertical(id="picker-container"):
             yield Static(self._picker_title, id="picker-title")
-            options = [Option(_picker_option_label(p), id=p.name) for p in self._projects]
+            options = [Option(format_project_label(p), id=p.name) for p in self._projects]
             yield OptionList(*options, id="project-list")
 
     def on_mount(self) -> None:
@@ -387,23 +298,24 @@ class TextInputScreen(ModalScreen):
     def compose(self) -> ComposeResult:
         with Vertical(classes="text-input-container"):
             yield Static(self.MODAL_TITLE, classes="text-input-title")
-            yield TextArea(classes="text-input-area")
+            self.text_area = TextArea(classes="text-input-area")
+            yield self.text_area
+            self._buttons = tuple(self.compose_buttons())
             with Horizontal(classes="text-input-buttons"):
-                yield from self.compose_buttons()
+                yield from self._buttons
 
     def compose_buttons(self) -> ComposeResult:
         """Yield the action buttons. Subclasses must override."""
         raise NotImplementedError
 
     def on_mount(self) -> None:
-        ta = self.query_one(TextArea)
         if self._initial_text:
-            ta.text = self._initial_text
-        ta.focus()
+            self.text_area.text = self._initial_text
+        self.text_area.focus()
 
     def on_key(self, event: events.Key) -> None:
         focused = self.focused
-        buttons = list(self.query(".text-input-buttons Button"))
+        buttons = self._buttons
 
         if event.key == "ctrl+enter":
             event.prevent_default()
@@ -429,7 +341,7 @@ class TextInputScreen(ModalScreen):
 
     def _get_text(self) -> str:
         """Get the stripped text from the TextArea."""
-        return self.query_one(TextArea).text.strip()
+        return self.text_area.text.strip()
 
     def _try_submit(self, button: Button) -> None:
         """Validate text and call on_submit for the given button."""
@@ -512,34 +424,6 @@ class MillReviewScreen(TextInputScreen):
         self.dismiss((action, text))
 
 
-def format_diff_stat(diff_stat: str) -> Text:
-    """Format diff stat output with colors (green +, red -)."""
-    if not diff_stat:
-        return Text("No changes", style="dim")
-
-    text = Text()
-    for line in diff_stat.split("\n"):
-        if "|" in line:
-            # File line: " filename | 10 +++++-----"
-            parts = line.split("|")
-            text.append(parts[0])
-            text.append("|")
-            if len(parts) > 1:
-                stat_part = parts[1]
-                for char in stat_part:
-                    if char == "+":
-                        text.append(char, style="bright_green")
-                    elif char == "-":
-                        text.append(char, style="bright_red")
-                    else:
-                        text.append(char)
-            text.append("\n")
-        else:
-            # Summary line or other
-            text.append(line + "\n")
-    return text
-
-
 class ShipReviewScreen(ModalScreen[str | None]):
     """Modal screen for reviewing changes before shipping."""
 
@@ -1443,6 +1327,21 @@ class HopperApp(App):
             yield BacklogTable(id="backlog-table")
         yield Footer()
 
+    # The tables are composed once and never replaced, so each lookup is cached
+    # for the polling refreshes. Only read these after the app has mounted.
+
+    @cached_property
+    def lode_table(self) -> LodeTable:
+        return self.query_one("#lode-table", LodeTable)
+
+    @cached_property
+    def backlog_table(self) -> BacklogTable:
+        return self.query_one("#backlog-table", BacklogTable)
+
+    @cached_property
+    def shipped_table(self) -> ShippedTable:
+        return self.query_one("#shipped-table", ShippedTable)
+
     def on_mount(self) -> None:
         """Initialize when app is mounted."""
         # Register and apply Claude-inspired theme
@@ -1455,7 +1354,7 @@ class HopperApp(App):
         # Start polling for server updates
         self.set_interval(1.0, self.check_server_updates)
         # Focus the lode table
-        self.query_one("#lode-table", LodeTable).focus()
+        self.lode_table.focus()
         self._rename_tui_window("hopper")
 
     def on_unmount(self) -> None:
@@ -1548,13 +1447,30 @@ class HopperApp(App):
         self.refresh_backlog()
         self.refresh_shipped()
 
+    def _lodes_label(self, total_loc: int = 0) -> str:
+        """Return the lodes section label for the current view and filter."""
+        label_parts = ["lodes"]
+        if self._archive_view:
+            label_parts.append("archived")
+            if total_loc > 0:
+                label_parts.append(f"{total_loc} lines")
+        if self._project_filter:
+            label_parts.append(self._project_filter)
+        return " · ".join(label_parts)
+
+    def _lode_hint_text(self) -> str:
+        """Return the hint shown in the last lode table row for the current view."""
+        if self._archive_view:
+            return "enter to restore · ← back to active lodes"
+        return "c to create new lode"
+
     def refresh_table(self) -> None:
         """Refresh the table using incremental updates to preserve cursor position.
 
         Uses Textual's update_cell() for existing rows instead of clear()+add_row()
         which would reset cursor position on every refresh.
         """
-        table = self.query_one("#lode-table", LodeTable)
+        table = self.lode_table
 
         def archived_sort_key(lode: dict) -> int:
             archived_at = lode.get("archived_at")
@@ -1588,20 +1504,8 @@ class HopperApp(App):
         if self._archive_view:
             for row in rows:
                 diff_data[row.id] = read_diff_totals(row.id)
-            total_loc = sum(additions + deletions for additions, deletions in diff_data.values())
-            lodes_label = self.query_one("#lodes_label", Static)
-            label_parts = ["lodes", "archived"]
-            if total_loc > 0:
-                label_parts.append(f"{total_loc} lines")
-            if self._project_filter:
-                label_parts.append(self._project_filter)
-            lodes_label.update(" · ".join(label_parts))
-        else:
-            lodes_label = self.query_one("#lodes_label", Static)
-            label_parts = ["lodes"]
-            if self._project_filter:
-                label_parts.append(self._project_filter)
-            lodes_label.update(" · ".join(label_parts))
+        total_loc = sum(additions + deletions for additions, deletions in diff_data.values())
+        self.query_one("#lodes_label", Static).update(self._lodes_label(total_loc))
 
         # Get current row keys in table (excluding hint row)
         existing_keys: set[str] = set()
@@ -1659,12 +1563,7 @@ class HopperApp(App):
                     key=row.id,
                 )
 
-        hint_text = (
-            "enter to restore · ← back to active lodes"
-            if self._archive_view
-            else "c to create new lode"
-        )
-        hint = Text(hint_text, style="bright_black italic")
+        hint = Text(self._lode_hint_text(), style="bright_black italic")
 
         # Keep hint row text in sync with active/archive mode.
         if has_hint:
@@ -1674,7 +1573,7 @@ class HopperApp(App):
 
     def refresh_backlog(self) -> None:
         """Refresh the backlog table using incremental updates."""
-        table = self.query_one("#backlog-table", BacklogTable)
+        table = self.backlog_table
 
         items = self._backlog
         if self._project_filter:
@@ -1720,7 +1619,7 @@ class HopperApp(App):
 
     def refresh_shipped(self) -> None:
         """Refresh the shipped table with recently shipped lodes."""
-        table = self.query_one("#shipped-table", ShippedTable)
+        table = self.shipped_table
         cutoff = current_time_ms() - SHIPPED_24H_MS
 
         shipped = sorted(
@@ -1760,7 +1659,6 @@ class HopperApp(App):
         for key in existing_keys - desired_keys:
             table.remove_row(key)
 
-        row_data: dict[str, tuple[str, str, str, Text, str]] = {}
         for lode in shipped:
             lode_id = lode["id"]
             project = lode.get("project", "")
@@ -1769,29 +1667,24 @@ class HopperApp(App):
             diff = f"+{additions} -{deletions}" if additions or deletions else ""
             formatted_diff = format_diff_summary(diff)
             title = lode.get("title", "")
-            row_data[lode_id] = (project, age, lode_id, formatted_diff, title)
-            if lode_id in existing_keys:
+            values = [project, age, lode_id, formatted_diff, title]
+            if lode_id not in existing_keys:
+                table.add_row(*values, key=lode_id)
+            elif table.get_row(lode_id) != values:
                 table.update_cell(lode_id, ShippedTable.COL_PROJECT, project)
                 table.update_cell(lode_id, ShippedTable.COL_AGE, age)
                 table.update_cell(lode_id, ShippedTable.COL_ID, lode_id)
                 table.update_cell(lode_id, ShippedTable.COL_DIFF, formatted_diff)
                 table.update_cell(lode_id, ShippedTable.COL_TITLE, title)
-            else:
-                table.add_row(project, age, lode_id, formatted_diff, title, key=lode_id)
 
-        desired_order = [lode["id"] for lode in shipped]
-        current_order = [str(row_key.value) for row_key in table.rows]
-        if current_order != desired_order:
+        # New rows land at the bottom; reorder in place rather than re-adding rows.
+        position = {lode["id"]: i for i, lode in enumerate(shipped)}
+        current_order = [str(row.key.value) for row in table.ordered_rows]
+        if current_order != sorted(current_order, key=position.__getitem__):
             selected_key = self._get_selected_row_key(table)
-            for key in current_order:
-                table.remove_row(key)
-            for lode_id in desired_order:
-                table.add_row(*row_data[lode_id], key=lode_id)
-            if selected_key and selected_key in desired_keys:
-                for i, lode_id in enumerate(desired_order):
-                    if lode_id == selected_key:
-                        table.move_cursor(row=i)
-                        break
+            table.sort(ShippedTable.COL_ID, key=position.__getitem__)
+            if selected_key in position:
+                table.move_cursor(row=position[selected_key])
 
     def _get_selected_row_key(self, table: DataTable) -> str | None:
         """Get the row key of the selected row in a table."""
@@ -1802,14 +1695,14 @@ class HopperApp(App):
 
     def _get_selected_lode_id(self) -> str | None:
         """Get the lode ID of the selected row (skips hint rows)."""
-        key = self._get_selected_row_key(self.query_one("#lode-table", LodeTable))
+        key = self._get_selected_row_key(self.lode_table)
         if key and key.startswith("_hint"):
             return None
         return key
 
     def _get_selected_backlog_id(self) -> str | None:
         """Get the backlog item ID of the selected row (skips hint rows)."""
-        key = self._get_selected_row_key(self.query_one("#backlog-table", BacklogTable))
+        key = self._get_selected_row_key(self.backlog_table)
         if key and key.startswith("_hint"):
             return None
         return key
@@ -2140,7 +2033,7 @@ class HopperApp(App):
     def action_view_files(self) -> None:
         """Open the file viewer for the selected lode."""
         if isinstance(self.focused, ShippedTable):
-            key = self._get_selected_row_key(self.query_one("#shipped-table", ShippedTable))
+            key = self._get_selected_row_key(self.shipped_table)
             if key:
                 lode_dir = get_lode_dir(key)
                 self.push_screen(FileViewerScreen(lode_dir, key))
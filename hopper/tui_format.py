@@ -0,0 +1,165 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2026 sol pbc
+
+"""Row model and Rich text formatting for the TUI tables.
+
+Kept free of Textual so the formatting can be used and tested without an app.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import cache, lru_cache
+
+from rich.text import Span, Text
+
+from hopper.lodes import (
+    STATUS_DISCONNECTED,
+    STATUS_ERROR,
+    STATUS_GATED,
+    STATUS_NEW,
+    STATUS_RUNNING,
+    STATUS_SHIPPED,
+    STATUS_STUCK,
+    compute_runtime_ms,
+    format_age,
+    format_duration_ms,
+    lode_icon,
+)
+from hopper.projects import Project
+
+# Status -> color mapping (shared by icon and text formatting)
+STATUS_COLORS = {
+    STATUS_RUNNING: "bright_green",
+    STATUS_STUCK: "bright_yellow",
+    STATUS_ERROR: "bright_red",
+    STATUS_GATED: "bright_cyan",
+    STATUS_NEW: "bright_black",
+    STATUS_SHIPPED: "bright_green",
+    STATUS_DISCONNECTED: "bright_red",
+}
+
+# Stage -> color mapping for the stage column
+STAGE_COLORS = {
+    "mill": "bright_blue",
+    "refine": "bright_yellow",
+    "ship": "bright_green",
+    "shipped": "bright_green",
+}
+
+_ANSI_SGR_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+@dataclass(slots=True)
+class Row:
+    """A row in a table."""
+
+    id: str
+    stage: str  # "mill", "refine", "ship", or "shipped"
+    age: str  # formatted age string
+    run: str  # formatted cumulative runtime
+    # STATUS_RUNNING, STATUS_STUCK, STATUS_NEW, STATUS_ERROR, STATUS_GATED,
+    # STATUS_SHIPPED, STATUS_DISCONNECTED
+    status: str
+    project: str = ""  # Project name
+    title: str = ""  # Short human-readable lode title
+    status_text: str = ""  # Human-readable status text
+
+
+def lode_to_row(lode: dict) -> Row:
+    """Convert a lode dict to a display row."""
+    status = lode_icon(lode)
+    stage = lode.get("stage", "mill")
+    status_text = lode.get("status", "")
+    progress_text = lode.get("last_progress_summary", "")
+    spawn_status = status_text.startswith(("spawn refused: ", "spawn failed: "))
+    if lode.get("active") and progress_text and not spawn_status:
+        status_text = progress_text
+
+    return Row(
+        id=lode["id"],
+        stage=stage,
+        age=format_age(lode["created_at"]),
+        run=format_duration_ms(compute_runtime_ms(lode)),
+        status=status,
+        project=lode.get("project", ""),
+        title=lode.get("title", ""),
+        status_text=status_text,
+    )
+
+
+@cache
+def format_status_text(status: str) -> Text:
+    """Format a status icon with color using Rich Text.
+
+    Cached per status, so callers share the returned Text and must not modify it.
+    """
+    return Text(status, style=STATUS_COLORS.get(status, ""))
+
+
+@lru_cache(maxsize=1024)
+def strip_ansi(text: str) -> str:
+    """Remove ANSI escape codes from text."""
+    return _ANSI_SGR_RE.sub("", text)
+
+
+def format_status_label(label: str, status: str) -> Text:
+    """Format status text with color matching the status icon."""
+    cleaned = strip_ansi(label.replace("\n", " ")) if label else ""
+    return Text(cleaned, style=STATUS_COLORS.get(status, ""))
+
+
+@cache
+def format_stage_text(stage: str) -> Text:
+    """Format a stage indicator with color using Rich Text.
+
+    Cached per stage, so callers share the returned Text and must not modify it.
+    """
+    return Text(stage, style=STAGE_COLORS.get(stage, ""))
+
+
+@lru_cache(maxsize=256)
+def format_diff_summary(diff: str) -> Text:
+    """Format a diff summary like '+30 -8' with green additions and red deletions.
+
+    Cached per summary, so callers share the returned Text and must not modify it.
+    """
+    if not diff:
+        return Text("")
+    additions, _, _ = diff.partition(" ")
+    split = len(additions)
+    return Text(
+        diff, spans=[Span(0, split, "bright_green"), Span(split + 1, len(diff), "bright_red")]
+    )
+
+
+def format_diff_stat(diff_stat: str) -> Text:
+    """Format diff stat output with colors (green +, red -)."""
+    if not diff_stat:
+        return Text("No changes", style="dim")
+
+    text = Text()
+    for line in diff_stat.split("\n"):
+        if "|" in line:
+            # File line: " filename | 10 +++++-----"
+            parts = line.split("|")
+            text.append(parts[0])
+            text.append("|")
+            if len(parts) > 1:
+                stat_part = parts[1]
+                for char in stat_part:
+                    if char == "+":
+                        text.append(char, style="bright_green")
+                    elif char == "-":
+                        text.append(char, style="bright_red")
+                    else:
+                        text.append(char)
+            text.append("\n")
+        else:
+            # Summary line or other
+            text.append(line + "\n")
+    return text
+
+
+def format_project_label(project: Project) -> str:
+    """Label a project for the picker, marking disabled ones."""
+    return f"{project.name} (disabled)" if project.disabled else project.name
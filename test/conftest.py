@@ -4,10 +4,49 @@
 """Shared pytest fixtures for all tests."""
 
 import pytest
+from textual import constants
+from textual.app import App
+from textual.css.stylesheet import Stylesheet
 
+import hopper.tui  # noqa: F401 - pay the Textual import chain during collection
 from hopper import config
 
 
+@pytest.fixture(scope="session", autouse=True)
+def shared_css_parse_cache():
+    """Parse each Textual CSS source once per session instead of once per app.
+
+    Textual caches parsed rules on each Stylesheet, so every app a test starts
+    re-parses the same DEFAULT_CSS. Share one cache across stylesheets, keyed
+    on the stylesheet variables too so apps with different themes never see
+    each other's rules.
+    """
+    cache = {}
+    parse_rules = Stylesheet._parse_rules
+
+    def cached_parse_rules(self, css, read_from, is_default_rules=False, tie_breaker=0, scope=""):
+        key = (css, read_from, is_default_rules, tie_breaker, scope, tuple(self._variables.items()))
+        if key not in cache:
+            cache[key] = parse_rules(self, css, read_from, is_default_rules, tie_breaker, scope)
+        return cache[key]
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Stylesheet, "_parse_rules", cached_parse_rules)
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def quiet_textual():
+    """Start test apps without animations or the command palette.
+
+    No test exercises either, and both add timers and widgets to every app.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(constants, "TEXTUAL_ANIMATIONS", "none")
+        mp.setattr(App, "ENABLE_COMMAND_PALETTE", False)
+        yield
+
+
 @pytest.fixture(autouse=True)
 def isolate_config(tmp_path, monkeypatch):
     """Isolate all tests from the real config directory.
@@ -12,6 +12,7 @@ import subprocess
 import sys
 import threading
 import time
+from io import StringIO
 from pathlib import Path
 from unittest.mock import ANY, MagicMock, patch
 
@@ -20,9 +21,15 @@ import pytest
 import hopper.cli as hopper_cli
 import hopper.code as hopper_code
 from hopper import __version__, config
+from hopper.backlog import BacklogItem
 from hopper.cli import (
     HELP_SKILL_REMINDER,
     _CheckProgress,
+    _find_remote_lode,
+    _lookup_lode_with_remote,
+    _remote_lode_status,
+    _RemoteProbeSummary,
+    _resolve_lode_all_sources,
     _socket,
     cmd_backlog,
     cmd_check,
@@ -36,6 +43,7 @@ from hopper.cli import (
     cmd_ping,
     cmd_process,
     cmd_processed,
+    cmd_project,
     cmd_projects,
     cmd_remote,
     cmd_restart,
@@ -54,6 +62,8 @@ from hopper.cli import (
     require_config_name,
     require_no_server,
     require_not_coding_agent,
+    require_not_inside_lode,
+    require_projects,
     require_server,
     validate_hopper_lid,
 )
@@ -66,6 +76,7 @@ from hopper.lodes import (
     save_lodes,
 )
 from hopper.projects import Project, load_projects, save_projects
+from hopper.remote import run_remote_streaming
 from hopper.server import Server
 from hopper.tmux import Liveness
 
@@ -510,7 +521,6 @@ def test_require_not_coding_agent_failure(capsys):
 def test_require_not_inside_lode_blocks(monkeypatch):
     """require_not_inside_lode() returns 1 when HOPPER_LID is set."""
     monkeypatch.setenv("HOPPER_LID", "test-lode-123")
-    from hopper.cli import require_not_inside_lode
 
     assert require_not_inside_lode() == 1
 
@@ -518,7 +528,6 @@ def test_require_not_inside_lode_blocks(monkeypatch):
 def test_require_not_inside_lode_allows(monkeypatch):
     """require_not_inside_lode() returns None when HOPPER_LID is not set."""
     monkeypatch.delenv("HOPPER_LID", raising=False)
-    from hopper.cli import require_not_inside_lode
 
     assert require_not_inside_lode() is None
 
@@ -742,8 +751,6 @@ def test_status_empty_text_error(capsys):
 
 def test_backlog_add_reads_description_from_stdin(capsys):
     """backlog add accepts description from stdin when text args are omitted."""
-    from io import StringIO
-
     with patch("hopper.client.probe_server", return_value="down"):
         with patch("hopper.backlog.load_backlog", return_value=[]):
             with patch("hopper.backlog.add_backlog_item", return_value=MagicMock()) as mock_add:
@@ -760,8 +767,6 @@ def test_backlog_add_reads_description_from_stdin(capsys):
 
 def test_backlog_add_requires_description_or_stdin(capsys):
     """backlog add returns 1 when both args and stdin description are empty."""
-    from io import StringIO
-
     with patch("sys.stdin", StringIO(" \n")):
         assert cmd_backlog(["add", "-p", "myproj"]) == 1
 
@@ -1137,8 +1142,6 @@ def test_lode_list_archived_project_filter(capsys):
 
 def test_lode_create_happy(capsys):
     """Create reads scope from stdin, sends correct message, prints confirmation."""
-    from io import StringIO
-
     created_lode = {"id": "abc12345", "project": "myproj", "stage": "mill"}
     project = Project(path="/fake/repo", name="myproj")
     with patch("hopper.cli.require_server", return_value=None):
@@ -1155,8 +1158,6 @@ def test_lode_create_happy(capsys):
 
 
 def test_lode_create_dirty_repo_rejected(capsys):
-    from io import StringIO
-
     project = Project(path="/fake/repo", name="myproj")
     with patch("hopper.cli.require_not_inside_lode", return_value=None):
         with patch("hopper.projects.find_project", return_value=project):
@@ -1171,8 +1172,6 @@ def test_lode_create_dirty_repo_rejected(capsys):
 
 def test_lode_create_rejects_disabled_project_before_dirty_check(capsys):
     """Disabled projects are rejected before dirty checks or create RPC."""
-    from io import StringIO
-
     project = Project(path="/fake", name="P", disabled=True, disabled_reason="wip")
     with (
         patch("hopper.projects.find_project", return_value=project),
@@ -1191,8 +1190,6 @@ def test_lode_create_rejects_disabled_project_before_dirty_check(capsys):
 
 
 def test_lode_create_dirty_hint_before_files(capsys):
-    from io import StringIO
-
     project = Project(path="/fake/repo", name="myproj")
     with patch("hopper.cli.require_not_inside_lode", return_value=None):
         with patch("hopper.projects.find_project", return_value=project):
@@ -1207,8 +1204,6 @@ def test_lode_create_dirty_hint_before_files(capsys):
 
 
 def test_lode_create_dirty_repo_force_override(capsys):
-    from io import StringIO
-
     created_lode = {"id": "abc12345", "project": "myproj", "stage": "mill"}
     project = Project(path="/fake/repo", name="myproj")
     with patch("hopper.cli.require_not_inside_lode", return_value=None):
@@ -1225,8 +1220,6 @@ def test_lode_create_dirty_repo_force_override(capsys):
 
 
 def test_lode_create_rejects_inside_lode(monkeypatch, capsys):
-    from io import StringIO
-
     monkeypatch.setenv("HOPPER_LID", "test-lode-123")
 
     with patch("sys.stdin", StringIO(LONG_SCOPE)):
@@ -1248,8 +1241,6 @@ def test_lode_create_missing_project(capsys):
 
 def test_lode_create_reads_scope_from_stdin(capsys):
     """Create accepts scope from stdin when positional scope is omitted."""
-    from io import StringIO
-
     created_lode = {"id": "abc12345", "project": "myproj", "stage": "mill"}
     project = Project(path="/fake/repo", name="myproj")
     with patch("hopper.cli.require_server", return_value=None):
@@ -1267,8 +1258,6 @@ def test_lode_create_reads_scope_from_stdin(capsys):
 
 def test_lode_create_missing_scope(capsys):
     """Create with empty stdin returns a helpful error."""
-    from io import StringIO
-
     with patch("sys.stdin", StringIO("")):
         assert cmd_lode(["create", "myproj"]) == 1
     out = capsys.readouterr().out
@@ -1277,9 +1266,6 @@ def test_lode_create_missing_scope(capsys):
 
 def test_lode_create_invalid_project(capsys):
     """Create with unknown project prints error with project list."""
-    from io import StringIO
-    from unittest.mock import MagicMock
-
     fake_proj = MagicMock()
     fake_proj.name = "proj-a"
 
@@ -1294,8 +1280,6 @@ def test_lode_create_invalid_project(capsys):
 
 def test_lode_create_scope_too_short(capsys):
     """Create with scope shorter than 42 chars from stdin shows error."""
-    from io import StringIO
-
     with patch("sys.stdin", StringIO("short scope")):
         assert cmd_lode(["create", "myproj"]) == 1
     out = capsys.readouterr().out
@@ -1306,8 +1290,6 @@ def test_lode_create_scope_too_short(capsys):
 
 def test_lode_create_scope_too_short_stdin(capsys):
     """Scope from stdin under 42 chars shows error."""
-    from io import StringIO
-
     with patch("sys.stdin", StringIO("short scope")):
         assert cmd_lode(["create", "myproj"]) == 1
     out = capsys.readouterr().out
@@ -1316,8 +1298,6 @@ def test_lode_create_scope_too_short_stdin(capsys):
 
 def test_lode_create_requires_stdin(capsys):
     """Create on a TTY (no stdin pipe) shows a helpful error."""
-    from io import StringIO
-
     tty_stdin = StringIO("")
     tty_stdin.isatty = lambda: True
     with patch("sys.stdin", tty_stdin):
@@ -1328,8 +1308,6 @@ def test_lode_create_requires_stdin(capsys):
 
 def test_implement_delegates_to_lode_create(capsys):
     """hop implement delegates to hop lode create."""
-    from io import StringIO
-
     created_lode = {"id": "abc12345", "project": "myproj", "stage": "mill"}
     project = Project(path="/fake/repo", name="myproj")
     with patch("hopper.cli.require_server", return_value=None):
@@ -1347,8 +1325,6 @@ def test_implement_delegates_to_lode_create(capsys):
 
 def test_implement_rejects_inside_lode(monkeypatch, capsys):
     """hop implement rejects when inside a lode."""
-    from io import StringIO
-
     monkeypatch.setenv("HOPPER_LID", "test-lode-123")
 
     with patch("sys.stdin", StringIO(LONG_SCOPE)):
@@ -1361,8 +1337,6 @@ def test_implement_rejects_inside_lode(monkeypatch, capsys):
 
 def test_implement_reads_stdin(capsys):
     """hop implement reads scope from stdin when omitted."""
-    from io import StringIO
-
     created_lode = {"id": "abc12345", "project": "myproj", "stage": "mill"}
     project = Project(path="/fake/repo", name="myproj")
     with patch("hopper.cli.require_server", return_value=None):
@@ -1388,8 +1362,6 @@ def test_implement_no_args_shows_help(capsys):
 
 def test_implement_scope_too_short(capsys):
     """hop implement with short scope from stdin shows error."""
-    from io import StringIO
-
     with patch("sys.stdin", StringIO("short")):
         assert cmd_implement(["myproj"]) == 1
     out = capsys.readouterr().out
@@ -1407,8 +1379,6 @@ def test_implement_help_shows_epilog(capsys):
 
 def test_implement_requires_stdin(capsys):
     """hop implement on a TTY (no stdin pipe) shows a helpful error."""
-    from io import StringIO
-
     tty_stdin = StringIO("")
     tty_stdin.isatty = lambda: True
     with patch("sys.stdin", tty_stdin):
@@ -2893,8 +2863,6 @@ def test_config_list_values(temp_config, capsys):
 
 def test_config_list_hides_complex_values(temp_config, capsys):
     """config listing filters out complex values like lists and dicts."""
-    import json
-
     config_file = temp_config / "config.json"
     config_file.write_text(json.dumps({"name": "jer", "projects": [{"path": "/tmp", "name": "x"}]}))
 
@@ -2907,8 +2875,6 @@ def test_config_list_hides_complex_values(temp_config, capsys):
 
 def test_config_json(temp_config, capsys):
     """config json dumps full config including complex values."""
-    import json
-
     config_file = temp_config / "config.json"
     data = {"name": "jer", "projects": [{"path": "/tmp", "name": "x"}]}
     config_file.write_text(json.dumps(data))
@@ -2930,8 +2896,6 @@ def test_config_path(temp_config, capsys):
 
 def test_config_delete(temp_config, capsys):
     """config delete removes a key."""
-    import json
-
     config_file = temp_config / "config.json"
     config_file.write_text('{"name": "jer", "org": "acme"}')
 
@@ -2962,8 +2926,6 @@ def test_config_delete_missing_key_arg(capsys):
 
 def test_config_delete_complex_blocked(temp_config, capsys):
     """config delete refuses to delete complex values."""
-    import json
-
     config_file = temp_config / "config.json"
     config_file.write_text(json.dumps({"projects": [{"path": "/tmp", "name": "x"}]}))
 
@@ -3010,8 +2972,6 @@ def test_config_set_value(temp_config, capsys):
     assert "name=jer" in captured.out
 
     # Verify file was written
-    import json
-
     saved = json.loads(config_file.read_text())
     assert saved == {"name": "jer"}
 
@@ -3024,8 +2984,6 @@ def test_config_set_updates_existing(temp_config, capsys):
     result = cmd_config(["set", "name", "new"])
     assert result == 0
 
-    import json
-
     saved = json.loads(config_file.read_text())
     assert saved == {"name": "new", "other": "keep"}
 
@@ -3043,9 +3001,6 @@ def test_config_set_missing_args(capsys):
 
 def test_require_projects_success(tmp_path, monkeypatch):
     """require_projects returns None when projects exist."""
-    from hopper.cli import require_projects
-    from hopper.projects import Project
-
     monkeypatch.setattr(
         "hopper.projects.get_active_projects",
         lambda: [Project(path="/path", name="proj")],
@@ -3056,8 +3011,6 @@ def test_require_projects_success(tmp_path, monkeypatch):
 
 def test_require_projects_failure(tmp_path, monkeypatch, capsys):
     """require_projects returns 1 when no projects."""
-    from hopper.cli import require_projects
-
     monkeypatch.setattr("hopper.projects.get_active_projects", lambda: [])
     result = require_projects()
     assert result == 1
@@ -3071,8 +3024,6 @@ def test_require_projects_failure(tmp_path, monkeypatch, capsys):
 
 def test_project_help(capsys):
     """project --help shows help and returns 0."""
-    from hopper.cli import cmd_project
-
     result = cmd_project(["--help"])
     assert result == 0
     captured = capsys.readouterr()
@@ -3081,8 +3032,6 @@ def test_project_help(capsys):
 
 def test_project_list_empty(tmp_path, monkeypatch, capsys):
     """project list shows message when no projects."""
-    from hopper.cli import cmd_project
-
     monkeypatch.setattr("hopper.projects.load_projects", lambda: [])
     result = cmd_project(["list"])
     assert result == 0
@@ -3092,9 +3041,6 @@ def test_project_list_empty(tmp_path, monkeypatch, capsys):
 
 def test_project_list_shows_projects(tmp_path, monkeypatch, capsys):
     """project list shows all projects."""
-    from hopper.cli import cmd_project
-    from hopper.projects import Project
-
     projects = [
         Project(path="/path/to/foo", name="foo"),
         Project(path="/path/to/bar", name="bar", disabled=True),
@@ -3113,8 +3059,6 @@ def test_project_list_shows_projects(tmp_path, monkeypatch, capsys):
 
 def test_project_add_missing_path(capsys):
     """project add without path shows error."""
-    from hopper.cli import cmd_project
-
     result = cmd_project(["add"])
     assert result == 1
     captured = capsys.readouterr()
@@ -3123,8 +3067,6 @@ def test_project_add_missing_path(capsys):
 
 def test_project_remove_missing_name(capsys):
     """project remove without name shows error."""
-    from hopper.cli import cmd_project
-
     result = cmd_project(["remove"])
     assert result == 1
     captured = capsys.readouterr()
@@ -3133,8 +3075,6 @@ def test_project_remove_missing_name(capsys):
 
 def test_project_remove_not_found(tmp_path, monkeypatch, capsys):
     """project remove with unknown name shows error."""
-    from hopper.cli import cmd_project
-
     monkeypatch.setattr("hopper.projects.remove_project", lambda name: False)
     result = cmd_project(["remove", "unknown"])
     assert result == 1
@@ -3144,8 +3084,6 @@ def test_project_remove_not_found(tmp_path, monkeypatch, capsys):
 
 def test_project_disable_with_reason(capsys):
     """project disable stores reason and prints it."""
-    from hopper.cli import cmd_project
-
     save_projects([Project(path="/path/to/P", name="P")])
 
     result = cmd_project(["disable", "P", "maintenance"])
@@ -3161,8 +3099,6 @@ def test_project_disable_with_reason(capsys):
 
 def test_project_disable_without_reason(capsys):
     """project disable stores empty reason when none is provided."""
-    from hopper.cli import cmd_project
-
     save_projects([Project(path="/path/to/P", name="P")])
 
     result = cmd_project(["disable", "P"])
@@ -3178,8 +3114,6 @@ def test_project_disable_without_reason(capsys):
 
 def test_project_disable_not_found(capsys):
     """project disable returns 1 when project is missing."""
-    from hopper.cli import cmd_project
-
     result = cmd_project(["disable", "NOPE", "reason"])
 
     assert result == 1
@@ -3189,8 +3123,6 @@ def test_project_disable_not_found(capsys):
 
 def test_project_enable_clears_reason(capsys):
     """project enable clears disabled state and reason."""
-    from hopper.cli import cmd_project
-
     save_projects(
         [Project(path="/path/to/P", name="P", disabled=True, disabled_reason="maintenance")]
     )
@@ -3207,8 +3139,6 @@ def test_project_enable_clears_reason(capsys):
 
 def test_project_enable_not_found(capsys):
     """project enable returns 1 when project is missing."""
-    from hopper.cli import cmd_project
-
     result = cmd_project(["enable", "NOPE"])
 
     assert result == 1
@@ -3218,8 +3148,6 @@ def test_project_enable_not_found(capsys):
 
 def test_project_disable_unquoted_multiword_reason(capsys):
     """Unquoted reason tokens are joined with a single space."""
-    from hopper.cli import cmd_project
-
     save_projects([Project(path="/path/to/P", name="P")])
 
     result = cmd_project(["disable", "P", "foo", "bar"])
@@ -3232,9 +3160,6 @@ def test_project_disable_unquoted_multiword_reason(capsys):
 
 def test_project_add_notifies_server(tmp_path, monkeypatch, capsys):
     """project add sends reload_projects to server."""
-    from hopper.cli import cmd_project
-    from hopper.projects import Project
-
     mock_project = Project(path="/path/to/repo", name="repo")
     monkeypatch.setattr("hopper.projects.add_project", lambda path: mock_project)
     calls = []
@@ -3246,8 +3171,6 @@ def test_project_add_notifies_server(tmp_path, monkeypatch, capsys):
 
 def test_project_remove_notifies_server(tmp_path, monkeypatch, capsys):
     """project remove sends reload_projects to server."""
-    from hopper.cli import cmd_project
-
     monkeypatch.setattr("hopper.projects.remove_project", lambda name: True)
     calls = []
     monkeypatch.setattr("hopper.client.reload_projects", lambda sock: calls.append(sock) or True)
@@ -3258,9 +3181,6 @@ def test_project_remove_notifies_server(tmp_path, monkeypatch, capsys):
 
 def test_project_add_works_without_server(tmp_path, monkeypatch, capsys):
     """project add succeeds even if server notification fails."""
-    from hopper.cli import cmd_project
-    from hopper.projects import Project
-
     mock_project = Project(path="/path/to/repo", name="repo")
     monkeypatch.setattr("hopper.projects.add_project", lambda path: mock_project)
     monkeypatch.setattr(
@@ -3273,8 +3193,6 @@ def test_project_add_works_without_server(tmp_path, monkeypatch, capsys):
 
 def test_project_rename_success(tmp_path, monkeypatch, capsys):
     """project rename updates name and notifies server."""
-    from hopper.cli import cmd_project
-
     monkeypatch.setattr("hopper.projects.rename_project", lambda cur, new: None)
     monkeypatch.setattr("hopper.projects.rename_project_in_data", lambda cur, new: None)
     calls = []
@@ -3289,8 +3207,6 @@ def test_project_rename_success(tmp_path, monkeypatch, capsys):
 
 def test_project_rename_missing_current(capsys):
     """project rename without current name shows error."""
-    from hopper.cli import cmd_project
-
     result = cmd_project(["rename"])
     assert result == 1
     captured = capsys.readouterr()
@@ -3299,8 +3215,6 @@ def test_project_rename_missing_current(capsys):
 
 def test_project_rename_missing_new(capsys):
     """project rename without new name shows error."""
-    from hopper.cli import cmd_project
-
     result = cmd_project(["rename", "old-name"])
     assert result == 1
     captured = capsys.readouterr()
@@ -3309,8 +3223,6 @@ def test_project_rename_missing_new(capsys):
 
 def test_project_rename_error(tmp_path, monkeypatch, capsys):
     """project rename shows error on ValueError."""
-    from hopper.cli import cmd_project
-
     monkeypatch.setattr(
         "hopper.projects.rename_project",
         lambda cur, new: (_ for _ in ()).throw(ValueError("Project not found: old")),
@@ -3323,8 +3235,6 @@ def test_project_rename_error(tmp_path, monkeypatch, capsys):
 
 def test_project_rename_works_without_server(tmp_path, monkeypatch, capsys):
     """project rename succeeds even if server notification fails."""
-    from hopper.cli import cmd_project
-
     monkeypatch.setattr("hopper.projects.rename_project", lambda cur, new: None)
     monkeypatch.setattr("hopper.projects.rename_project_in_data", lambda cur, new: None)
     monkeypatch.setattr(
@@ -3337,8 +3247,6 @@ def test_project_rename_works_without_server(tmp_path, monkeypatch, capsys):
 
 def test_project_add_rejects_extra_arg(capsys):
     """project add with extra arg shows error."""
-    from hopper.cli import cmd_project
-
     result = cmd_project(["add", "/some/path", "extra"])
     assert result == 1
     captured = capsys.readouterr()
@@ -3347,8 +3255,6 @@ def test_project_add_rejects_extra_arg(capsys):
 
 def test_project_rename_rejects_stray_fourth_arg(capsys):
     """project rename rejects a stray fourth arg after trailing reason parser change."""
-    from hopper.cli import cmd_project
-
     result = cmd_project(["rename", "old", "new", "junk"])
 
     assert result == 1
@@ -3458,8 +3364,6 @@ def test_processed_invalid_session(capsys):
 
 def test_processed_empty_stdin(capsys):
     """processed returns 1 on empty stdin."""
-    from io import StringIO
-
     lode_data = {"id": "test-session", "stage": "mill"}
     with patch.dict(os.environ, {"HOPPER_LID": "test-session"}):
         with patch("hopper.client.probe_server", return_value="up"):
@@ -3474,8 +3378,6 @@ def test_processed_empty_stdin(capsys):
 
 def test_processed_saves_file(temp_config, capsys):
     """processed saves output to lode directory and updates state."""
-    from io import StringIO
-
     lode_id = "test-session-1234"
     lode_dir = temp_config / "lodes" / lode_id
     output_text = "# Mill output\n\nDo the thing.\n"
@@ -3521,8 +3423,6 @@ def test_processed_no_stage(capsys):
 
 def test_processed_refine_stage(temp_config, capsys):
     """processed saves refine_out.md for refine stage."""
-    from io import StringIO
-
     lode_id = "test-refine-1234"
     lode_dir = temp_config / "lodes" / lode_id
     output_text = "# Refine summary\n\nFeature implemented.\n"
@@ -3598,8 +3498,6 @@ def test_gate_feedback_with_text_arg_calls_client(capsys):
 
 def test_gate_feedback_reads_stdin_when_no_text_arg(capsys):
     """gate feedback falls back to stdin when text is omitted."""
-    from io import StringIO
-
     response = {"type": "feedback_sent", "lode_id": "gate1234", "tmux_pane": "%9"}
     with patch("hopper.cli.require_server", return_value=None):
         with patch("hopper.client.send_gate_feedback", return_value=response) as mock_send:
@@ -3612,8 +3510,6 @@ def test_gate_feedback_reads_stdin_when_no_text_arg(capsys):
 
 def test_gate_feedback_treats_dash_as_stdin_sentinel(capsys):
     """gate feedback reads stdin when the text arg is a dash sentinel."""
-    from io import StringIO
-
     response = {"type": "feedback_sent", "lode_id": "gate1234", "tmux_pane": "%9"}
     with patch("hopper.cli.require_server", return_value=None):
         with patch("hopper.client.send_gate_feedback", return_value=response) as mock_send:
@@ -3633,8 +3529,6 @@ def test_feedback_alias_dispatches_to_gate_feedback():
 
 def test_feedback_alias_treats_dash_as_stdin_sentinel(capsys):
     """feedback alias reads stdin when the text arg is a dash sentinel."""
-    from io import StringIO
-
     response = {"type": "feedback_sent", "lode_id": "gate1234", "tmux_pane": "%9"}
     with patch("hopper.cli.require_server", return_value=None):
         with patch("hopper.client.send_gate_feedback", return_value=response) as mock_send:
@@ -3769,8 +3663,6 @@ def test_gate_wrong_stage(capsys):
 
 def test_gate_empty_stdin(capsys):
     """gate returns 1 when stdin is empty."""
-    from io import StringIO
-
     lode_data = {"id": "test-session", "stage": "refine"}
     with patch.dict(os.environ, {"HOPPER_LID": "test-session"}):
         with patch("hopper.client.probe_server", return_value="up"):
@@ -3785,8 +3677,6 @@ def test_gate_empty_stdin(capsys):
 
 def test_gate_saves_file_and_sets_state(temp_config, capsys):
     """gate saves gate.md and sets lode state to gated."""
-    from io import StringIO
-
     lode_id = "test-gate-1234"
     review_text = "# Design Review\n\nLooks good.\n"
     lode_data = {"id": lode_id, "stage": "refine"}
@@ -3819,8 +3709,6 @@ def test_gate_saves_file_and_sets_state(temp_config, capsys):
 
 def test_gate_ship_stage_saves_file_and_sets_state(temp_config, capsys):
     """gate saves gate.md and gates a ship-stage lode."""
-    from io import StringIO
-
     lode_id = "test-ship-gate-1234"
     review_text = "# Ship Blocked\n\nPush rejected.\n"
     lode_data = {"id": lode_id, "stage": "ship"}
@@ -3894,8 +3782,6 @@ def test_code_validates_hopper_lid(capsys):
 
 def test_code_requires_stdin(capsys):
     """code returns 1 when no stdin provided."""
-    from io import StringIO
-
     with patch.dict(os.environ, {"HOPPER_LID": "test-1234"}):
         with patch("hopper.cli.require_server", return_value=None):
             with patch("hopper.client.lode_exists", return_value=True):
@@ -3908,8 +3794,6 @@ def test_code_requires_stdin(capsys):
 
 def test_code_dispatches_to_run_code(capsys):
     """code dispatches to run_code on valid input."""
-    from io import StringIO
-
     with patch.dict(os.environ, {"HOPPER_LID": "test-1234"}):
         with patch("hopper.cli.require_server", return_value=None):
             with patch("hopper.client.lode_exists", return_value=True):
@@ -4031,8 +3915,6 @@ def test_submit_help_shows_submit(capsys):
 
 def test_submit_delegates_to_lode_create(capsys):
     """hop submit delegates to hop lode create."""
-    from io import StringIO
-
     created_lode = {"id": "abc12345", "project": "myproj", "stage": "mill"}
     project = Project(path="/fake/repo", name="myproj")
     with patch("hopper.cli.require_server", return_value=None):
@@ -4097,8 +3979,6 @@ def test_list_archived_flag(capsys):
 
 def test_projects_delegates_to_project_list(capsys):
     """hop projects delegates to hop project list."""
-    from hopper.projects import Project
-
     projects = [Project(path="/path/to/foo", name="foo")]
     with patch("hopper.projects.load_projects", return_value=projects):
         assert cmd_projects([]) == 0
@@ -4596,8 +4476,6 @@ def test_lookup_lode_with_remote_outcome_matrix(
     expected_exit_code,
     expected_error,
 ):
-    from hopper.cli import _lookup_lode_with_remote, _RemoteProbeSummary
-
     remote_lode = {"id": "remote123", "host": "fedora.local"}
     remote_value = remote_lode if remote_result[0] == "found" else None
     remote_summary = _RemoteProbeSummary(
@@ -4666,8 +4544,6 @@ def test_outside_status_local_unavailable_prints_honest_error(capsys):
 
 
 def test_remote_lode_probe_classifies_timeout_as_unreadable():
-    from hopper.cli import _remote_lode_status
-
     with patch(
         "hopper.remote.run_remote",
         side_effect=subprocess.TimeoutExpired(["ssh"], timeout=5),
@@ -4680,8 +4556,6 @@ def test_remote_lode_probe_classifies_timeout_as_unreadable():
 
 @pytest.mark.parametrize("stdout", ["{", "[]", "{}"])
 def test_remote_lode_probe_classifies_malformed_output_as_unreadable(stdout):
-    from hopper.cli import _remote_lode_status
-
     result = subprocess.CompletedProcess([], 0, stdout=stdout, stderr="")
     with patch("hopper.remote.run_remote", return_value=result):
         lode, state = _remote_lode_status("fedora.local", "busy-id")
@@ -4701,8 +4575,6 @@ def test_remote_lode_probe_classifies_malformed_output_as_unreadable(stdout):
     ],
 )
 def test_remote_lode_probe_preserves_ambiguity_ids(diagnostic):
-    from hopper.cli import _remote_lode_status
-
     result = subprocess.CompletedProcess([], 1, stdout=diagnostic, stderr="")
     with patch("hopper.remote.run_remote", return_value=result):
         lode, state = _remote_lode_status("fedora.local", "abc")
@@ -4713,8 +4585,6 @@ def test_remote_lode_probe_preserves_ambiguity_ids(diagnostic):
 
 
 def test_remote_lode_probe_rejects_malformed_ambiguity_as_unreadable():
-    from hopper.cli import _remote_lode_status
-
     result = subprocess.CompletedProcess(
         [],
         1,
@@ -4730,8 +4600,6 @@ def test_remote_lode_probe_rejects_malformed_ambiguity_as_unreadable():
 
 
 def test_find_remote_lode_can_skip_cache_publish():
-    from hopper.cli import _find_remote_lode
-
     lode = {
         "id": "remote123",
         "host": "fedora.local",
@@ -4749,8 +4617,6 @@ def test_find_remote_lode_can_skip_cache_publish():
 
 @pytest.mark.parametrize("cached", [True, False], ids=["cache-hit", "fan-out"])
 def test_find_remote_lode_survives_cache_publish_failure(cached, caplog):
-    from hopper.cli import _find_remote_lode
-
     lode = {
         "id": "remote123",
         "host": "fedora.local",
@@ -4769,8 +4635,6 @@ def test_find_remote_lode_survives_cache_publish_failure(cached, caplog):
 
 def test_backlog_ls_alias(capsys):
     """hop backlog ls works like hop backlog list."""
-    from hopper.backlog import BacklogItem
-
     items = [BacklogItem(id="abc123", project="proj", description="Do thing", created_at=1000)]
     with patch("hopper.backlog.load_backlog", return_value=items):
         assert cmd_backlog(["ls"]) == 0
@@ -4781,8 +4645,6 @@ def test_backlog_ls_alias(capsys):
 
 def test_backlog_ls_with_flags(capsys):
     """hop backlog list -p filters by project."""
-    from hopper.backlog import BacklogItem
-
     items = [
         BacklogItem(id="abc123", project="proj", description="Do thing", created_at=1000),
         BacklogItem(
@@ -4801,8 +4663,6 @@ def test_backlog_ls_with_flags(capsys):
 
 def test_backlog_ls_project_not_found(capsys):
     """hop backlog list -p nonexistent prints specific message and exits 0."""
-    from hopper.backlog import BacklogItem
-
     items = [BacklogItem(id="abc123", project="proj", description="Do thing", created_at=1000)]
     with patch("hopper.backlog.load_backlog", return_value=items):
         assert cmd_backlog(["list", "-p", "noexist"]) == 0
@@ -5312,8 +5172,6 @@ def test_remote_list_json(capsys):
 
 
 def test_main_routes_disabled_project_to_remote(monkeypatch, capsys):
-    from io import StringIO
-
     save_projects([Project(path="/fake/repo", name="journal", disabled=True)])
     with patch("hopper.remote.run_remote") as mock_remote:
         mock_remote.return_value = subprocess.CompletedProcess(
@@ -5344,8 +5202,6 @@ def test_main_rejects_locally_expanded_home_for_explicit_remote(monkeypatch, cap
 
 
 def test_lode_create_json(capsys):
-    from io import StringIO
-
     created_lode = {"id": "abc12345", "project": "myproj", "stage": "mill"}
     project = Project(path="/fake/repo", name="myproj")
     with patch("hopper.cli.require_server", return_value=None):
@@ -5558,8 +5414,6 @@ def test_lode_restart_allows_force_when_active_pane_dead(capsys):
 
 
 def test_resolver_remote_probe_does_not_cascade(monkeypatch):
-    from hopper.cli import _resolve_lode_all_sources
-
     monkeypatch.setenv("HOP_NO_ROUTE", "1")
     with (
         patch("hopper.client.read_lode_snapshot", return_value=("absent", None)),
@@ -5577,8 +5431,6 @@ def test_resolver_remote_probe_does_not_cascade(monkeypatch):
 
 
 def test_find_remote_lode_uses_the_same_no_route_guard(monkeypatch):
-    from hopper.cli import _find_remote_lode
-
     monkeypatch.setenv("HOP_NO_ROUTE", "1")
     with (
         patch("hopper.remote.remote_registry") as registry,
@@ -5593,8 +5445,6 @@ def test_find_remote_lode_uses_the_same_no_route_guard(monkeypatch):
 
 
 def test_resolver_ignores_unregistered_cached_host():
-    from hopper.cli import _resolve_lode_all_sources
-
     with (
         patch("hopper.client.read_lode_snapshot", return_value=("absent", None)),
         patch("hopper.remote.remote_registry", return_value={"project": "current.example"}),
@@ -5611,8 +5461,6 @@ def test_resolver_ignores_unregistered_cached_host():
 
 
 def test_find_remote_lode_ignores_unregistered_cached_host():
-    from hopper.cli import _find_remote_lode
-
     with (
         patch("hopper.remote.remote_registry", return_value={"project": "current.example"}),
         patch(
@@ -5719,8 +5567,6 @@ def test_resolver_match_plus_unavailable_is_unavailable_without_mutation(verb, m
 
 
 def test_resolver_exact_full_id_ignores_unrelated_unavailable():
-    from hopper.cli import _resolve_lode_all_sources
-
     def probe(host, prefix):
         if host == "one.example":
             return {"id": prefix, "project": "one", "host": host}, "found"
@@ -5970,8 +5816,6 @@ def test_lode_watch_observer_timeout_starts_after_successful_read(monkeypatch):
 
 
 def test_routed_watch_forwards_stdout_before_remote_exit(monkeypatch, capsys):
-    from hopper.remote import run_remote_streaming
-
     blocked = threading.Event()
     release = threading.Event()
 
@@ -5,6 +5,7 @@
 
 import json
 import os
+import queue
 import socket
 import threading
 import time
@@ -27,6 +28,7 @@ from hopper.client import (
     probe_server,
     read_archived_lodes,
     read_lode_snapshot,
+    reload_projects,
     send_gate_feedback,
     send_message,
     send_pane_input,
@@ -34,6 +36,7 @@ from hopper.client import (
     set_lode_state,
     set_lode_title,
 )
+from hopper.lodes import get_lode_dir
 from hopper.server import Server
 
 TEST_RUN_GENERATION = "a" * 32
@@ -709,8 +712,6 @@ def test_send_pane_input_is_not_a_runner_mutation():
 
 def test_get_gate_returns_lode_and_doc(socket_path, temp_config):
     """get_gate returns the lode plus the current gate.md text."""
-    from hopper.lodes import get_lode_dir
-
     lode = {"id": "test-id", "stage": "refine", "state": "gated"}
     gate_path = get_lode_dir("test-id") / "gate.md"
     gate_path.parent.mkdir(parents=True, exist_ok=True)
@@ -905,16 +906,12 @@ def test_set_lode_title_sends_message(server, socket_path):
 
 def test_reload_projects_success(server, socket_path):
     """reload_projects sends message successfully."""
-    from hopper.client import reload_projects
-
     result = reload_projects(socket_path)
     assert result is True
 
 
 def test_reload_projects_no_server(socket_path):
     """reload_projects returns True when no server (fire-and-forget)."""
-    from hopper.client import reload_projects
-
     result = reload_projects(socket_path, timeout=0.5)
     assert result is True
 
@@ -1124,11 +1121,9 @@ class TestHopperConnection:
 
     def test_emit_returns_false_when_queue_full(self, socket_path, server):
         """Emit returns False when queue is full."""
-        from hopper.client import HopperConnection
-
         # Create connection with tiny queue for testing
         conn = HopperConnection(socket_path)
-        conn.send_queue = __import__("queue").Queue(maxsize=2)
+        conn.send_queue = queue.Queue(maxsize=2)
         conn.start()
 
         # Don't wait for connection - fill queue immediately
@@ -167,8 +167,6 @@ def test_create_lode(temp_config):
     for stage in ("mill", "refine", "ship"):
         assert stage in claude
         # Valid UUID format
-        import uuid
-
         uuid.UUID(claude[stage]["session_id"])
         assert claude[stage]["started"] is False
 
@@ -3,11 +3,14 @@
 
 """Tests for project management."""
 
+import json
 import subprocess
 
 import pytest
 
+from hopper.backlog import BacklogItem, load_backlog, save_backlog
 from hopper.config import load_config, save_config
+from hopper.lodes import load_archived_lodes, load_lodes, save_archived_lodes, save_lodes
 from hopper.projects import (
     Project,
     add_project,
@@ -112,8 +115,6 @@ def test_disabled_reason_roundtrip(mock_config):
 
 def test_load_projects_preserves_other_config(mock_config):
     """save_projects preserves other config keys."""
-    import json
-
     mock_config.write_text('{"name": "jer", "other": "value"}')
 
     projects = [Project(path="/path/to/foo", name="foo")]
@@ -391,14 +392,6 @@ def test_rename_project_duplicate_new_name(mock_config, tmp_path):
 
 def test_rename_project_in_data(mock_config, git_dir):
     """rename_project_in_data updates project name in all data files."""
-    from hopper.backlog import BacklogItem, load_backlog, save_backlog
-    from hopper.lodes import (
-        load_archived_lodes,
-        load_lodes,
-        save_archived_lodes,
-        save_lodes,
-    )
-
     add_project(str(git_dir))
 
     # Create active lodes
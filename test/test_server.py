@@ -691,7 +691,7 @@ def test_lock_refusal_happens_before_any_startup_mutation(
         held.close()
 
 
-@pytest.mark.parametrize("old_pid", [999_999_999, os.getpid()])
+@pytest.mark.parametrize("old_pid", [999_999_999, os.getpid()], ids=["dead-pid", "own-pid"])
 def test_unlocked_stale_pidfile_does_not_block_start(socket_path, old_pid):
     """Pidfile contents are display-only when no process holds the lock."""
     socket_path.with_suffix(".pid").write_text(str(old_pid))
@@ -3,12 +3,16 @@
 
 """Tests for the TUI module."""
 
+import asyncio
+from dataclasses import dataclass, field, replace
 from types import SimpleNamespace
-from unittest.mock import MagicMock, PropertyMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from textual.app import App
+from textual.widgets import Button, OptionList, Static, TextArea
 
+from hopper import lodes, tui
 from hopper.backlog import BacklogItem
 from hopper.lodes import (
     STATUS_DISCONNECTED,
@@ -18,7 +22,9 @@ from hopper.lodes import (
     STATUS_RUNNING,
     STATUS_SHIPPED,
     STATUS_STUCK,
-    format_age,
+    current_time_ms,
+    get_lode_dir,
+    get_worktree_dir,
     parse_diff_numstat,
     parse_diff_numstat_totals,
     read_diff_totals,
@@ -26,509 +32,170 @@ from hopper.lodes import (
 from hopper.projects import Project
 from hopper.tui import (
     SHIPPED_24H_MS,
+    ArchiveConfirmScreen,
+    BacklogEditScreen,
     BacklogInputScreen,
+    BacklogRemoveScreen,
+    BacklogTable,
     FileViewerScreen,
+    GateReviewScreen,
     HopperApp,
     LegendScreen,
+    LodeTable,
+    MillReviewScreen,
     ProjectPickerScreen,
-    Row,
     ScopeInputScreen,
-    ShippedTable,
-    _picker_option_label,
-    format_diff_summary,
-    format_stage_text,
-    format_status_label,
-    format_status_text,
-    lode_to_row,
-    strip_ansi,
+    ShippedReviewScreen,
+    ShipReviewScreen,
 )
+from hopper.tui_format import Row
 
-# Tests for lode_to_row
+# Template backlog item; tests derive variants with dataclasses.replace
+BACKLOG_ITEM = BacklogItem(id="bl111111", project="proj", description="Item", created_at=1000)
 
+# Diff stat shown by the ship review tests
+SHIP_DIFF = " file.py | 5 +++++"
 
-def test_lode_to_row_new():
-    """New session has new status indicator."""
-    session = {
-        "id": "abcd1234",
-        "stage": "mill",
-        "created_at": 1000,
-        "updated_at": 1000,
-        "state": "new",
-        "active": True,
-    }
-    row = lode_to_row(session)
-    assert row.id == "abcd1234"
-    assert row.status == STATUS_NEW
-    assert row.stage == "mill"
-    assert row.age == format_age(1000)
-    assert row.run == "0s"
-
-
-def test_lode_to_row_running():
-    """Running session has running status indicator."""
-    session = {
-        "id": "abcd1234",
-        "stage": "mill",
-        "created_at": 1000,
-        "updated_at": 1000,
-        "state": "running",
-        "active": True,
-    }
-    row = lode_to_row(session)
-    assert row.id == "abcd1234"
-    assert row.status == STATUS_RUNNING
-    assert row.stage == "mill"
-
-
-def test_lode_to_row_uses_progress_summary_when_active():
-    """Active lodes prefer last_progress_summary for the status text."""
-    session = {
-        "id": "abcd1234",
-        "stage": "refine",
-        "created_at": 1000,
-        "updated_at": 1000,
-        "state": "running",
-        "status": "Working",
-        "last_progress_summary": "codex thinking",
-        "active": True,
-    }
-    row = lode_to_row(session)
-    assert row.status_text == "codex thinking"
-
-
-@pytest.mark.parametrize(
-    "status",
-    [
-        "spawn refused: tmux unreachable — verify tmux is running, then retry",
-        "spawn failed: tmux could not create a runner pane — verify tmux is running, then retry",
-    ],
+# Minimal mill lodes shared by navigation and action tests
+MILL_LODES = (
+    {"id": "aaaa1111", "stage": "mill", "created_at": 1000},
+    {"id": "bbbb2222", "stage": "mill", "created_at": 2000},
+    {"id": "cccc3333", "stage": "mill", "created_at": 3000},
 )
-def test_lode_to_row_spawn_status_overrides_stale_progress(status):
-    session = {
-        "id": "abcd1234",
-        "stage": "refine",
-        "created_at": 1000,
-        "state": "running",
-        "status": status,
-        "last_progress_summary": "stale runner progress",
-        "active": True,
-    }
-
-    assert lode_to_row(session).status_text == status
-
-
-def test_lode_to_row_stuck():
-    """Stuck session has stuck status indicator."""
-    session = {
-        "id": "abcd1234",
-        "stage": "mill",
-        "created_at": 1000,
-        "updated_at": 1000,
-        "state": "stuck",
-        "active": True,
-    }
-    row = lode_to_row(session)
-    assert row.id == "abcd1234"
-    assert row.status == STATUS_STUCK
-    assert row.stage == "mill"
 
 
-def test_lode_to_row_error():
-    """Error session has error status indicator."""
-    session = {
-        "id": "abcd1234",
-        "stage": "mill",
-        "created_at": 1000,
-        "updated_at": 1000,
-        "state": "error",
-        "active": True,
-    }
-    row = lode_to_row(session)
-    assert row.id == "abcd1234"
-    assert row.status == STATUS_ERROR
-    assert row.stage == "mill"
+def mill_lodes(count: int) -> list[dict]:
+    """Return fresh copies of the first count MILL_LODES."""
+    return [dict(lode) for lode in MILL_LODES[:count]]
 
 
-def test_lode_to_row_refine_stage():
-    """Refine session has refine stage indicator."""
-    session = {
-        "id": "abcd1234",
-        "stage": "refine",
-        "created_at": 1000,
-        "updated_at": 1000,
-        "state": "new",
-    }
-    row = lode_to_row(session)
-    assert row.stage == "refine"
-
-
-def test_lode_to_row_completed():
-    """Completed session shows running indicator (transient state)."""
-    session = {
-        "id": "abcd1234",
-        "stage": "mill",
-        "created_at": 1000,
-        "updated_at": 1000,
-        "state": "completed",
-        "active": True,
-    }
-    row = lode_to_row(session)
-    assert row.status == STATUS_RUNNING
+# Unmounted tables handed to the focus fixture; actions only type-check them
+LODE_TABLE = LodeTable()
+BACKLOG_TABLE = BacklogTable()
 
 
-def test_lode_to_row_ready():
-    """Ready session shows running indicator (active work)."""
-    session = {
-        "id": "abcd1234",
-        "stage": "refine",
-        "created_at": 1000,
-        "updated_at": 1000,
-        "state": "ready",
-        "active": True,
-    }
-    row = lode_to_row(session)
-    assert row.status == STATUS_RUNNING
+# Tests for HopperApp
 
 
-def test_lode_to_row_task_state():
-    """Task-name state shows running indicator (active work)."""
-    session = {
-        "id": "abcd1234",
-        "stage": "refine",
-        "created_at": 1000,
-        "updated_at": 1000,
-        "state": "audit",
-        "active": True,
-    }
-    row = lode_to_row(session)
-    assert row.status == STATUS_RUNNING
+@dataclass(slots=True)
+class MockServer:
+    """Mock server exposing only the surface HopperApp reads and writes."""
+
+    lodes: list[dict] = field(default_factory=list)
+    archived_lodes: list[dict] = field(default_factory=list)
+    backlog: list = field(default_factory=list)
+    projects: list[Project] = field(default_factory=list)
+    git_hash: str | None = None
+    started_at: int | None = None
+    tmux_location: dict | None = None
+    broadcasts: list[dict] = field(default_factory=list)
+    events: list[dict] = field(default_factory=list)
 
+    def broadcast(self, message: dict) -> bool:
+        self.broadcasts.append(message)
+        return True
 
-def test_lode_to_row_shipped_stage():
-    """Shipped stage always shows shipped icon regardless of state."""
-    session = {
-        "id": "abcd1234",
-        "stage": "shipped",
-        "created_at": 1000,
-        "updated_at": 1000,
-        "state": "ready",
-    }
-    row = lode_to_row(session)
-    assert row.status == STATUS_SHIPPED
-    assert row.stage == "shipped"
+    def enqueue(self, message: dict) -> None:
+        self.events.append(message)
 
 
-def test_lode_to_row_title():
-    """lode_to_row maps title and defaults missing title to empty string."""
-    session_with_title = {
-        "id": "abcd1234",
-        "stage": "mill",
-        "created_at": 1000,
-        "updated_at": 1000,
-        "state": "new",
-        "title": "Auth Flow",
-    }
-    row_with_title = lode_to_row(session_with_title)
-    assert row_with_title.title == "Auth Flow"
+async def wait_for_screen(app, screen_type, timeout: float = 1.0):
+    """Yield to the loop until app.screen is a screen_type; fail after timeout."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not isinstance(app.screen, screen_type):
+        assert loop.time() < deadline, f"{screen_type.__name__} never became active"
+        await asyncio.sleep(0)
+    return app.screen
 
-    session_without_title = {
-        "id": "efgh5678",
-        "stage": "mill",
-        "created_at": 1000,
-        "updated_at": 1000,
-        "state": "new",
-    }
-    row_without_title = lode_to_row(session_without_title)
-    assert row_without_title.title == ""
 
+async def press_focus_trail(pilot, *keys: str) -> list[str | None]:
+    """Press keys one at a time; return the id of the widget focused after each."""
+    trail = []
+    for key in keys:
+        await pilot.press(key)
+        focused = pilot.app.focused
+        trail.append(focused and focused.id)
+    return trail
 
-@pytest.mark.asyncio
-async def test_title_column_width_adjusts_to_content(make_lode):
-    """Title column width should shrink to fit short titles and cap at MAX_TITLE_WIDTH."""
-    from hopper.tui import LodeTable, Row
 
-    short = [make_lode(id="aaa11111", title="Fix")]
-    server = MockServer(short)
+@pytest.fixture(scope="module")
+async def running_app():
+    """A HopperApp with two lodes shared by read-only tests; tests must leave it as found."""
+    sessions = [
+        {"id": "aaaa1111", "stage": "mill", "created_at": 1000},
+        {"id": "bbbb2222", "stage": "refine", "created_at": 2000},
+    ]
+    server = MockServer(sessions)
     app = HopperApp(server=server)
-    async with app.run_test():
-        table = app.query_one("#lode-table", LodeTable)
-        col = table.columns[LodeTable.COL_TITLE]
-        # "Fix" is 3 chars, clamped to MIN_TITLE_WIDTH=5
-        assert col.width == LodeTable.MIN_TITLE_WIDTH
-
-        # Now add a lode with a longer title
-        server.lodes.append(make_lode(id="bbb22222", title="A" * 20))
-        app.refresh_table()
-        assert col.width == 20
-
-        # Direct Row input should also clamp to MAX_TITLE_WIDTH.
-        rows = [
-            Row(
-                id="ccc33333",
-                stage="mill",
-                age="",
-                run="",
-                status=STATUS_NEW,
-                title="B" * 40,
-            )
-        ]
-        table.update_title_width(rows)
-        assert col.width == LodeTable.MAX_TITLE_WIDTH
-
-
-# Tests for format_status_text
-
-
-def test_format_status_text_running():
-    """format_status_text returns bright_green for running."""
-    text = format_status_text(STATUS_RUNNING)
-    assert str(text) == STATUS_RUNNING
-    assert text.style == "bright_green"
-
-
-def test_format_status_text_stuck():
-    """format_status_text returns bright_yellow for stuck."""
-    text = format_status_text(STATUS_STUCK)
-    assert str(text) == STATUS_STUCK
-    assert text.style == "bright_yellow"
-
-
-def test_format_status_text_error():
-    """format_status_text returns bright_red for error."""
-    text = format_status_text(STATUS_ERROR)
-    assert str(text) == STATUS_ERROR
-    assert text.style == "bright_red"
-
-
-def test_format_status_text_new():
-    """format_status_text returns bright_black for new."""
-    text = format_status_text(STATUS_NEW)
-    assert str(text) == STATUS_NEW
-    assert text.style == "bright_black"
-
-
-def test_lode_to_row_disconnected():
-    """Non-shipped inactive lode gets STATUS_DISCONNECTED icon."""
-    lode = {
-        "id": "abc",
-        "stage": "refine",
-        "state": "running",
-        "active": False,
-        "created_at": 1000,
-        "updated_at": 1000,
-    }
-    row = lode_to_row(lode)
-    assert row.status == STATUS_DISCONNECTED
-
-
-def test_lode_to_row_shipped_inactive():
-    """Shipped lode shows STATUS_SHIPPED even when inactive."""
-    lode = {
-        "id": "abc",
-        "stage": "shipped",
-        "state": "running",
-        "active": False,
-        "created_at": 1000,
-        "updated_at": 1000,
-    }
-    row = lode_to_row(lode)
-    assert row.status == STATUS_SHIPPED
-
-
-def test_lode_to_row_gated_shows_gated_icon():
-    """Gated lode shows STATUS_GATED icon even when inactive."""
-    lode = {
-        "id": "abc",
-        "stage": "refine",
-        "state": "gated",
-        "active": False,
-        "created_at": 1000,
-        "updated_at": 1000,
-    }
-    row = lode_to_row(lode)
-    assert row.status == STATUS_GATED
-
-
-def test_lode_to_row_active_shows_state_icon():
-    """Active non-shipped lode shows normal state-based icon."""
-    lode = {
-        "id": "abc",
-        "stage": "refine",
-        "state": "running",
-        "active": True,
-        "created_at": 1000,
-        "updated_at": 1000,
-    }
-    row = lode_to_row(lode)
-    assert row.status == STATUS_RUNNING
-
-
-# Tests for format_stage_text
-
-
-def test_format_stage_text_mill():
-    """format_stage_text returns bright_blue for mill."""
-    text = format_stage_text("mill")
-    assert str(text) == "mill"
-    assert text.style == "bright_blue"
-
-
-def test_format_stage_text_refine():
-    """format_stage_text returns bright_yellow for refine."""
-    text = format_stage_text("refine")
-    assert str(text) == "refine"
-    assert text.style == "bright_yellow"
-
-
-def test_format_stage_text_ship():
-    """format_stage_text returns bright_green for ship."""
-    text = format_stage_text("ship")
-    assert str(text) == "ship"
-    assert text.style == "bright_green"
-
-
-def test_format_stage_text_shipped():
-    """format_stage_text returns bright_green for shipped."""
-    text = format_stage_text("shipped")
-    assert str(text) == "shipped"
-    assert text.style == "bright_green"
-
-
-def test_format_diff_summary():
-    """format_diff_summary colorizes summary counts and handles empty input."""
-    from rich.text import Span, Text
-
-    text = format_diff_summary("+30 -8")
-    assert text.plain == "+30 -8"
-    assert text.spans == [Span(0, 3, "bright_green"), Span(4, 6, "bright_red")]
-
-    assert format_diff_summary("") == Text("")
-    assert format_diff_summary(None) == Text("")  # type: ignore[arg-type]
-
-
-# Tests for format_status_label
-
-
-def test_format_status_label_running():
-    """format_status_label returns bright_green for running status."""
-    text = format_status_label("Claude running", STATUS_RUNNING)
-    assert str(text) == "Claude running"
-    assert text.style == "bright_green"
-
-
-def test_format_status_label_stuck():
-    """format_status_label returns bright_yellow for stuck status."""
-    text = format_status_label("No output for 30s", STATUS_STUCK)
-    assert str(text) == "No output for 30s"
-    assert text.style == "bright_yellow"
-
-
-def test_format_status_label_error():
-    """format_status_label returns bright_red for error status."""
-    text = format_status_label("Process exited", STATUS_ERROR)
-    assert str(text) == "Process exited"
-    assert text.style == "bright_red"
-
-
-def test_format_status_label_new():
-    """format_status_label returns no style for new status."""
-    text = format_status_label("", STATUS_NEW)
-    assert str(text) == ""
-    assert text.style == "bright_black"
-
-
-def test_format_status_label_strips_newlines():
-    """format_status_label replaces newlines with spaces."""
-    text = format_status_label("line1\nline2", STATUS_RUNNING)
-    assert str(text) == "line1 line2"
-
+    async with app.run_test() as pilot:
+        yield app, pilot
+    assert server.events == [], "a shared running_app test enqueued server events"
 
-def test_format_status_label_strips_ansi():
-    """format_status_label removes ANSI escape codes."""
-    ansi_text = "\x1b[31mError: Something failed\x1b[39m"
-    text = format_status_label(ansi_text, STATUS_ERROR)
-    assert str(text) == "Error: Something failed"
 
+@pytest.fixture(scope="session")
+def empty_server():
+    """One empty MockServer for tests that never enqueue, broadcast, or mutate it."""
+    return MockServer()
 
-def test_format_status_label_strips_ansi_and_newlines():
-    """format_status_label handles both ANSI codes and newlines."""
-    ansi_text = "\x1b[31mError: line1\x1b[39m\n\x1b[31mline2\x1b[39m"
-    text = format_status_label(ansi_text, STATUS_ERROR)
-    assert str(text) == "Error: line1 line2"
 
+@pytest.fixture(scope="module")
+async def empty_app(empty_server):
+    """A HopperApp with an empty server shared by read-only tests; leave it as found."""
+    app = HopperApp(server=empty_server)
+    async with app.run_test() as pilot:
+        yield app, pilot
+    assert empty_server.events == [], "a shared empty_app test enqueued server events"
 
-# Tests for strip_ansi
 
+@pytest.fixture(scope="module")
+async def screen_host():
+    """One bare host app shared by the modal screen tests."""
+    host = App()
+    async with host.run_test() as pilot:
+        yield pilot
 
-def test_strip_ansi_removes_color_codes():
-    """strip_ansi removes ANSI color codes."""
-    assert strip_ansi("\x1b[31mred\x1b[0m") == "red"
-    assert strip_ansi("\x1b[1;32mbold green\x1b[0m") == "bold green"
 
+@pytest.fixture
+async def open_screen(screen_host):
+    """Push a screen onto the shared host; return (pilot, dismiss result future)."""
+    pilot = screen_host
+    app = pilot.app
 
-def test_strip_ansi_preserves_plain_text():
-    """strip_ansi leaves plain text unchanged."""
-    assert strip_ansi("plain text") == "plain text"
-    assert strip_ansi("") == ""
+    # Other module-scoped apps share the session loop, so the test task may not
+    # see the host as Textual's active app. Push and pop from the host's own
+    # message loop so the screens always resolve self.app to the host.
+    async def push(screen):
+        result = asyncio.get_running_loop().create_future()
+        app.call_later(app.push_screen, screen, result.set_result)
+        await wait_for_screen(app, type(screen))
+        await pilot.pause(0)
+        return pilot, result
 
+    def pop_to_base() -> None:
+        while len(app.screen_stack) > 1:
+            app.pop_screen()
 
-# Tests for Row dataclass
+    yield push
+    app.call_later(pop_to_base)
+    await pilot.pause()
+    assert len(app.screen_stack) == 1, "open_screen left a screen on the host"
 
 
-def test_row_dataclass():
-    """Row dataclass stores all fields."""
-    row = Row(
-        id="test1234",
-        stage="mill",
-        age="1m",
-        run="5m",
-        status=STATUS_RUNNING,
-        project="proj",
-        title="Auth Flow",
-        status_text="Working on it",
-    )
-    assert row.id == "test1234"
-    assert row.stage == "mill"
-    assert row.age == "1m"
-    assert row.run == "5m"
-    assert row.status == STATUS_RUNNING
-    assert row.project == "proj"
-    assert row.title == "Auth Flow"
-    assert row.status_text == "Working on it"
+@pytest.fixture
+def focus(monkeypatch):
+    """Pin HopperApp.focused for action tests that never run the app."""
 
+    def set_focused(widget: object) -> None:
+        monkeypatch.setattr(HopperApp, "focused", widget)
 
-# Tests for HopperApp
+    return set_focused
 
 
-class MockServer:
-    """Mock server for testing."""
-
-    def __init__(
-        self,
-        sessions: list[dict] | None = None,
-        archived_lodes: list[dict] | None = None,
-        backlog: list | None = None,
-        projects: list[Project] | None = None,
-        git_hash: str | None = None,
-        started_at: int | None = None,
-        tmux_location: dict | None = None,
-    ):
-        self.lodes = sessions if sessions is not None else []
-        self.archived_lodes = archived_lodes if archived_lodes is not None else []
-        self.backlog = backlog if backlog is not None else []
-        self.projects = projects if projects is not None else []
-        self.git_hash = git_hash
-        self.started_at = started_at
-        self.tmux_location = tmux_location
-        self.broadcasts: list[dict] = []
-        self.events: list[dict] = []
-
-    def broadcast(self, message: dict) -> bool:
-        self.broadcasts.append(message)
-        return True
-
-    def enqueue(self, message: dict) -> None:
-        self.events.append(message)
+@pytest.fixture
+def no_project(monkeypatch):
+    """Make find_project resolve nothing so spawns skip project lookup."""
+    monkeypatch.setattr(tui, "find_project", lambda name: None)
 
 
 def test_project_picker_call_sites_use_full_load_projects(monkeypatch):
@@ -552,79 +219,107 @@ def test_project_picker_call_sites_use_full_load_projects(monkeypatch):
     assert all(screen._projects == full_projects for screen in screens)
 
 
-@pytest.mark.asyncio
-async def test_app_starts():
-    """App should start and have basic structure."""
-    app = HopperApp()
+async def test_title_column_width_adjusts_to_content(make_lode):
+    """Title column width should shrink to fit short titles and cap at MAX_TITLE_WIDTH."""
+    short = [make_lode(id="aaa11111", title="Fix")]
+    server = MockServer(short)
+    app = HopperApp(server=server)
     async with app.run_test():
-        # Should have header
-        assert app.title == "HOPPER"
-        # Should have unified session table
-        table = app.query_one("#lode-table")
-        assert table is not None
+        table = app.lode_table
+        col = table.columns[LodeTable.COL_TITLE]
+        # "Fix" is 3 chars, clamped to MIN_TITLE_WIDTH=5
+        assert col.width == LodeTable.MIN_TITLE_WIDTH
 
+        # Now add a lode with a longer title
+        server.lodes.append(make_lode(id="bbb22222", title="A" * 20))
+        app.refresh_table()
+        assert col.width == 20
 
-@pytest.mark.asyncio
-async def test_app_with_empty_lodes():
+        # A refresh with unchanged titles leaves the layout alone.
+        with patch.object(table, "on_resize") as on_resize:
+            app.refresh_table()
+        on_resize.assert_not_called()
+
+        # Direct Row input should also clamp to MAX_TITLE_WIDTH.
+        rows = [
+            Row(
+                id="ccc33333",
+                stage="mill",
+                age="",
+                run="",
+                status=STATUS_NEW,
+                title="B" * 40,
+            )
+        ]
+        table.update_title_width(rows)
+        assert col.width == LodeTable.MAX_TITLE_WIDTH
+
+
+def test_app_starts(running_app):
+    """App should start and have basic structure."""
+    app, _ = running_app
+    # Should have header
+    assert app.title == "HOPPER"
+    # Should have unified session table
+    table = app.lode_table
+    assert table is not None
+
+
+def test_app_with_empty_lodes(empty_app):
     """App should show hint row when no sessions."""
-    server = MockServer([])
-    app = HopperApp(server=server)
-    async with app.run_test():
-        table = app.query_one("#lode-table")
-        # Table always visible, hint row present
-        assert table.display is True
-        assert table.row_count == 1  # hint row only
+    app, _ = empty_app
+    table = app.lode_table
+    # Table always visible, hint row present
+    assert table.display is True
+    assert table.row_count == 1  # hint row only
 
 
-@pytest.mark.asyncio
-async def test_app_shows_git_hash_and_uptime_in_subtitle():
-    """App should show git hash and uptime in sub_title."""
-    from hopper.lodes import current_time_ms
+@pytest.fixture
+def now() -> int:
+    """Current wall-clock time in ms, read once per test."""
+    return current_time_ms()
+
 
-    started_at = current_time_ms() - 2 * 60 * 60_000  # 2 hours ago
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin hopper.lodes.current_time_ms so uptime and age strings are exact."""
+    now = 1_700_000_000_000
+    monkeypatch.setattr(lodes, "current_time_ms", lambda: now)
+    return now
+
+
+async def test_app_shows_git_hash_and_uptime_in_subtitle(frozen_now):
+    """App should show git hash and uptime in sub_title."""
+    started_at = frozen_now - 2 * 60 * 60_000  # 2 hours ago
     server = MockServer([], git_hash="abc1234", started_at=started_at)
     app = HopperApp(server=server)
     async with app.run_test():
         assert app.sub_title == "abc1234 · 2h"
 
 
-@pytest.mark.asyncio
-async def test_app_shows_uptime_only_when_no_git_hash():
+async def test_app_shows_uptime_only_when_no_git_hash(frozen_now):
     """App should show just uptime when no git hash."""
-    from hopper.lodes import current_time_ms
-
-    started_at = current_time_ms() - 15 * 60_000  # 15 minutes ago
+    started_at = frozen_now - 15 * 60_000  # 15 minutes ago
     server = MockServer([], git_hash=None, started_at=started_at)
     app = HopperApp(server=server)
     async with app.run_test():
         assert app.sub_title == "15m"
 
 
-@pytest.mark.asyncio
-async def test_app_handles_no_git_hash_or_uptime():
+def test_app_handles_no_git_hash_or_uptime(empty_app):
     """App should handle missing git hash and uptime gracefully."""
-    server = MockServer([], git_hash=None, started_at=None)
-    app = HopperApp(server=server)
-    async with app.run_test():
-        assert app.sub_title == ""
+    app, _ = empty_app
+    assert app.sub_title == ""
 
 
-@pytest.mark.asyncio
-async def test_app_with_lodes():
+def test_app_with_lodes(running_app):
     """App should display all sessions in unified table."""
-    sessions = [
-        {"id": "aaaa1111", "stage": "mill", "created_at": 1000},
-        {"id": "bbbb2222", "stage": "refine", "created_at": 2000},
-    ]
-    server = MockServer(sessions)
-    app = HopperApp(server=server)
-    async with app.run_test():
-        table = app.query_one("#lode-table")
-        # 2 sessions + 1 hint row
-        assert table.row_count == 3
+    app, _ = running_app
+    table = app.lode_table
+    # 2 sessions + 1 hint row
+    assert table.row_count == 3
 
 
-@pytest.mark.asyncio
 async def test_app_with_shipped_lode():
     """Shipped lodes should be displayed in the lode table."""
     sessions = [
@@ -633,11 +328,10 @@ async def test_app_with_shipped_lode():
     server = MockServer(sessions)
     app = HopperApp(server=server)
     async with app.run_test():
-        table = app.query_one("#lode-table")
+        table = app.lode_table
         assert table.row_count == 2  # 1 lode + 1 hint row
 
 
-@pytest.mark.asyncio
 async def test_archive_view_toggle(make_lode):
     """Left/right should toggle archive view on the lode table."""
     server = MockServer([make_lode(id="active01")], archived_lodes=[make_lode(id="arch0001")])
@@ -648,24 +342,29 @@ async def test_archive_view_toggle(make_lode):
         assert app._archive_view is True
         await pilot.press("right")
         assert app._archive_view is False
-        await pilot.press("right")
-        assert app._archive_view is False
 
 
-@pytest.mark.asyncio
-async def test_archive_view_label_updates():
+def test_set_archive_view_skips_refresh_when_unchanged():
+    """Setting the current archive view again should not rebuild the table."""
+    app = HopperApp()
+    with patch.object(app, "refresh_table") as refresh_table:
+        app.set_archive_view(False)
+    refresh_table.assert_not_called()
+
+
+def test_archive_view_label_updates(empty_app):
     """Archive view toggling should update the lodes section label."""
-    app = HopperApp(server=MockServer([]))
-    async with app.run_test() as pilot:
-        label = app.query_one("#lodes_label")
-        assert label.content == "lodes"
-        await pilot.press("left")
+    app, _ = empty_app
+    label = app.query_one("#lodes_label")
+    assert label.content == "lodes"
+    app.set_archive_view(True)
+    try:
         assert label.content == "lodes · archived"
-        await pilot.press("right")
-        assert label.content == "lodes"
+    finally:
+        app.set_archive_view(False)
+    assert label.content == "lodes"
 
 
-@pytest.mark.asyncio
 async def test_archive_view_label_shows_total_loc(make_lode):
     """Archive view label should include total LOC when available."""
     archived = [
@@ -677,31 +376,40 @@ async def test_archive_view_label_shows_total_loc(make_lode):
     diff_totals = {"arch0001": (10, 2), "arch0002": (3, 5)}
 
     with patch("hopper.tui.read_diff_totals", side_effect=lambda lode_id: diff_totals[lode_id]):
-        async with app.run_test() as pilot:
+        async with app.run_test():
             label = app.query_one("#lodes_label")
-            await pilot.press("left")
+            app.set_archive_view(True)
             assert label.content == "lodes · archived · 20 lines"
 
 
-@pytest.mark.asyncio
-async def test_archive_view_label_hides_zero_loc_suffix(make_lode):
-    """Archive view label should omit LOC suffix when totals are all zero."""
-    archived = [
-        make_lode(id="arch0001", updated_at=1000),
-        make_lode(id="arch0002", updated_at=2000),
-    ]
-    server = MockServer([], archived_lodes=archived)
-    app = HopperApp(server=server)
-    diff_totals = {"arch0001": (0, 0), "arch0002": (0, 0)}
+@pytest.mark.parametrize(
+    ("archive_view", "total_loc", "project_filter", "expected"),
+    [
+        (False, 0, None, "lodes"),
+        (False, 20, None, "lodes"),
+        (False, 0, "alpha", "lodes · alpha"),
+        (True, 0, None, "lodes · archived"),
+        (True, 20, None, "lodes · archived · 20 lines"),
+        (True, 20, "alpha", "lodes · archived · 20 lines · alpha"),
+    ],
+    ids=["active", "active-ignores-loc", "active-filter", "archived", "archived-loc", "all"],
+)
+def test_lodes_label(archive_view, total_loc, project_filter, expected):
+    """The lodes label names the view, any archived line total, and the filter."""
+    app = HopperApp()
+    app._archive_view = archive_view
+    app._project_filter = project_filter
+    assert app._lodes_label(total_loc) == expected
 
-    with patch("hopper.tui.read_diff_totals", side_effect=lambda lode_id: diff_totals[lode_id]):
-        async with app.run_test() as pilot:
-            label = app.query_one("#lodes_label")
-            await pilot.press("left")
-            assert label.content == "lodes · archived"
+
+def test_lode_hint_text():
+    """The lode hint row switches between create and restore hints."""
+    app = HopperApp()
+    assert app._lode_hint_text() == "c to create new lode"
+    app._archive_view = True
+    assert app._lode_hint_text() == "enter to restore · ← back to active lodes"
 
 
-@pytest.mark.asyncio
 async def test_archive_view_shows_archived_lodes(make_lode):
     """Archive view should render archived lodes instead of active lodes."""
     archived = [
@@ -710,9 +418,9 @@ async def test_archive_view_shows_archived_lodes(make_lode):
     ]
     server = MockServer([make_lode(id="active01")], archived_lodes=archived)
     app = HopperApp(server=server)
-    async with app.run_test() as pilot:
-        await pilot.press("left")
-        table = app.query_one("#lode-table")
+    async with app.run_test():
+        app.set_archive_view(True)
+        table = app.lode_table
         row_keys = [str(k.value) for k in table.rows]
         assert "arch0001" in row_keys
         assert "arch0002" in row_keys
@@ -721,43 +429,33 @@ async def test_archive_view_shows_archived_lodes(make_lode):
         assert top_key == "arch0002"
 
 
-@pytest.mark.asyncio
-async def test_archive_view_hint_row():
+def test_archive_view_hint_row(empty_app):
     """Archive view should show a back-to-active hint row."""
-    app = HopperApp(server=MockServer([]))
-    async with app.run_test() as pilot:
-        await pilot.press("left")
-        table = app.query_one("#lode-table")
-        hint_row = table.get_row("_hint_lode")
+    app, _ = empty_app
+    app.set_archive_view(True)
+    try:
+        hint_row = app.lode_table.get_row("_hint_lode")
         assert str(hint_row[-1]) == "enter to restore · ← back to active lodes"
+    finally:
+        app.set_archive_view(False)
 
 
-@pytest.mark.asyncio
 async def test_archive_view_guards_actions(make_lode):
     """Create/delete actions should be guarded while archive view is active."""
     server = MockServer(
         [make_lode(id="active01")],
         archived_lodes=[make_lode(id="arch0001")],
+        projects=[Project(path="/path/to/proj", name="proj")],
     )
     app = HopperApp(server=server)
-    with (
-        patch.object(app, "_require_projects") as mock_require_projects,
-        patch.object(app, "_get_selected_lode_id") as mock_selected_lode_id,
-        patch.object(app, "_get_lode") as mock_get_lode,
-    ):
-        async with app.run_test() as pilot:
-            await pilot.press("left")
-            assert app._archive_view is True
-            await pilot.press("c")
-            await pilot.press("delete")
-    mock_require_projects.assert_not_called()
-    mock_selected_lode_id.assert_not_called()
-    mock_get_lode.assert_not_called()
-    # No events should have been enqueued
+    async with app.run_test() as pilot:
+        app.set_archive_view(True)
+        # Unguarded, c would open the project picker and delete would archive.
+        await pilot.press("c", "delete")
+        assert len(app.screen_stack) == 1
     assert server.events == []
 
 
-@pytest.mark.asyncio
 async def test_archive_view_enter_unarchives_and_spawns(make_lode):
     """Enter should unarchive the selected lode and spawn its runner."""
     server = MockServer(
@@ -781,7 +479,6 @@ async def test_archive_view_enter_unarchives_and_spawns(make_lode):
     assert app._archive_view is False
 
 
-@pytest.mark.asyncio
 async def test_archive_view_v_opens_file_viewer(make_lode):
     """v should still open the file viewer in archive view."""
     server = MockServer(
@@ -801,28 +498,22 @@ async def test_archive_view_v_opens_file_viewer(make_lode):
     assert screen.lode_id == "arch0001"
 
 
-@pytest.mark.asyncio
 async def test_archive_view_backlog_unaffected():
     """Backlog actions should still work while archive view is active."""
-    from hopper.backlog import BacklogItem
-    from hopper.tui import BacklogRemoveScreen, BacklogTable
-
     items = [
-        BacklogItem(id="bl111111", project="proj", description="First", created_at=1000),
-        BacklogItem(id="bl222222", project="proj", description="Second", created_at=2000),
+        replace(BACKLOG_ITEM, description="First"),
+        replace(BACKLOG_ITEM, id="bl222222", description="Second", created_at=2000),
     ]
     server = MockServer([], backlog=items)
     app = HopperApp(server=server)
     async with app.run_test() as pilot:
         await pilot.press("left")
         assert app._archive_view is True
-        await pilot.press("tab")
-        await pilot.press("tab")
+        await pilot.press("tab", "tab")
         assert isinstance(app.focused, BacklogTable)
         await pilot.press("delete")
         assert isinstance(app.screen, BacklogRemoveScreen)
-        await pilot.press("right")
-        await pilot.press("enter")
+        await pilot.press("right", "enter")
         assert server.events == [{"type": "backlog_remove", "item_id": "bl111111"}]
         await pilot.press("right")
         assert app._archive_view is True
@@ -830,18 +521,13 @@ async def test_archive_view_backlog_unaffected():
         assert app._archive_view is True
 
 
-@pytest.mark.asyncio
 async def test_left_right_only_on_lode_table():
     """Left/right should not toggle archive view when backlog table is focused."""
-    from hopper.backlog import BacklogItem
-    from hopper.tui import BacklogTable
-
-    items = [BacklogItem(id="bl111111", project="proj", description="First", created_at=1000)]
+    items = [replace(BACKLOG_ITEM, description="First")]
     app = HopperApp(server=MockServer([], backlog=items))
     async with app.run_test() as pilot:
         assert app._archive_view is False
-        await pilot.press("tab")
-        await pilot.press("tab")
+        await pilot.press("tab", "tab")
         assert isinstance(app.focused, BacklogTable)
         await pilot.press("left")
         assert app._archive_view is False
@@ -849,7 +535,6 @@ async def test_left_right_only_on_lode_table():
         assert app._archive_view is False
 
 
-@pytest.mark.asyncio
 async def test_archive_view_handles_missing_updated_at(make_lode):
     """Archive view should handle archived rows that don't have updated_at."""
     archived_a = make_lode(id="arch0001", updated_at=3000)
@@ -857,9 +542,9 @@ async def test_archive_view_handles_missing_updated_at(make_lode):
     archived_b.pop("updated_at")
 
     app = HopperApp(server=MockServer([], archived_lodes=[archived_b, archived_a]))
-    async with app.run_test() as pilot:
-        await pilot.press("left")
-        table = app.query_one("#lode-table")
+    async with app.run_test():
+        app.set_archive_view(True)
+        table = app.lode_table
         row_keys = [str(k.value) for k in table.rows]
         assert "arch0001" in row_keys
         assert "arch0002" in row_keys
@@ -867,12 +552,8 @@ async def test_archive_view_handles_missing_updated_at(make_lode):
         assert top_key == "arch0001"
 
 
-@pytest.mark.asyncio
-async def test_archive_confirm_modal_arrows_do_not_toggle_archive_view(temp_config, make_lode):
+async def test_archive_confirm_modal_arrows_do_not_toggle_archive_view(make_lode):
     """Left/right in archive modal should not toggle archive view."""
-    from hopper.lodes import get_lode_dir
-    from hopper.tui import ArchiveConfirmScreen
-
     session = make_lode(id="aaaa1111")
     worktree = get_lode_dir(session["id"]) / "worktree"
     worktree.mkdir(parents=True, exist_ok=True)
@@ -892,32 +573,26 @@ async def test_archive_confirm_modal_arrows_do_not_toggle_archive_view(temp_conf
             assert app._archive_view is False
 
 
-@pytest.mark.asyncio
-async def test_archive_with_delete(temp_config):
+@pytest.mark.parametrize("key", ["delete", "backspace"])
+async def test_archive_with_delete(key):
     """Delete key enqueues archive for selected lode when lode table is focused."""
-    sessions = [
-        {"id": "aaaa1111", "stage": "mill", "created_at": 1000},
-        {"id": "bbbb2222", "stage": "mill", "created_at": 2000},
-    ]
+    sessions = mill_lodes(2)
     server = MockServer(sessions)
     app = HopperApp(server=server)
     async with app.run_test() as pilot:
-        await pilot.press("delete")
+        await pilot.press(key)
         assert len(server.events) == 1
         assert server.events[0]["type"] == "lode_archive"
         assert server.events[0]["lode_id"] == "aaaa1111"
 
 
-@pytest.mark.asyncio
-async def test_q_does_not_quit():
+async def test_q_does_not_quit(running_app):
     """q should not quit the app (it's now used for queue)."""
-    app = HopperApp()
-    async with app.run_test() as pilot:
-        await pilot.press("q")
-        assert not app._exit
+    app, pilot = running_app
+    await pilot.press("q")
+    assert not app._exit
 
 
-@pytest.mark.asyncio
 async def test_ctrl_c_quits():
     """Ctrl-C should quit the app."""
     app = HopperApp()
@@ -926,7 +601,6 @@ async def test_ctrl_c_quits():
         assert app._exit
 
 
-@pytest.mark.asyncio
 async def test_double_ctrl_d_quits():
     """Double Ctrl-D should quit the app."""
     app = HopperApp()
@@ -937,7 +611,6 @@ async def test_double_ctrl_d_quits():
         assert app._exit
 
 
-@pytest.mark.asyncio
 async def test_single_ctrl_d_does_not_quit():
     """Single Ctrl-D should not quit the app."""
     app = HopperApp()
@@ -946,76 +619,39 @@ async def test_single_ctrl_d_does_not_quit():
         assert not app._exit
 
 
-@pytest.mark.asyncio
-async def test_cursor_down_navigation():
-    """down should move cursor down."""
-    sessions = [
-        {"id": "aaaa1111", "stage": "mill", "created_at": 1000},
-        {"id": "bbbb2222", "stage": "mill", "created_at": 2000},
-    ]
-    server = MockServer(sessions)
-    app = HopperApp(server=server)
-    async with app.run_test() as pilot:
-        table = app.query_one("#lode-table")
-        # Should start at row 0
-        assert table.cursor_row == 0
-        # Press j to move down
-        await pilot.press("down")
-        assert table.cursor_row == 1
-
-
-@pytest.mark.asyncio
-async def test_cursor_up_navigation():
-    """up should move cursor up."""
-    sessions = [
-        {"id": "aaaa1111", "stage": "mill", "created_at": 1000},
-        {"id": "bbbb2222", "stage": "mill", "created_at": 2000},
-    ]
-    server = MockServer(sessions)
-    app = HopperApp(server=server)
-    async with app.run_test() as pilot:
-        table = app.query_one("#lode-table")
-        # Move down first
-        await pilot.press("down")
-        assert table.cursor_row == 1
-        # Press k to move up
-        await pilot.press("up")
-        assert table.cursor_row == 0
-
-
-@pytest.mark.asyncio
-async def test_cursor_preserved_after_refresh():
-    """Cursor position should be preserved when table is refreshed."""
-    sessions = [
-        {"id": "aaaa1111", "stage": "mill", "created_at": 1000},
-        {"id": "bbbb2222", "stage": "mill", "created_at": 2000},
-        {"id": "cccc3333", "stage": "mill", "created_at": 3000},
-    ]
-    server = MockServer(sessions)
-    app = HopperApp(server=server)
-    async with app.run_test() as pilot:
-        table = app.query_one("#lode-table")
-        # Move to row 2
-        await pilot.press("down")
-        await pilot.press("down")
-        assert table.cursor_row == 2
-        # Refresh table (simulates polling update)
+async def test_cursor_down_up_navigation(running_app):
+    """down and up should move the lode table cursor."""
+    app, pilot = running_app
+    table = app.lode_table
+    assert table.cursor_row == 0
+    await pilot.press("down")
+    assert table.cursor_row == 1
+    await pilot.press("up")
+    assert table.cursor_row == 0
+
+
+@pytest.mark.parametrize("row", [1, 2], ids=["lode-row", "hint-row"])
+async def test_cursor_preserved_after_refresh(running_app, row):
+    """Cursor should stay on a lode or on the hint row across refresh cycles."""
+    app, pilot = running_app
+    table = app.lode_table
+    try:
+        await pilot.press(*["down"] * row)
+        assert table.cursor_row == row
+        # Simulate polling refresh
         app.refresh_table()
-        # Cursor should still be at row 2
-        assert table.cursor_row == 2
+        assert table.cursor_row == row
+    finally:
+        table.move_cursor(row=0)
 
 
-@pytest.mark.asyncio
 async def test_check_server_updates_resyncs_list_references():
     """check_server_updates should pick up replaced list references from server."""
-    sessions = [
-        {"id": "aaaa1111", "stage": "mill", "created_at": 1000},
-        {"id": "bbbb2222", "stage": "mill", "created_at": 2000},
-    ]
+    sessions = mill_lodes(2)
     server = MockServer(sessions)
     app = HopperApp(server=server)
     async with app.run_test() as pilot:
-        table = app.query_one("#lode-table")
+        table = app.lode_table
         assert table.row_count == 3  # 2 lodes + hint
 
         # Move cursor to row 1
@@ -1070,9 +706,9 @@ def test_rename_tui_window_skips_when_no_server():
     app._rename_tui_window("hop")
 
 
-def test_rename_tui_window_skips_when_no_tmux_location():
+def test_rename_tui_window_skips_when_no_tmux_location(empty_server):
     """_rename_tui_window should safely no-op when tmux location is missing."""
-    app = HopperApp(server=MockServer([], tmux_location=None))
+    app = HopperApp(server=empty_server)
     app._rename_tui_window("hop")
 
 
@@ -1171,114 +807,53 @@ def test_jam_takes_priority_over_hopping():
     assert app._window_title == "hopJAM"
 
 
-@pytest.mark.asyncio
-async def test_get_lode():
+def test_get_lode():
     """_get_lode should find session by ID."""
     sessions = [
         {"id": "aaaa1111", "stage": "mill", "created_at": 1000},
         {"id": "bbbb2222", "stage": "refine", "created_at": 2000},
     ]
-    server = MockServer(sessions)
-    app = HopperApp(server=server)
-    async with app.run_test():
-        session = app._get_lode("aaaa1111")
-        assert session is not None
-        assert session["id"] == "aaaa1111"
-
-        session = app._get_lode("nonexistent")
-        assert session is None
+    app = HopperApp(server=MockServer(sessions))
 
+    session = app._get_lode("aaaa1111")
+    assert session is not None
+    assert session["id"] == "aaaa1111"
 
-# Tests for ProjectPickerScreen
-
-
-class PickerTestApp(App):
-    """Test app wrapper for ProjectPickerScreen."""
-
-    def __init__(self, projects: list[Project]):
-        super().__init__()
-        self._projects = projects
-        self.picker_result = "not_set"  # sentinel value
-
-    def on_mount(self) -> None:
-        def capture_result(r):
-            self.picker_result = r
-
-        self.push_screen(ProjectPickerScreen(self._projects), capture_result)
-
+    assert app._get_lode("nonexistent") is None
 
-@pytest.mark.asyncio
-async def test_project_picker_displays_projects():
-    """ProjectPickerScreen should display all projects."""
-    from textual.widgets import OptionList
 
-    projects = [
-        Project(path="/path/to/proj1", name="proj1"),
-        Project(path="/path/to/proj2", name="proj2"),
-    ]
-    app = PickerTestApp(projects)
-    async with app.run_test():
-        # Query through the active screen
-        screen = app.screen
-        option_list = screen.query_one("#project-list", OptionList)
-        assert option_list.option_count == 2
-
-
-@pytest.mark.asyncio
-async def test_project_picker_cancel():
-    """Escape should dismiss the project picker with None result."""
-    projects = [Project(path="/path/to/proj1", name="proj1")]
-    app = PickerTestApp(projects)
-    async with app.run_test() as pilot:
-        await pilot.press("escape")
-        assert app.picker_result is None
+# Tests for ProjectPickerScreen
 
 
-@pytest.mark.asyncio
-async def test_project_picker_select():
-    """Enter should select the highlighted project."""
-    projects = [
-        Project(path="/path/to/proj1", name="proj1"),
-        Project(path="/path/to/proj2", name="proj2"),
-    ]
-    app = PickerTestApp(projects)
-    async with app.run_test() as pilot:
-        await pilot.press("enter")
-        assert app.picker_result is not None
-        assert app.picker_result.name == "proj1"
+PICKER_PROJECTS = (
+    Project(path="/path/to/proj1", name="proj1"),
+    Project(path="/path/to/proj2", name="proj2"),
+)
 
 
-@pytest.mark.asyncio
-async def test_project_picker_navigation():
-    """Arrow keys should navigate the project list."""
-    from textual.widgets import OptionList
+async def test_project_picker_displays_and_navigates(open_screen):
+    """ProjectPickerScreen lists every project and arrow keys move the highlight."""
+    pilot, _ = await open_screen(ProjectPickerScreen(list(PICKER_PROJECTS)))
+    option_list = pilot.app.screen.query_one("#project-list", OptionList)
+    assert option_list.option_count == 2
+    assert option_list.highlighted == 0
+    await pilot.press("down")
+    assert option_list.highlighted == 1
+    await pilot.press("up")
+    assert option_list.highlighted == 0
 
-    projects = [
-        Project(path="/path/to/proj1", name="proj1"),
-        Project(path="/path/to/proj2", name="proj2"),
-    ]
-    app = PickerTestApp(projects)
-    async with app.run_test() as pilot:
-        # Query through the active screen
-        screen = app.screen
-        option_list = screen.query_one("#project-list", OptionList)
-        # Should start at 0
-        assert option_list.highlighted == 0
-        # Move down
-        await pilot.press("down")
-        assert option_list.highlighted == 1
-        # Move back up
-        await pilot.press("up")
-        assert option_list.highlighted == 0
-
-
-def test_picker_option_label_marks_disabled():
-    """Disabled projects are marked in picker labels."""
-    active = Project(path="/path/to/proj1", name="proj1")
-    disabled = Project(path="/path/to/proj2", name="proj2", disabled=True)
 
-    assert _picker_option_label(active) == "proj1"
-    assert _picker_option_label(disabled) == "proj2 (disabled)"
+@pytest.mark.parametrize(
+    ("keys", "expected"),
+    [(("escape",), None), (("enter",), "proj1"), (("down", "enter"), "proj2")],
+    ids=["escape-cancels", "enter-selects", "down-enter-selects-next"],
+)
+async def test_project_picker_dismiss(open_screen, keys, expected):
+    """The picker dismisses with the highlighted project, or None on escape."""
+    pilot, result = await open_screen(ProjectPickerScreen(list(PICKER_PROJECTS)))
+    await pilot.press(*keys)
+    project = await result
+    assert (project.name if project else None) == expected
 
 
 def test_project_picker_disabled_selection_notifies_without_dismiss():
@@ -1317,392 +892,239 @@ def test_project_picker_active_selection_dismisses():
 # Tests for ScopeInputScreen
 
 
-class ScopeTestApp(App):
-    """Test app wrapper for ScopeInputScreen."""
-
-    def __init__(self):
-        super().__init__()
-        self.scope_result = "not_set"  # sentinel value
-
-    def on_mount(self) -> None:
-        def capture_result(r):
-            self.scope_result = r
-
-        self.push_screen(ScopeInputScreen("testproject"), capture_result)
-
-
-@pytest.mark.asyncio
-async def test_scope_screen_title_includes_project_name():
+def test_scope_screen_title_includes_project_name():
     """ScopeInputScreen title includes the capitalized project name."""
-    from textual.widgets import Static
-
-    async with ScopeTestApp().run_test() as pilot:
-        screen = pilot.app.screen
-        title = screen.query_one(".text-input-title", Static)
-        assert "Testproject" in str(title.render())
+    screen = ScopeInputScreen("testproject")
+    assert screen.MODAL_TITLE == "Describe Testproject Task Scope"
 
 
-@pytest.mark.asyncio
-async def test_scope_input_cancel_escape():
+async def test_scope_input_cancel_escape(open_screen):
     """Escape should dismiss the scope input with None result."""
-    app = ScopeTestApp()
-    async with app.run_test() as pilot:
-        await pilot.press("escape")
-        assert app.scope_result is None
+    pilot, result = await open_screen(ScopeInputScreen("testproject"))
+    await pilot.press("escape")
+    assert await result is None
 
 
-@pytest.mark.asyncio
-async def test_scope_input_cancel_button():
+async def test_scope_input_cancel_button(open_screen):
     """Cancel button should dismiss the scope input with None result."""
-
-    app = ScopeTestApp()
-    async with app.run_test() as pilot:
-        # Tab to Cancel button (first button after TextArea)
-        await pilot.press("tab")
-        # Press enter to activate
-        await pilot.press("enter")
-        assert app.scope_result is None
+    pilot, result = await open_screen(ScopeInputScreen("testproject"))
+    # Tab to Cancel button (first button after TextArea)
+    await pilot.press("tab")
+    # Press enter to activate
+    await pilot.press("enter")
+    assert await result is None
 
 
-@pytest.mark.asyncio
-async def test_scope_input_start():
+async def test_scope_input_start(open_screen):
     """Start button should return scope and 'start'."""
-    from textual.widgets import TextArea
-
-    app = ScopeTestApp()
-    async with app.run_test() as pilot:
-        # Type some text
-        screen = app.screen
-        text_area = screen.query_one(TextArea)
-        text_area.insert("Test task scope")
-        # Tab to Start button (third button)
-        await pilot.press("tab")  # Cancel
-        await pilot.press("tab")  # Backlog
-        await pilot.press("tab")  # Start
-        await pilot.press("enter")
-        assert app.scope_result == ("Test task scope", "start")
+    pilot, result = await open_screen(ScopeInputScreen("testproject"))
+    # Type some text
+    screen = pilot.app.screen
+    text_area = screen.text_area
+    text_area.load_text("Test task scope")
+    # Tab to Start button (third button)
+    await pilot.press("tab", "tab", "tab", "enter")  # Cancel, Backlog, Start
+    assert await result == ("Test task scope", "start")
 
 
-@pytest.mark.asyncio
-async def test_scope_input_backlog():
+async def test_scope_input_backlog(open_screen):
     """Backlog button should return scope and 'backlog'."""
-    from textual.widgets import TextArea
-
-    app = ScopeTestApp()
-    async with app.run_test() as pilot:
-        # Type some text
-        screen = app.screen
-        text_area = screen.query_one(TextArea)
-        text_area.insert("Test task scope")
-        # Tab to Backlog button (second button)
-        await pilot.press("tab")  # Cancel
-        await pilot.press("tab")  # Backlog
-        await pilot.press("enter")
-        assert app.scope_result == ("Test task scope", "backlog")
-
-
-@pytest.mark.asyncio
-async def test_scope_input_empty_validation():
-    """Empty scope should not submit - result stays as sentinel."""
-    app = ScopeTestApp()
-    async with app.run_test() as pilot:
-        # Tab to Start button without typing anything
-        await pilot.press("tab")  # Cancel
-        await pilot.press("tab")  # Backlog
-        await pilot.press("tab")  # Start
-        await pilot.press("enter")
-        # Should not have dismissed - still sentinel
-        assert app.scope_result == "not_set"
-
-
-@pytest.mark.asyncio
-async def test_scope_input_ctrl_enter_submit():
+    pilot, result = await open_screen(ScopeInputScreen("testproject"))
+    # Type some text
+    screen = pilot.app.screen
+    text_area = screen.text_area
+    text_area.load_text("Test task scope")
+    # Tab to Backlog button (second button)
+    await pilot.press("tab", "tab", "enter")  # Cancel, Backlog
+    assert await result == ("Test task scope", "backlog")
+
+
+async def test_scope_input_empty_validation(open_screen):
+    """Empty scope should not submit."""
+    pilot, result = await open_screen(ScopeInputScreen("testproject"))
+    # Tab to Start button without typing anything
+    await pilot.press("tab", "tab", "tab", "enter")  # Cancel, Backlog, Start
+    # Should not have dismissed
+    assert not result.done()
+
+
+async def test_scope_input_ctrl_enter_submit(open_screen):
     """Ctrl+Enter should submit using the primary action."""
-    from textual.widgets import TextArea
-
-    app = ScopeTestApp()
-    async with app.run_test() as pilot:
-        text_area = app.screen.query_one(TextArea)
-        text_area.insert("test scope")
-        await pilot.press("ctrl+enter")
-        assert app.scope_result == ("test scope", "start")
+    pilot, result = await open_screen(ScopeInputScreen("testproject"))
+    text_area = pilot.app.screen.text_area
+    text_area.load_text("test scope")
+    await pilot.press("ctrl+enter")
+    assert await result == ("test scope", "start")
 
 
-@pytest.mark.asyncio
-async def test_ctrl_enter_empty_no_submit():
+async def test_ctrl_enter_empty_no_submit(open_screen):
     """Ctrl+Enter with empty input should not dismiss."""
-    app = ScopeTestApp()
-    async with app.run_test() as pilot:
-        await pilot.press("ctrl+enter")
-        assert app.scope_result == "not_set"
+    pilot, result = await open_screen(ScopeInputScreen("testproject"))
+    await pilot.press("ctrl+enter")
+    assert not result.done()
 
 
-@pytest.mark.asyncio
-async def test_scope_input_arrow_keys_navigate_buttons():
+async def test_scope_input_arrow_keys_navigate_buttons(open_screen):
     """Left/right arrows should cycle focus between buttons."""
-    app = ScopeTestApp()
-    async with app.run_test() as pilot:
-        # Tab from TextArea to first button (Cancel)
-        await pilot.press("tab")
-        assert app.screen.focused.id == "btn-cancel"
-        # Right arrow to Backlog
-        await pilot.press("right")
-        assert app.screen.focused.id == "btn-backlog"
-        # Right arrow to Start
-        await pilot.press("right")
-        assert app.screen.focused.id == "btn-start"
-        # Right arrow wraps to Cancel
-        await pilot.press("right")
-        assert app.screen.focused.id == "btn-cancel"
-        # Left arrow wraps to Start
-        await pilot.press("left")
-        assert app.screen.focused.id == "btn-start"
-        # Left arrow to Backlog
-        await pilot.press("left")
-        assert app.screen.focused.id == "btn-backlog"
+    pilot, _ = await open_screen(ScopeInputScreen("testproject"))
+    # Tab from TextArea to Cancel, right through to a wrap, then left back around
+    trail = await press_focus_trail(pilot, "tab", "right", "right", "right", "left", "left")
+    assert trail == [
+        "btn-cancel",
+        "btn-backlog",
+        "btn-start",
+        "btn-cancel",  # right wraps
+        "btn-start",  # left wraps
+        "btn-backlog",
+    ]
 
 
-@pytest.mark.asyncio
-async def test_scope_input_shift_tab_returns_to_textarea():
+async def test_scope_input_shift_tab_returns_to_textarea(open_screen):
     """Shift+Tab from first button should return focus to TextArea."""
-    from textual.widgets import TextArea
-
-    app = ScopeTestApp()
-    async with app.run_test() as pilot:
-        # Tab to first button
-        await pilot.press("tab")
-        assert app.screen.focused.id == "btn-cancel"
-        # Shift+Tab back to TextArea
-        await pilot.press("shift+tab")
-        assert isinstance(app.screen.focused, TextArea)
-
-
-@pytest.mark.asyncio
-async def test_scope_input_shift_tab_between_buttons():
-    """Shift+Tab should move backwards through buttons."""
-    app = ScopeTestApp()
-    async with app.run_test() as pilot:
-        # Tab to Start (third button)
-        await pilot.press("tab")  # Cancel
-        await pilot.press("tab")  # Backlog
-        await pilot.press("tab")  # Start
-        assert app.screen.focused.id == "btn-start"
-        # Shift+Tab back to Backlog
-        await pilot.press("shift+tab")
-        assert app.screen.focused.id == "btn-backlog"
-        # Shift+Tab back to Cancel
-        await pilot.press("shift+tab")
-        assert app.screen.focused.id == "btn-cancel"
-
-
-@pytest.mark.asyncio
-async def test_scope_input_arrow_key_select():
-    """Arrow to a button then Enter should activate it."""
-    from textual.widgets import TextArea
-
-    app = ScopeTestApp()
-    async with app.run_test() as pilot:
-        screen = app.screen
-        text_area = screen.query_one(TextArea)
-        text_area.insert("Test task scope")
-        # Tab to Cancel, then right twice to Start
-        await pilot.press("tab")
-        await pilot.press("right")
-        await pilot.press("right")
-        assert app.screen.focused.id == "btn-start"
-        await pilot.press("enter")
-        assert app.scope_result == ("Test task scope", "start")
-
-
-# Tests for hint rows
-
-
-@pytest.mark.asyncio
-async def test_hint_row_stays_highlighted():
-    """Cursor should stay on hint row across refresh cycles."""
-    sessions = [
-        {"id": "aaaa1111", "stage": "mill", "created_at": 1000},
-    ]
-    server = MockServer(sessions)
-    app = HopperApp(server=server)
-    async with app.run_test() as pilot:
-        table = app.query_one("#lode-table")
-        # Move to hint row (row 1, after the one session)
-        await pilot.press("down")
-        assert table.cursor_row == 1
-        # Simulate polling refresh
-        app.refresh_table()
-        # Cursor should still be on hint row
-        assert table.cursor_row == 1
+    pilot, _ = await open_screen(ScopeInputScreen("testproject"))
+    # Tab to first button
+    await pilot.press("tab")
+    assert pilot.app.screen.focused.id == "btn-cancel"
+    # Shift+Tab back to TextArea
+    await pilot.press("shift+tab")
+    assert isinstance(pilot.app.screen.focused, TextArea)
+
+
+async def test_scope_input_shift_tab_between_buttons(open_screen):
+    """Shift+Tab should move backwards through buttons."""
+    pilot, _ = await open_screen(ScopeInputScreen("testproject"))
+    trail = await press_focus_trail(pilot, "tab", "tab", "tab", "shift+tab", "shift+tab")
+    assert trail == ["btn-cancel", "btn-backlog", "btn-start", "btn-backlog", "btn-cancel"]
+
+
+async def test_scope_input_arrow_key_select(open_screen):
+    """Arrow to a button then Enter should activate it."""
+    pilot, result = await open_screen(ScopeInputScreen("testproject"))
+    screen = pilot.app.screen
+    text_area = screen.text_area
+    text_area.load_text("Test task scope")
+    # Tab to Cancel, then right twice to Start
+    await pilot.press("tab", "right", "right")
+    assert pilot.app.screen.focused.id == "btn-start"
+    await pilot.press("enter")
+    assert await result == ("Test task scope", "start")
+
+
+# Tests for hint rows
 
 
-@pytest.mark.asyncio
 async def test_enter_on_session_hint_triggers_new_session():
     """Enter on session hint row should trigger new session action."""
-    sessions = [
-        {"id": "aaaa1111", "stage": "mill", "created_at": 1000},
-    ]
+    sessions = mill_lodes(1)
     server = MockServer(sessions)
     app = HopperApp(server=server)
     async with app.run_test() as pilot:
         called = []
         app.action_new_lode = lambda: called.append(True)
         # Move to hint row and press enter
-        await pilot.press("down")
-        await pilot.press("enter")
+        await pilot.press("down", "enter")
         assert len(called) == 1
 
 
-@pytest.mark.asyncio
 async def test_enter_on_backlog_hint_triggers_new_backlog():
     """Enter on backlog hint row should trigger new backlog action."""
-    from hopper.backlog import BacklogItem
-
-    items = [
-        BacklogItem(id="bl111111", project="proj", description="Item", created_at=1000),
-    ]
+    items = [replace(BACKLOG_ITEM)]
     server = MockServer([], backlog=items)
     app = HopperApp(server=server)
     async with app.run_test() as pilot:
         called = []
         app.action_new_backlog = lambda: called.append(True)
         # Switch to backlog, move to hint row
-        await pilot.press("tab")
-        await pilot.press("tab")
-        await pilot.press("down")
-        await pilot.press("enter")
+        await pilot.press("tab", "tab", "down", "enter")
         assert len(called) == 1
 
 
 # Tests for BacklogInputScreen
 
 
-class BacklogInputTestApp(App):
-    """Test app wrapper for BacklogInputScreen."""
-
-    def __init__(self):
-        super().__init__()
-        self.backlog_result = "not_set"  # sentinel value
-
-    def on_mount(self) -> None:
-        def capture_result(r):
-            self.backlog_result = r
-
-        self.push_screen(BacklogInputScreen(), capture_result)
-
-
-@pytest.mark.asyncio
-async def test_backlog_input_cancel_escape():
+async def test_backlog_input_cancel_escape(open_screen):
     """Escape should dismiss the backlog input with None result."""
-    app = BacklogInputTestApp()
-    async with app.run_test() as pilot:
-        await pilot.press("escape")
-        assert app.backlog_result is None
+    pilot, result = await open_screen(BacklogInputScreen())
+    await pilot.press("escape")
+    assert await result is None
 
 
-@pytest.mark.asyncio
-async def test_backlog_input_cancel_button():
+async def test_backlog_input_cancel_button(open_screen):
     """Cancel button should dismiss the backlog input with None result."""
-    app = BacklogInputTestApp()
-    async with app.run_test() as pilot:
-        await pilot.press("tab")
-        await pilot.press("enter")
-        assert app.backlog_result is None
+    pilot, result = await open_screen(BacklogInputScreen())
+    await pilot.press("tab", "enter")
+    assert await result is None
 
 
-@pytest.mark.asyncio
-async def test_backlog_input_add():
+async def test_backlog_input_add(open_screen):
     """Add button should return the description text."""
-    from textual.widgets import TextArea
+    pilot, result = await open_screen(BacklogInputScreen())
+    screen = pilot.app.screen
+    text_area = screen.text_area
+    text_area.load_text("Fix the login bug")
+    # Tab to Add button (second button after Cancel)
+    await pilot.press("tab", "tab", "enter")  # Cancel, Add
+    assert await result == "Fix the login bug"
 
-    app = BacklogInputTestApp()
-    async with app.run_test() as pilot:
-        screen = app.screen
-        text_area = screen.query_one(TextArea)
-        text_area.insert("Fix the login bug")
-        # Tab to Add button (second button after Cancel)
-        await pilot.press("tab")  # Cancel
-        await pilot.press("tab")  # Add
-        await pilot.press("enter")
-        assert app.backlog_result == "Fix the login bug"
 
-
-@pytest.mark.asyncio
-async def test_backlog_input_empty_validation():
+async def test_backlog_input_empty_validation(open_screen):
     """Empty description should not submit."""
-    app = BacklogInputTestApp()
-    async with app.run_test() as pilot:
-        # Tab to Add button without typing anything
-        await pilot.press("tab")  # Cancel
-        await pilot.press("tab")  # Add
-        await pilot.press("enter")
-        assert app.backlog_result == "not_set"
+    pilot, result = await open_screen(BacklogInputScreen())
+    # Tab to Add button without typing anything
+    await pilot.press("tab", "tab", "enter")  # Cancel, Add
+    assert not result.done()
 
 
-@pytest.mark.asyncio
-async def test_backlog_input_arrow_navigation():
+async def test_backlog_input_arrow_navigation(open_screen):
     """Arrow keys should navigate between buttons."""
-    app = BacklogInputTestApp()
-    async with app.run_test() as pilot:
-        await pilot.press("tab")
-        assert app.screen.focused.id == "btn-cancel"
-        await pilot.press("right")
-        assert app.screen.focused.id == "btn-add"
-        await pilot.press("right")  # wraps
-        assert app.screen.focused.id == "btn-cancel"
+    pilot, _ = await open_screen(BacklogInputScreen())
+    trail = await press_focus_trail(pilot, "tab", "right", "right")
+    assert trail == ["btn-cancel", "btn-add", "btn-cancel"]  # second right wraps
 
 
-@pytest.mark.asyncio
-async def test_backlog_input_ctrl_enter_submit():
+async def test_backlog_input_ctrl_enter_submit(open_screen):
     """Ctrl+Enter should submit using Add."""
-    from textual.widgets import TextArea
-
-    app = BacklogInputTestApp()
-    async with app.run_test() as pilot:
-        text_area = app.screen.query_one(TextArea)
-        text_area.insert("test backlog")
-        await pilot.press("ctrl+enter")
-        assert app.backlog_result == "test backlog"
+    pilot, result = await open_screen(BacklogInputScreen())
+    text_area = pilot.app.screen.text_area
+    text_area.load_text("test backlog")
+    await pilot.press("ctrl+enter")
+    assert await result == "test backlog"
 
 
 # Tests for BacklogTable
 
 
-@pytest.mark.asyncio
-async def test_backlog_shows_hint_when_empty():
+def test_backlog_shows_hint_when_empty(empty_app):
     """Backlog should show hint row when no items."""
-    server = MockServer([])
-    app = HopperApp(server=server)
-    async with app.run_test():
-        table = app.query_one("#backlog-table")
-        assert table.display is True
-        assert table.row_count == 1  # hint row only
+    app, _ = empty_app
+    table = app.backlog_table
+    assert table.display is True
+    assert table.row_count == 1  # hint row only
 
 
-@pytest.mark.asyncio
 async def test_backlog_shown_with_items():
     """Backlog table should display items plus hint row."""
-    from hopper.backlog import BacklogItem
-
     items = [
-        BacklogItem(id="bl111111", project="proj-a", description="Fix bug", created_at=1000),
-        BacklogItem(id="bl222222", project="proj-b", description="Add feature", created_at=2000),
+        replace(BACKLOG_ITEM, project="proj-a", description="Fix bug"),
+        replace(
+            BACKLOG_ITEM,
+            id="bl222222",
+            project="proj-b",
+            description="Add feature",
+            created_at=2000,
+        ),
     ]
     server = MockServer([], backlog=items)
     app = HopperApp(server=server)
     async with app.run_test():
-        table = app.query_one("#backlog-table")
+        table = app.backlog_table
         assert table.display is True
         # 2 items + 1 hint row
         assert table.row_count == 3
 
 
-@pytest.mark.asyncio
-async def test_shipped_table_filters_by_stage_and_time(make_lode):
+async def test_shipped_table_filters_by_stage_and_time(make_lode, now):
     """Shipped table only shows archived lodes with stage=shipped within 24h."""
-    from hopper.lodes import current_time_ms
-
-    now = current_time_ms()
     shipped_recent = make_lode(id="ship0001", stage="shipped", updated_at=now - 1000)
     shipped_old = make_lode(
         id="ship0002",
@@ -1714,26 +1136,21 @@ async def test_shipped_table_filters_by_stage_and_time(make_lode):
     server = MockServer([], archived_lodes=[shipped_recent, shipped_old, refine_recent])
     app = HopperApp(server=server)
     async with app.run_test():
-        table = app.query_one("#shipped-table", ShippedTable)
+        table = app.shipped_table
         assert table.row_count == 1
         # Verify it's the recent shipped one
         cell_key = table.coordinate_to_cell_key((0, 0))
         assert str(cell_key.row_key.value) == "ship0001"
 
 
-@pytest.mark.asyncio
-async def test_shipped_table_enter_opens_file_viewer(make_lode):
+async def test_shipped_table_enter_opens_file_viewer(make_lode, now):
     """Enter on a shipped row should open FileViewerScreen."""
-    from hopper.lodes import current_time_ms
-
-    now = current_time_ms()
     shipped = make_lode(id="ship0001", stage="shipped", updated_at=now - 1000)
     server = MockServer([], archived_lodes=[shipped])
     app = HopperApp(server=server)
     with patch.object(app, "push_screen") as mock_push:
         async with app.run_test() as pilot:
-            await pilot.press("tab")  # lode -> shipped
-            await pilot.press("enter")
+            await pilot.press("tab", "enter")  # lode -> shipped
 
     mock_push.assert_called_once()
     screen = mock_push.call_args.args[0]
@@ -1741,43 +1158,32 @@ async def test_shipped_table_enter_opens_file_viewer(make_lode):
     assert screen.lode_id == "ship0001"
 
 
-@pytest.mark.asyncio
-async def test_shipped_table_columns():
+def test_shipped_table_columns(empty_app):
     """Shipped table should have project, age, id, diff, title columns."""
-    server = MockServer([])
-    app = HopperApp(server=server)
-    async with app.run_test():
-        table = app.query_one("#shipped-table", ShippedTable)
-        col_keys = [str(k.value) for k in table.columns]
-        assert col_keys == ["project", "age", "id", "diff", "title"]
+    app, _ = empty_app
+    table = app.shipped_table
+    col_keys = [str(k.value) for k in table.columns]
+    assert col_keys == ["project", "age", "id", "diff", "title"]
 
 
-@pytest.mark.asyncio
-async def test_shipped_table_populates_diff_column(temp_config, make_lode):
+async def test_shipped_table_populates_diff_column(temp_config, make_lode, now):
     """Shipped table should display parsed diff summaries from diff.txt."""
-    from hopper.lodes import current_time_ms
-
     lode_id = "ship0001"
     lode_dir = temp_config / "lodes" / lode_id
     lode_dir.mkdir(parents=True, exist_ok=True)
     (lode_dir / "diff.txt").write_text("10\t5\tfile.py\n20\t3\tother.py")
 
-    now = current_time_ms()
     shipped = make_lode(id=lode_id, stage="shipped", updated_at=now - 1000)
     server = MockServer([], archived_lodes=[shipped])
     app = HopperApp(server=server)
     async with app.run_test():
-        table = app.query_one("#shipped-table", ShippedTable)
+        table = app.shipped_table
         row = table.get_row(lode_id)
         assert str(row[3]) == "+30 -8"
 
 
-@pytest.mark.asyncio
-async def test_shipped_label_shows_total_loc(make_lode):
+async def test_shipped_label_shows_total_loc(make_lode, now):
     """Shipped label should include total LOC for shipped-today rows."""
-    from hopper.lodes import current_time_ms
-
-    now = current_time_ms()
     shipped = [
         make_lode(id="ship0001", stage="shipped", updated_at=now - 2000),
         make_lode(id="ship0002", stage="shipped", updated_at=now - 1000),
@@ -1791,12 +1197,8 @@ async def test_shipped_label_shows_total_loc(make_lode):
             assert label.content == "shipped today · 20 lines"
 
 
-@pytest.mark.asyncio
-async def test_shipped_label_hides_zero_loc_suffix(make_lode):
+async def test_shipped_label_hides_zero_loc_suffix(make_lode, now):
     """Shipped label should omit LOC suffix when totals are all zero."""
-    from hopper.lodes import current_time_ms
-
-    now = current_time_ms()
     shipped = [
         make_lode(id="ship0001", stage="shipped", updated_at=now - 2000),
         make_lode(id="ship0002", stage="shipped", updated_at=now - 1000),
@@ -1810,51 +1212,34 @@ async def test_shipped_label_hides_zero_loc_suffix(make_lode):
             assert label.content == "shipped today"
 
 
-@pytest.mark.asyncio
-async def test_tab_cycles_three_tables(make_lode):
+async def test_tab_cycles_three_tables(make_lode, now):
     """Tab should cycle focus: lode -> shipped -> backlog -> lode."""
-    from hopper.backlog import BacklogItem
-    from hopper.lodes import current_time_ms
-    from hopper.tui import BacklogTable, LodeTable
-
-    now = current_time_ms()
-    items = [BacklogItem(id="bl111111", project="proj", description="Item", created_at=1000)]
+    items = [replace(BACKLOG_ITEM)]
     shipped = make_lode(id="ship0001", stage="shipped", updated_at=now - 1000)
     sessions = [make_lode(id="aaaa1111", stage="mill", created_at=1000)]
     server = MockServer(sessions, backlog=items, archived_lodes=[shipped])
     app = HopperApp(server=server)
     async with app.run_test() as pilot:
         assert isinstance(app.focused, LodeTable)
-        await pilot.press("tab")
-        assert isinstance(app.focused, ShippedTable)
-        await pilot.press("tab")
-        assert isinstance(app.focused, BacklogTable)
-        await pilot.press("tab")
-        assert isinstance(app.focused, LodeTable)
+        trail = await press_focus_trail(pilot, "tab", "tab", "tab")
+        assert trail == ["shipped-table", "backlog-table", "lode-table"]
 
 
-@pytest.mark.asyncio
-async def test_shipped_table_empty_when_no_recent():
+def test_shipped_table_empty_when_no_recent(empty_app):
     """Shipped table should be empty when no recently shipped lodes."""
-    server = MockServer([])
-    app = HopperApp(server=server)
-    async with app.run_test():
-        table = app.query_one("#shipped-table", ShippedTable)
-        assert table.row_count == 0
+    app, _ = empty_app
+    table = app.shipped_table
+    assert table.row_count == 0
 
 
-@pytest.mark.asyncio
-async def test_shipped_table_updates_dynamically(make_lode):
+async def test_shipped_table_updates_dynamically(make_lode, now):
     """Shipped table refresh should pick up new archived shipped lodes in sorted order."""
-    from hopper.lodes import current_time_ms
-
     server = MockServer([make_lode(id="active01", stage="mill")], archived_lodes=[])
     app = HopperApp(server=server)
     async with app.run_test():
-        table = app.query_one("#shipped-table", ShippedTable)
+        table = app.shipped_table
         assert table.row_count == 0
 
-        now = current_time_ms()
         first = make_lode(id="ship0001", stage="shipped", updated_at=now - 2000)
         server.archived_lodes.append(first)
         app.refresh_shipped()
@@ -1872,12 +1257,8 @@ async def test_shipped_table_updates_dynamically(make_lode):
         assert str(top_key.row_key.value) == "ship0002"
 
 
-@pytest.mark.asyncio
-async def test_shipped_cursor_preserved_after_refresh(make_lode):
+async def test_shipped_cursor_preserved_after_refresh(make_lode, now):
     """Cursor position on shipped table should be preserved across refresh."""
-    from hopper.lodes import current_time_ms
-
-    now = current_time_ms()
     shipped = [
         make_lode(id="ship0001", stage="shipped", updated_at=now - 1000),
         make_lode(id="ship0002", stage="shipped", updated_at=now - 2000),
@@ -1888,10 +1269,9 @@ async def test_shipped_cursor_preserved_after_refresh(make_lode):
     async with app.run_test() as pilot:
         # Focus the shipped table
         await pilot.press("tab")  # lode -> shipped
-        table = app.query_one("#shipped-table", ShippedTable)
+        table = app.shipped_table
         # Move to row 2
-        await pilot.press("down")
-        await pilot.press("down")
+        await pilot.press("down", "down")
         assert table.cursor_row == 2
         # Refresh (simulates polling update)
         app.refresh_shipped()
@@ -1899,10 +1279,47 @@ async def test_shipped_cursor_preserved_after_refresh(make_lode):
         assert table.cursor_row == 2
 
 
-def test_parse_diff_numstat_normal_input():
-    """parse_diff_numstat sums additions and deletions across valid lines."""
-    text = "10\t5\tfile.py\n20\t3\tother.py"
-    assert parse_diff_numstat(text) == "+30 -8"
+async def test_shipped_refresh_reorders_new_rows_and_keeps_selection(make_lode, now):
+    """A newly shipped lode sorts to the top and the selected row stays selected."""
+    shipped = [
+        make_lode(id="ship0001", stage="shipped", updated_at=now - 2000),
+        make_lode(id="ship0002", stage="shipped", updated_at=now - 3000),
+    ]
+    server = MockServer([], archived_lodes=shipped)
+    app = HopperApp(server=server)
+    async with app.run_test():
+        table = app.shipped_table
+        table.move_cursor(row=1)
+        assert app._get_selected_row_key(table) == "ship0002"
+
+        server.archived_lodes.append(
+            make_lode(id="ship0003", stage="shipped", updated_at=now - 1000, title="New")
+        )
+        app.refresh_shipped()
+
+        assert [str(row.key.value) for row in table.ordered_rows] == [
+            "ship0003",
+            "ship0001",
+            "ship0002",
+        ]
+        assert table.get_row("ship0003")[4] == "New"
+        assert app._get_selected_row_key(table) == "ship0002"
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("10\t5\tfile.py\n20\t3\tother.py", "+30 -8"),
+        ("-\t-\tbinary.bin\n10\t5\tfile.py", "+10 -5"),
+        ("", ""),
+        ("not\ta\tvalid", ""),
+        ("-\t-\tbinary.bin", ""),
+        ("  \n  ", ""),
+    ],
+)
+def test_parse_diff_numstat(text, expected):
+    """parse_diff_numstat sums valid rows and skips binary and malformed ones."""
+    assert parse_diff_numstat(text) == expected
 
 
 def test_parse_diff_numstat_totals_normal_input():
@@ -1923,30 +1340,10 @@ def test_parse_diff_numstat_totals_skips_binary_entries():
     assert parse_diff_numstat_totals(text) == (10, 5)
 
 
-def test_parse_diff_numstat_skips_binary_entries():
-    """Binary numstat rows are skipped."""
-    text = "-\t-\tbinary.bin\n10\t5\tfile.py"
-    assert parse_diff_numstat(text) == "+10 -5"
-
-
-def test_parse_diff_numstat_empty_input():
-    """Empty input should return empty summary."""
-    assert parse_diff_numstat("") == ""
-
-
-def test_parse_diff_numstat_skips_malformed_lines():
-    """Non-numeric malformed entries are skipped."""
-    assert parse_diff_numstat("not\ta\tvalid") == ""
-
-
-def test_parse_diff_numstat_only_binary():
-    """Only binary entries should return empty summary."""
-    assert parse_diff_numstat("-\t-\tbinary.bin") == ""
-
-
-def test_parse_diff_numstat_whitespace_only():
-    """Whitespace-only input should return empty summary."""
-    assert parse_diff_numstat("  \n  ") == ""
+def test_parse_diff_numstat_totals_requires_a_path():
+    """Rows need a non-blank path; surrounding whitespace is ignored."""
+    text = "  1\t2\tpadded.py  \n3\t4\t\n5\t6\t   \n7 \t8\tbad.py\n9\t10"
+    assert parse_diff_numstat_totals(text) == (1, 2)
 
 
 def test_read_diff_totals_reads_existing_file(temp_config):
@@ -1959,75 +1356,34 @@ def test_read_diff_totals_reads_existing_file(temp_config):
     assert read_diff_totals(lode_id) == (30, 8)
 
 
-def test_read_diff_totals_missing_file_returns_zeros(temp_config):
+def test_read_diff_totals_missing_file_returns_zeros():
     """read_diff_totals should return zeros when diff.txt is missing."""
     assert read_diff_totals("missing01") == (0, 0)
 
 
-@pytest.mark.asyncio
-async def test_tab_switches_focus_to_backlog():
-    """Tab should switch focus from lode table to shipped then backlog."""
-    from hopper.backlog import BacklogItem
-    from hopper.lodes import current_time_ms
-    from hopper.tui import BacklogTable, LodeTable
-
-    now = current_time_ms()
-    items = [
-        BacklogItem(id="bl111111", project="proj", description="Item", created_at=1000),
-    ]
-    shipped = [
-        {"id": "ship0001", "stage": "shipped", "created_at": 1000, "updated_at": now - 1000},
-    ]
-    sessions = [
-        {"id": "aaaa1111", "stage": "mill", "created_at": 1000},
-    ]
-    server = MockServer(sessions, archived_lodes=shipped, backlog=items)
-    app = HopperApp(server=server)
-    async with app.run_test() as pilot:
-        # Should start focused on lode table
-        assert isinstance(app.focused, LodeTable)
-        # Tab to shipped, then backlog
-        await pilot.press("tab")
-        assert isinstance(app.focused, ShippedTable)
-        # Tab back
-        await pilot.press("tab")
-        assert isinstance(app.focused, BacklogTable)
-
-
-@pytest.mark.asyncio
-async def test_tab_switches_to_backlog_even_when_empty():
-    """Tab should switch to backlog table even when it has no items."""
-    from hopper.tui import BacklogTable, LodeTable
-
-    sessions = [
-        {"id": "aaaa1111", "stage": "mill", "created_at": 1000},
-    ]
-    server = MockServer(sessions)
-    app = HopperApp(server=server)
-    async with app.run_test() as pilot:
-        assert isinstance(app.focused, LodeTable)
-        await pilot.press("tab")
-        await pilot.press("tab")
-        assert isinstance(app.focused, BacklogTable)
+async def test_tab_switches_to_backlog_even_when_empty(running_app):
+    """Tab should reach the backlog table even when shipped and backlog are empty."""
+    app, pilot = running_app
+    assert isinstance(app.focused, LodeTable)
+    try:
+        trail = await press_focus_trail(pilot, "tab", "tab", "tab")
+    finally:
+        app.lode_table.focus()
+    assert trail == ["shipped-table", "backlog-table", "lode-table"]
 
 
-@pytest.mark.asyncio
 async def test_arrow_navigation_in_backlog():
     """Arrow keys should navigate within the backlog table when focused."""
-    from hopper.backlog import BacklogItem
-    from hopper.tui import BacklogTable
-
     items = [
-        BacklogItem(id="bl111111", project="proj", description="First", created_at=1000),
-        BacklogItem(id="bl222222", project="proj", description="Second", created_at=2000),
+        replace(BACKLOG_ITEM, description="First"),
+        replace(BACKLOG_ITEM, id="bl222222", description="Second", created_at=2000),
     ]
     server = MockServer([], backlog=items)
     app = HopperApp(server=server)
     async with app.run_test() as pilot:
         # Switch to backlog table
-        await pilot.press("tab")
-        await pilot.press("tab")
-        table = app.query_one("#backlog-table", BacklogTable)
+        await pilot.press("tab", "tab")
+        table = app.backlog_table
         assert table.cursor_row == 0
         await pilot.press("down")
         assert table.cursor_row == 1
@@ -2035,134 +1391,89 @@ async def test_arrow_navigation_in_backlog():
         assert table.cursor_row == 0
 
 
-@pytest.mark.asyncio
-async def test_delete_backlog_item(temp_config):
+async def test_delete_backlog_item():
     """Delete key should enqueue backlog_remove when backlog is focused."""
-    from hopper.backlog import BacklogItem
-    from hopper.tui import BacklogRemoveScreen
-
     items = [
-        BacklogItem(id="bl111111", project="proj", description="To delete", created_at=1000),
-        BacklogItem(id="bl222222", project="proj", description="To keep", created_at=2000),
+        replace(BACKLOG_ITEM, description="To delete"),
+        replace(BACKLOG_ITEM, id="bl222222", description="To keep", created_at=2000),
     ]
     server = MockServer([], backlog=items)
     app = HopperApp(server=server)
     async with app.run_test() as pilot:
         # Switch to backlog table
-        await pilot.press("tab")
-        await pilot.press("tab")
+        await pilot.press("tab", "tab")
         # Delete first item and confirm modal
         await pilot.press("delete")
         assert isinstance(app.screen, BacklogRemoveScreen)
-        await pilot.press("right")
-        await pilot.press("enter")
+        await pilot.press("right", "enter")
         assert server.events == [{"type": "backlog_remove", "item_id": "bl111111"}]
 
 
-@pytest.mark.asyncio
 async def test_queue_backlog_auto_assign():
     """q on backlog item should auto-assign queue when one active lode matches project."""
-    from hopper.backlog import BacklogItem
-
     sessions = [
         {"id": "lode1234", "project": "proj", "active": True, "stage": "mill", "created_at": 1}
     ]
-    items = [BacklogItem(id="bl111111", project="proj", description="Queue me", created_at=1000)]
+    items = [replace(BACKLOG_ITEM, description="Queue me")]
     server = MockServer(sessions, backlog=items)
     app = HopperApp(server=server)
     async with app.run_test() as pilot:
-        await pilot.press("tab")
-        await pilot.press("tab")
-        await pilot.press("q")
+        await pilot.press("tab", "tab", "q")
         assert server.events == [
             {"type": "backlog_set_queued", "item_id": "bl111111", "queued": "lode1234"}
         ]
 
 
-@pytest.mark.asyncio
 async def test_queue_backlog_clear():
     """q on already-queued backlog item should clear queue assignment."""
-    from hopper.backlog import BacklogItem
-
-    items = [
-        BacklogItem(
-            id="bl111111",
-            project="proj",
-            description="Queued already",
-            created_at=1000,
-            queued="lode1234",
-        )
-    ]
+    items = [replace(BACKLOG_ITEM, description="Queued already", queued="lode1234")]
     server = MockServer([], backlog=items)
     app = HopperApp(server=server)
     async with app.run_test() as pilot:
-        await pilot.press("tab")
-        await pilot.press("tab")
-        await pilot.press("q")
+        await pilot.press("tab", "tab", "q")
         assert server.events == [
             {"type": "backlog_set_queued", "item_id": "bl111111", "queued": None}
         ]
 
 
-@pytest.mark.asyncio
 async def test_delete_archives_on_session_table():
     """Delete key should enqueue lode_archive when session table is focused."""
-    from hopper.backlog import BacklogItem
-
-    items = [
-        BacklogItem(id="bl111111", project="proj", description="Item", created_at=1000),
-    ]
-    sessions = [
-        {"id": "aaaa1111", "stage": "mill", "created_at": 1000},
-    ]
+    items = [replace(BACKLOG_ITEM)]
+    sessions = mill_lodes(1)
     server = MockServer(sessions, backlog=items)
     app = HopperApp(server=server)
-    async with app.run_test() as pilot:
-        # Focus is on session table by default
-        # Press Delete - should enqueue archive and leave backlog unchanged
-        await pilot.press("delete")
+    async with app.run_test():
+        # Focus is on the lode table by default; the key binding itself is
+        # covered by test_archive_with_delete.
+        app.action_delete()
         assert server.events == [{"type": "lode_archive", "lode_id": "aaaa1111"}]
         assert len(app._backlog) == 1
 
 
-def test_action_delete_archives_lode():
+def test_action_delete_archives_lode(focus):
     """Delete key enqueues archive when lode table is focused."""
-    from hopper.tui import LodeTable
-
-    sessions = [{"id": "aaaa1111", "stage": "mill", "created_at": 1000}]
+    sessions = mill_lodes(1)
     server = MockServer(sessions)
     app = HopperApp(server=server)
 
-    worktree_path = MagicMock()
-    worktree_path.is_dir.return_value = False
-
-    with (
-        patch.object(HopperApp, "focused", new_callable=PropertyMock, return_value=LodeTable()),
-        patch.object(app, "_get_selected_lode_id", return_value="aaaa1111"),
-        patch("hopper.tui.get_worktree_dir", return_value=worktree_path),
-    ):
+    focus(LODE_TABLE)
+    with patch.object(app, "_get_selected_lode_id", return_value="aaaa1111"):
         app.action_delete()
     assert len(server.events) == 1
     assert server.events[0] == {"type": "lode_archive", "lode_id": "aaaa1111"}
 
 
-def test_action_delete_shows_modal_for_unmerged_changes():
+def test_action_delete_shows_modal_for_unmerged_changes(focus):
     """Delete key shows confirmation modal when worktree has unmerged changes."""
-    from hopper.tui import ArchiveConfirmScreen, LodeTable
-
     sessions = [{"id": "aaaa1111", "stage": "refine", "created_at": 1000}]
     server = MockServer(sessions)
     app = HopperApp(server=server)
     fake_diff = " file.py | 5 ++---"
+    get_worktree_dir("aaaa1111").mkdir(parents=True)
 
-    worktree_path = MagicMock()
-    worktree_path.is_dir.return_value = True
-    worktree_path.__str__.return_value = "/fake/worktree"
-
+    focus(LODE_TABLE)
     with (
-        patch.object(HopperApp, "focused", new_callable=PropertyMock, return_value=LodeTable()),
         patch.object(app, "_get_selected_lode_id", return_value="aaaa1111"),
-        patch("hopper.tui.get_worktree_dir", return_value=worktree_path),
         patch("hopper.tui.get_diff_stat", return_value=fake_diff),
         patch.object(app, "push_screen") as mock_push,
     ):
@@ -2174,21 +1485,15 @@ def test_action_delete_shows_modal_for_unmerged_changes():
     assert isinstance(screen_arg, ArchiveConfirmScreen)
 
 
-def test_action_delete_archives_immediately_without_worktree():
+def test_action_delete_archives_immediately_without_worktree(focus):
     """Delete key archives immediately when lode has no worktree directory."""
-    from hopper.tui import LodeTable
-
-    sessions = [{"id": "aaaa1111", "stage": "mill", "created_at": 1000}]
+    sessions = mill_lodes(1)
     server = MockServer(sessions)
     app = HopperApp(server=server)
 
-    worktree_path = MagicMock()
-    worktree_path.is_dir.return_value = False
-
+    focus(LODE_TABLE)
     with (
-        patch.object(HopperApp, "focused", new_callable=PropertyMock, return_value=LodeTable()),
         patch.object(app, "_get_selected_lode_id", return_value="aaaa1111"),
-        patch("hopper.tui.get_worktree_dir", return_value=worktree_path),
         patch.object(app, "push_screen") as mock_push,
     ):
         app.action_delete()
@@ -2197,454 +1502,197 @@ def test_action_delete_archives_immediately_without_worktree():
     mock_push.assert_not_called()
 
 
-def test_action_delete_archives_immediately_with_empty_diff():
+def test_action_delete_archives_immediately_with_empty_diff(focus):
     """Delete key archives immediately when worktree diff stat is empty (merged)."""
-    from hopper.tui import LodeTable
-
     sessions = [{"id": "aaaa1111", "stage": "refine", "created_at": 1000}]
     server = MockServer(sessions)
     app = HopperApp(server=server)
+    get_worktree_dir("aaaa1111").mkdir(parents=True)
 
-    worktree_path = MagicMock()
-    worktree_path.is_dir.return_value = True
-    worktree_path.__str__.return_value = "/fake/worktree"
-
+    focus(LODE_TABLE)
     with (
-        patch.object(HopperApp, "focused", new_callable=PropertyMock, return_value=LodeTable()),
         patch.object(app, "_get_selected_lode_id", return_value="aaaa1111"),
-        patch("hopper.tui.get_worktree_dir", return_value=worktree_path),
         patch("hopper.tui.get_diff_stat", return_value=""),
         patch.object(app, "push_screen") as mock_push,
     ):
         app.action_delete()
 
     assert server.events == [{"type": "lode_archive", "lode_id": "aaaa1111"}]
-    mock_push.assert_not_called()
-
-
-def test_action_delete_cancel_does_not_archive():
-    """Cancelling the archive confirmation modal does not archive the lode."""
-    from hopper.tui import LodeTable
-
-    sessions = [{"id": "aaaa1111", "stage": "refine", "created_at": 1000}]
-    server = MockServer(sessions)
-    app = HopperApp(server=server)
-    fake_diff = " file.py | 5 ++---"
-
-    worktree_path = MagicMock()
-    worktree_path.is_dir.return_value = True
-    worktree_path.__str__.return_value = "/fake/worktree"
-
-    with (
-        patch.object(HopperApp, "focused", new_callable=PropertyMock, return_value=LodeTable()),
-        patch.object(app, "_get_selected_lode_id", return_value="aaaa1111"),
-        patch("hopper.tui.get_worktree_dir", return_value=worktree_path),
-        patch("hopper.tui.get_diff_stat", return_value=fake_diff),
-        patch.object(app, "push_screen") as mock_push,
-    ):
-        app.action_delete()
-        callback = mock_push.call_args.args[1]
-        callback(None)
-
-    assert server.events == []
-
-
-def test_action_delete_removes_backlog():
-    """Delete key shows confirmation before removing backlog item."""
-    from hopper.backlog import BacklogItem
-    from hopper.tui import BacklogRemoveScreen, BacklogTable
-
-    items = [
-        BacklogItem(id="bl111111", project="proj", description="To delete", created_at=1000),
-    ]
-    server = MockServer([], backlog=items)
-    app = HopperApp(server=server)
-    with (
-        patch.object(HopperApp, "focused", new_callable=PropertyMock, return_value=BacklogTable()),
-        patch.object(app, "_get_selected_backlog_id", return_value="bl111111"),
-        patch.object(app, "push_screen") as mock_push,
-    ):
-        app.action_delete()
-        mock_push.assert_called_once()
-        screen_arg = mock_push.call_args.args[0]
-        assert isinstance(screen_arg, BacklogRemoveScreen)
-        callback = mock_push.call_args.args[1]
-        callback(True)
-    assert server.events == [{"type": "backlog_remove", "item_id": "bl111111"}]
-
-
-def test_action_delete_backlog_cancel_does_not_remove():
-    """Cancelling the backlog remove confirmation does not remove the item."""
-    from hopper.backlog import BacklogItem
-    from hopper.tui import BacklogTable
-
-    items = [
-        BacklogItem(id="bl111111", project="proj", description="To delete", created_at=1000),
-    ]
-    server = MockServer([], backlog=items)
-    app = HopperApp(server=server)
-    with (
-        patch.object(HopperApp, "focused", new_callable=PropertyMock, return_value=BacklogTable()),
-        patch.object(app, "_get_selected_backlog_id", return_value="bl111111"),
-        patch.object(app, "push_screen") as mock_push,
-    ):
-        app.action_delete()
-        callback = mock_push.call_args.args[1]
-        callback(None)
-    assert server.events == []
-
-
-def test_action_delete_noop_when_neither_focused():
-    """Delete key should noop when focus is not lode/backlog table."""
-    server = MockServer()
-    app = HopperApp(server=server)
-    with (
-        patch.object(HopperApp, "focused", new_callable=PropertyMock, return_value=object()),
-    ):
-        app.action_delete()
-    assert server.events == []
-
-
-def test_format_diff_stat():
-    """format_diff_stat colorizes +/- characters."""
-    from rich.text import Text
-
-    from hopper.tui import format_diff_stat
-
-    result = format_diff_stat(" file.py | 3 ++-")
-    assert isinstance(result, Text)
-    plain = result.plain
-    assert "file.py" in plain
-    assert "+" in plain
-    assert "-" in plain
-
-
-def test_format_diff_stat_empty():
-    """format_diff_stat returns 'No changes' for empty input."""
-    from hopper.tui import format_diff_stat
-
-    result = format_diff_stat("")
-    assert "No changes" in result.plain
-
-
-# Tests for BacklogEditScreen
-
-
-class BacklogEditTestApp(App):
-    """Test app wrapper for BacklogEditScreen."""
-
-    def __init__(self, initial_text: str = ""):
-        super().__init__()
-        self.edit_result = "not_set"  # sentinel value
-        self._initial_text = initial_text
-
-    def on_mount(self) -> None:
-        from hopper.tui import BacklogEditScreen
-
-        def capture_result(r):
-            self.edit_result = r
-
-        self.push_screen(BacklogEditScreen(initial_text=self._initial_text), capture_result)
-
-
-@pytest.mark.asyncio
-async def test_backlog_edit_prefills_text():
-    """BacklogEditScreen should show pre-filled text."""
-    from textual.widgets import TextArea
-
-    app = BacklogEditTestApp(initial_text="Existing description")
-    async with app.run_test():
-        ta = app.screen.query_one(TextArea)
-        assert ta.text == "Existing description"
-
-
-@pytest.mark.asyncio
-async def test_backlog_edit_cancel_escape():
-    """Escape should dismiss the edit screen with None."""
-    app = BacklogEditTestApp(initial_text="Some text")
-    async with app.run_test() as pilot:
-        await pilot.press("escape")
-        assert app.edit_result is None
-
-
-@pytest.mark.asyncio
-async def test_backlog_edit_save():
-    """Save button should return ('save', text)."""
-    from textual.widgets import TextArea
-
-    app = BacklogEditTestApp(initial_text="Original")
-    async with app.run_test() as pilot:
-        ta = app.screen.query_one(TextArea)
-        ta.clear()
-        ta.insert("Updated text")
-        # Tab to Cancel, Promote, Save (3rd button)
-        await pilot.press("tab")  # Cancel
-        await pilot.press("tab")  # Promote
-        await pilot.press("tab")  # Save
-        await pilot.press("enter")
-        assert app.edit_result == ("save", "Updated text")
-
-
-@pytest.mark.asyncio
-async def test_backlog_edit_promote():
-    """Promote button should return ('promote', text)."""
-    from textual.widgets import TextArea
-
-    app = BacklogEditTestApp(initial_text="Task to promote")
-    async with app.run_test() as pilot:
-        ta = app.screen.query_one(TextArea)
-        assert ta.text == "Task to promote"
-        # Tab to Cancel, then Promote (2nd button)
-        await pilot.press("tab")  # Cancel
-        await pilot.press("tab")  # Promote
-        await pilot.press("enter")
-        assert app.edit_result == ("promote", "Task to promote")
-
-
-@pytest.mark.asyncio
-async def test_backlog_edit_empty_validation():
-    """Empty text should not submit."""
-    app = BacklogEditTestApp(initial_text="")
-    async with app.run_test() as pilot:
-        # Tab to Save button
-        await pilot.press("tab")  # Cancel
-        await pilot.press("tab")  # Promote
-        await pilot.press("tab")  # Save
-        await pilot.press("enter")
-        assert app.edit_result == "not_set"
-
-
-@pytest.mark.asyncio
-async def test_backlog_edit_arrow_navigation():
-    """Arrow keys should navigate between buttons."""
-    app = BacklogEditTestApp(initial_text="Text")
-    async with app.run_test() as pilot:
-        await pilot.press("tab")
-        assert app.screen.focused.id == "btn-cancel"
-        await pilot.press("right")
-        assert app.screen.focused.id == "btn-promote"
-        await pilot.press("right")
-        assert app.screen.focused.id == "btn-save"
-        await pilot.press("right")  # wraps
-        assert app.screen.focused.id == "btn-cancel"
-
-
-@pytest.mark.asyncio
-async def test_backlog_edit_ctrl_enter_submit():
-    """Ctrl+Enter should submit using Save."""
-    from textual.widgets import TextArea
-
-    app = BacklogEditTestApp(initial_text="Original")
-    async with app.run_test() as pilot:
-        ta = app.screen.query_one(TextArea)
-        ta.clear()
-        ta.insert("Updated text")
-        await pilot.press("ctrl+enter")
-        assert app.edit_result == ("save", "Updated text")
-
+    mock_push.assert_not_called()
 
-@pytest.mark.asyncio
-async def test_enter_on_backlog_item_opens_edit(temp_config):
-    """Enter on a backlog item should open BacklogEditScreen."""
-    from hopper.backlog import BacklogItem
-    from hopper.tui import BacklogEditScreen
 
-    items = [
-        BacklogItem(id="bl111111", project="proj", description="Edit me", created_at=1000),
-    ]
-    server = MockServer([], backlog=items)
+def test_action_delete_cancel_does_not_archive(focus):
+    """Cancelling the archive confirmation modal does not archive the lode."""
+    sessions = [{"id": "aaaa1111", "stage": "refine", "created_at": 1000}]
+    server = MockServer(sessions)
     app = HopperApp(server=server)
-    async with app.run_test() as pilot:
-        await pilot.press("tab")
-        await pilot.press("tab")  # Focus backlog table
-        await pilot.press("enter")  # Enter on first item
-        assert isinstance(app.screen, BacklogEditScreen)
+    fake_diff = " file.py | 5 ++---"
+    get_worktree_dir("aaaa1111").mkdir(parents=True)
 
+    focus(LODE_TABLE)
+    with (
+        patch.object(app, "_get_selected_lode_id", return_value="aaaa1111"),
+        patch("hopper.tui.get_diff_stat", return_value=fake_diff),
+        patch.object(app, "push_screen") as mock_push,
+    ):
+        app.action_delete()
+        callback = mock_push.call_args.args[1]
+        callback(None)
 
-@pytest.mark.asyncio
-async def test_backlog_edit_save_updates_item(temp_config):
-    """Saving from edit modal should enqueue backlog_update."""
-    from textual.widgets import TextArea
+    assert server.events == []
 
-    from hopper.backlog import BacklogItem
-    from hopper.tui import BacklogEditScreen
 
-    items = [
-        BacklogItem(id="bl111111", project="proj", description="Original", created_at=1000),
-    ]
+def test_action_delete_removes_backlog(focus):
+    """Delete key shows confirmation before removing backlog item."""
+    items = [replace(BACKLOG_ITEM, description="To delete")]
     server = MockServer([], backlog=items)
     app = HopperApp(server=server)
-    async with app.run_test() as pilot:
-        await pilot.press("tab")
-        await pilot.press("tab")
-        await pilot.press("enter")
-        assert isinstance(app.screen, BacklogEditScreen)
-        ta = app.screen.query_one(TextArea)
-        assert ta.text == "Original"
-        ta.clear()
-        ta.insert("Updated")
-        # Tab to Save (3rd button)
-        await pilot.press("tab")  # Cancel
-        await pilot.press("tab")  # Promote
-        await pilot.press("tab")  # Save
-        await pilot.press("enter")
-        assert server.events == [
-            {"type": "backlog_update", "item_id": "bl111111", "description": "Updated"}
-        ]
-
-
-@pytest.mark.asyncio
-async def test_backlog_promote_creates_session(monkeypatch, temp_config):
-    """Promote should enqueue lode_promote_backlog."""
-    from textual.widgets import TextArea
+    focus(BACKLOG_TABLE)
+    with (
+        patch.object(app, "_get_selected_backlog_id", return_value="bl111111"),
+        patch.object(app, "push_screen") as mock_push,
+    ):
+        app.action_delete()
+        mock_push.assert_called_once()
+        screen_arg = mock_push.call_args.args[0]
+        assert isinstance(screen_arg, BacklogRemoveScreen)
+        callback = mock_push.call_args.args[1]
+        callback(True)
+    assert server.events == [{"type": "backlog_remove", "item_id": "bl111111"}]
 
-    from hopper.backlog import BacklogItem
-    from hopper.tui import BacklogEditScreen
 
-    items = [
-        BacklogItem(id="bl111111", project="testproj", description="Promote me", created_at=1000),
-    ]
+def test_action_delete_backlog_cancel_does_not_remove(focus):
+    """Cancelling the backlog remove confirmation does not remove the item."""
+    items = [replace(BACKLOG_ITEM, description="To delete")]
     server = MockServer([], backlog=items)
     app = HopperApp(server=server)
+    focus(BACKLOG_TABLE)
+    with (
+        patch.object(app, "_get_selected_backlog_id", return_value="bl111111"),
+        patch.object(app, "push_screen") as mock_push,
+    ):
+        app.action_delete()
+        callback = mock_push.call_args.args[1]
+        callback(None)
+    assert server.events == []
 
-    async with app.run_test() as pilot:
-        await pilot.press("tab")
-        await pilot.press("tab")
-        await pilot.press("enter")
-        assert isinstance(app.screen, BacklogEditScreen)
-        ta = app.screen.query_one(TextArea)
-        assert ta.text == "Promote me"
-        # Tab to Promote (2nd button)
-        await pilot.press("tab")  # Cancel
-        await pilot.press("tab")  # Promote
-        await pilot.press("enter")
 
-        assert server.events == [
-            {"type": "lode_promote_backlog", "item_id": "bl111111", "scope": "Promote me"}
-        ]
+def test_action_delete_noop_when_neither_focused(focus):
+    """Delete key should noop when focus is not lode/backlog table."""
+    server = MockServer()
+    app = HopperApp(server=server)
+    focus(object())
+    app.action_delete()
+    assert server.events == []
 
 
-# Tests for MillReviewScreen
+# Tests for BacklogEditScreen and MillReviewScreen
 
+# Both screens share one button row: Cancel, a screen-specific second action, Save
+EDIT_SCREENS = pytest.mark.parametrize(
+    "screen_cls,second",
+    [(BacklogEditScreen, "promote"), (MillReviewScreen, "process")],
+)
 
-class MillReviewTestApp(App):
-    """Test app wrapper for MillReviewScreen."""
 
-    def __init__(self, initial_text: str = ""):
-        super().__init__()
-        self.review_result = "not_set"  # sentinel value
-        self._initial_text = initial_text
+@EDIT_SCREENS
+async def test_edit_screen_prefills_text(open_screen, screen_cls, second):
+    """The edit screen should show pre-filled text."""
+    pilot, _ = await open_screen(screen_cls(initial_text="Existing description"))
+    assert pilot.app.screen.text_area.text == "Existing description"
 
-    def on_mount(self) -> None:
-        from hopper.tui import MillReviewScreen
 
-        def capture_result(r):
-            self.review_result = r
+@EDIT_SCREENS
+async def test_edit_screen_cancel_escape(open_screen, screen_cls, second):
+    """Escape should dismiss the edit screen with None."""
+    pilot, result = await open_screen(screen_cls(initial_text="Some text"))
+    await pilot.press("escape")
+    assert await result is None
 
-        self.push_screen(MillReviewScreen(initial_text=self._initial_text), capture_result)
 
+@EDIT_SCREENS
+async def test_edit_screen_save(open_screen, screen_cls, second):
+    """Save button should return ('save', text)."""
+    pilot, result = await open_screen(screen_cls(initial_text="Original"))
+    pilot.app.screen.text_area.load_text("Updated text")
+    await pilot.press("tab", "tab", "tab", "enter")  # Cancel, second, Save
+    assert await result == ("save", "Updated text")
 
-@pytest.mark.asyncio
-async def test_mill_review_prefills_text():
-    """MillReviewScreen should show pre-filled text."""
-    from textual.widgets import TextArea
 
-    app = MillReviewTestApp(initial_text="Mill output content")
-    async with app.run_test():
-        ta = app.screen.query_one(TextArea)
-        assert ta.text == "Mill output content"
+@EDIT_SCREENS
+async def test_edit_screen_second_button(open_screen, screen_cls, second):
+    """The second button should return (second, text)."""
+    pilot, result = await open_screen(screen_cls(initial_text="Task text"))
+    await pilot.press("tab", "tab", "enter")  # Cancel, second
+    assert await result == (second, "Task text")
 
 
-@pytest.mark.asyncio
-async def test_mill_review_cancel_escape():
-    """Escape should dismiss the review screen with None."""
-    app = MillReviewTestApp(initial_text="Some text")
-    async with app.run_test() as pilot:
-        await pilot.press("escape")
-        assert app.review_result is None
+@EDIT_SCREENS
+async def test_edit_screen_empty_validation(open_screen, screen_cls, second):
+    """Empty text should not submit."""
+    pilot, result = await open_screen(screen_cls(initial_text=""))
+    await pilot.press("tab", "tab", "tab", "enter")  # Cancel, second, Save
+    assert not result.done()
 
 
-@pytest.mark.asyncio
-async def test_mill_review_save():
-    """Save button should return ('save', text)."""
-    from textual.widgets import TextArea
+@EDIT_SCREENS
+async def test_edit_screen_arrow_navigation(open_screen, screen_cls, second):
+    """Arrow keys should navigate between buttons."""
+    pilot, _ = await open_screen(screen_cls(initial_text="Text"))
+    trail = await press_focus_trail(pilot, "tab", "right", "right", "right")
+    assert trail == ["btn-cancel", f"btn-{second}", "btn-save", "btn-cancel"]  # last wraps
 
-    app = MillReviewTestApp(initial_text="Original prompt")
-    async with app.run_test() as pilot:
-        ta = app.screen.query_one(TextArea)
-        ta.clear()
-        ta.insert("Edited prompt")
-        # Tab to Cancel, Process, Save (3rd button)
-        await pilot.press("tab")  # Cancel
-        await pilot.press("tab")  # Process
-        await pilot.press("tab")  # Save
-        await pilot.press("enter")
-        assert app.review_result == ("save", "Edited prompt")
 
+@EDIT_SCREENS
+async def test_edit_screen_ctrl_enter_submit(open_screen, screen_cls, second):
+    """Ctrl+Enter should submit using Save."""
+    pilot, result = await open_screen(screen_cls(initial_text="Original"))
+    pilot.app.screen.text_area.load_text("Updated text")
+    await pilot.press("ctrl+enter")
+    assert await result == ("save", "Updated text")
 
-@pytest.mark.asyncio
-async def test_mill_review_process():
-    """Process button should return ('process', text)."""
-    from textual.widgets import TextArea
 
-    app = MillReviewTestApp(initial_text="Process this prompt")
+@pytest.fixture
+async def backlog_edit():
+    """Open BacklogEditScreen from a one-item backlog; yields (server, pilot, screen)."""
+    server = MockServer([], backlog=[replace(BACKLOG_ITEM, description="Original")])
+    app = HopperApp(server=server)
     async with app.run_test() as pilot:
-        ta = app.screen.query_one(TextArea)
-        assert ta.text == "Process this prompt"
-        # Tab to Cancel, then Process (2nd button)
-        await pilot.press("tab")  # Cancel
-        await pilot.press("tab")  # Process
-        await pilot.press("enter")
-        assert app.review_result == ("process", "Process this prompt")
+        await pilot.press("tab", "tab", "enter")  # Focus backlog table, Enter on first item
+        screen = await wait_for_screen(app, BacklogEditScreen)
+        yield server, pilot, screen
 
 
-@pytest.mark.asyncio
-async def test_mill_review_empty_validation():
-    """Empty text should not submit."""
-    app = MillReviewTestApp(initial_text="")
-    async with app.run_test() as pilot:
-        await pilot.press("tab")  # Cancel
-        await pilot.press("tab")  # Process
-        await pilot.press("tab")  # Save
-        await pilot.press("enter")
-        assert app.review_result == "not_set"
+async def test_enter_on_backlog_item_opens_edit(backlog_edit):
+    """Enter on a backlog item should open BacklogEditScreen with its description."""
+    _, _, screen = backlog_edit
+    assert screen.text_area.text == "Original"
 
 
-@pytest.mark.asyncio
-async def test_mill_review_arrow_navigation():
-    """Arrow keys should navigate between buttons."""
-    app = MillReviewTestApp(initial_text="Text")
-    async with app.run_test() as pilot:
-        await pilot.press("tab")
-        assert app.screen.focused.id == "btn-cancel"
-        await pilot.press("right")
-        assert app.screen.focused.id == "btn-process"
-        await pilot.press("right")
-        assert app.screen.focused.id == "btn-save"
-        await pilot.press("right")  # wraps
-        assert app.screen.focused.id == "btn-cancel"
+async def test_backlog_edit_save_updates_item(backlog_edit):
+    """Saving from edit modal should enqueue backlog_update."""
+    server, pilot, screen = backlog_edit
+    screen.text_area.load_text("Updated")
+    await pilot.press("tab", "tab", "tab", "enter")  # Cancel, Promote, Save
+    assert server.events == [
+        {"type": "backlog_update", "item_id": "bl111111", "description": "Updated"}
+    ]
 
 
-@pytest.mark.asyncio
-async def test_mill_review_ctrl_enter_submit():
-    """Ctrl+Enter should submit using Save."""
-    from textual.widgets import TextArea
+async def test_backlog_promote_creates_session(backlog_edit):
+    """Promote should enqueue lode_promote_backlog."""
+    server, pilot, _ = backlog_edit
+    await pilot.press("tab", "tab", "enter")  # Cancel, Promote
+    assert server.events == [
+        {"type": "lode_promote_backlog", "item_id": "bl111111", "scope": "Original"}
+    ]
 
-    app = MillReviewTestApp(initial_text="Original prompt")
-    async with app.run_test() as pilot:
-        ta = app.screen.query_one(TextArea)
-        ta.clear()
-        ta.insert("test review")
-        await pilot.press("ctrl+enter")
-        assert app.review_result == ("save", "test review")
+
+# Tests for MillReviewScreen
 
 
-@pytest.mark.asyncio
-async def test_enter_on_refine_ready_opens_mill_review(temp_config):
+async def test_enter_on_refine_ready_opens_mill_review():
     """Enter on a refine/ready session should open MillReviewScreen."""
-    from hopper.lodes import get_lode_dir
-    from hopper.tui import MillReviewScreen
-
     session = {"id": "aaaa1111", "stage": "refine", "state": "ready", "created_at": 1000}
     # Write mill_out.md for this session
     session_dir = get_lode_dir(session["id"])
@@ -2656,20 +1704,12 @@ async def test_enter_on_refine_ready_opens_mill_review(temp_config):
     async with app.run_test() as pilot:
         await pilot.press("enter")
         assert isinstance(app.screen, MillReviewScreen)
-        from textual.widgets import TextArea
-
-        ta = app.screen.query_one(TextArea)
+        ta = app.screen.text_area
         assert ta.text == "The mill output"
 
 
-@pytest.mark.asyncio
-async def test_mill_review_save_writes_file(temp_config):
+async def test_mill_review_save_writes_file():
     """Save from review should write edited text back to mill_out.md."""
-    from textual.widgets import TextArea
-
-    from hopper.lodes import get_lode_dir
-    from hopper.tui import MillReviewScreen
-
     session = {"id": "aaaa1111", "stage": "refine", "state": "ready", "created_at": 1000}
     session_dir = get_lode_dir(session["id"])
     session_dir.mkdir(parents=True, exist_ok=True)
@@ -2680,24 +1720,14 @@ async def test_mill_review_save_writes_file(temp_config):
     async with app.run_test() as pilot:
         await pilot.press("enter")
         assert isinstance(app.screen, MillReviewScreen)
-        ta = app.screen.query_one(TextArea)
-        ta.clear()
-        ta.insert("Edited mill output")
-        await pilot.press("tab")  # Cancel
-        await pilot.press("tab")  # Process
-        await pilot.press("tab")  # Save
-        await pilot.press("enter")
+        ta = app.screen.text_area
+        ta.load_text("Edited mill output")
+        await pilot.press("tab", "tab", "tab", "enter")  # Cancel, Process, Save
         assert (session_dir / "mill_out.md").read_text() == "Edited mill output"
 
 
-@pytest.mark.asyncio
-async def test_mill_review_process_spawns_refine(monkeypatch, temp_config):
+async def test_mill_review_process_spawns_refine(no_project):
     """Process writes the file and enqueues a background spawn."""
-    from textual.widgets import TextArea
-
-    from hopper.lodes import get_lode_dir
-    from hopper.tui import MillReviewScreen
-
     session = {
         "id": "aaaa1111",
         "stage": "refine",
@@ -2709,21 +1739,16 @@ async def test_mill_review_process_spawns_refine(monkeypatch, temp_config):
     session_dir.mkdir(parents=True, exist_ok=True)
     (session_dir / "mill_out.md").write_text("Mill output content")
 
-    monkeypatch.setattr("hopper.tui.find_project", lambda name: None)
-
     server = MockServer([session])
     app = HopperApp(server=server)
     async with app.run_test() as pilot:
         await pilot.press("enter")
         assert isinstance(app.screen, MillReviewScreen)
-        ta = app.screen.query_one(TextArea)
+        ta = app.screen.text_area
         assert ta.text == "Mill output content"
-        ta.clear()
-        ta.insert("Edited for processing")
+        ta.load_text("Edited for processing")
         # Tab to Process button
-        await pilot.press("tab")  # Cancel
-        await pilot.press("tab")  # Process
-        await pilot.press("enter")
+        await pilot.press("tab", "tab", "enter")  # Cancel, Process
 
         # File should be updated
         assert (session_dir / "mill_out.md").read_text() == "Edited for processing"
@@ -2732,12 +1757,9 @@ async def test_mill_review_process_spawns_refine(monkeypatch, temp_config):
         ]
 
 
-@pytest.mark.asyncio
-async def test_enter_on_non_ready_refine_spawns_directly(monkeypatch, temp_config):
+async def test_enter_on_non_ready_refine_spawns_directly(no_project):
     """Enter on an inactive refine session enqueues a background spawn."""
     session = {"id": "aaaa1111", "stage": "refine", "state": "running", "created_at": 1000}
-    monkeypatch.setattr("hopper.tui.find_project", lambda name: None)
-
     server = MockServer([session])
     app = HopperApp(server=server)
     async with app.run_test() as pilot:
@@ -2750,335 +1772,204 @@ async def test_enter_on_non_ready_refine_spawns_directly(monkeypatch, temp_confi
 # Tests for LegendScreen
 
 
-@pytest.mark.asyncio
-async def test_legend_opens_with_l_key():
+async def test_legend_opens_with_l_key(running_app):
     """Pressing l should open the legend modal."""
-    app = HopperApp()
-    async with app.run_test() as pilot:
-        await pilot.press("l")
-        assert isinstance(app.screen, LegendScreen)
+    app, pilot = running_app
+    await pilot.press("l")
+    assert isinstance(app.screen, LegendScreen)
+    await pilot.press("escape")
 
 
-@pytest.mark.asyncio
-async def test_legend_dismiss_with_escape():
+async def test_legend_dismiss_with_escape(running_app):
     """Escape should dismiss the legend modal."""
-    app = HopperApp()
-    async with app.run_test() as pilot:
-        await pilot.press("l")
-        assert isinstance(app.screen, LegendScreen)
-        await pilot.press("escape")
-        assert not isinstance(app.screen, LegendScreen)
+    app, pilot = running_app
+    await pilot.press("l")
+    assert isinstance(app.screen, LegendScreen)
+    await pilot.press("escape")
+    assert not isinstance(app.screen, LegendScreen)
 
 
-@pytest.mark.asyncio
-async def test_legend_contains_all_symbols():
+async def test_legend_contains_all_symbols(running_app):
     """Legend should contain all status symbols."""
-    from textual.widgets import Static
-
-    app = HopperApp()
-    async with app.run_test() as pilot:
-        await pilot.press("l")
-        body = app.screen.query_one("#legend-body", Static)
-        text = str(body.render())
-        assert STATUS_RUNNING in text
-        assert STATUS_STUCK in text
-        assert STATUS_ERROR in text
-        assert STATUS_NEW in text
-        assert STATUS_SHIPPED in text
-        assert STATUS_DISCONNECTED in text
+    app, pilot = running_app
+    await pilot.press("l")
+    body = app.screen.query_one("#legend-body", Static)
+    text = str(body.content)
+    await pilot.press("escape")
+    needed = {
+        STATUS_RUNNING,
+        STATUS_STUCK,
+        STATUS_ERROR,
+        STATUS_NEW,
+        STATUS_GATED,
+        STATUS_SHIPPED,
+        STATUS_DISCONNECTED,
+    }
+    missing = {symbol for symbol in needed if symbol not in text}
+    assert not missing, f"Missing legend symbols: {missing}"
 
 
 # Tests for ShipReviewScreen
 
 
-class ShipReviewTestApp(App):
-    """Test app wrapper for ShipReviewScreen."""
-
-    def __init__(self, diff_stat: str = ""):
-        super().__init__()
-        self.review_result = "not_set"  # sentinel value
-        self._diff_stat = diff_stat
-
-    def on_mount(self) -> None:
-        from hopper.tui import ShipReviewScreen
-
-        def capture_result(r):
-            self.review_result = r
-
-        self.push_screen(ShipReviewScreen(diff_stat=self._diff_stat), capture_result)
-
-
-class GateReviewTestApp(App):
-    """Test app wrapper for GateReviewScreen."""
-
-    def __init__(self, gate_text: str = "", pane_alive: bool = True):
-        super().__init__()
-        self.review_result = "not_set"  # sentinel value
-        self._gate_text = gate_text
-        self._pane_alive = pane_alive
-
-    def on_mount(self) -> None:
-        from hopper.tui import GateReviewScreen
-
-        def capture_result(r):
-            self.review_result = r
-
-        self.push_screen(
-            GateReviewScreen(gate_text=self._gate_text, pane_alive=self._pane_alive),
-            capture_result,
-        )
-
-
-class ShippedReviewTestApp(App):
-    """Test app wrapper for ShippedReviewScreen."""
-
-    def __init__(self, content: str = "", lode_title: str = ""):
-        super().__init__()
-        self.review_result = "not_set"  # sentinel value
-        self._content = content
-        self._lode_title = lode_title
+@pytest.fixture
+def ship_diff(monkeypatch):
+    """Make get_diff_stat report SHIP_DIFF for every worktree."""
+    monkeypatch.setattr(tui, "get_diff_stat", lambda worktree: SHIP_DIFF)
 
-    def on_mount(self) -> None:
-        from hopper.tui import ShippedReviewScreen
 
-        def capture_result(r):
-            self.review_result = r
-
-        self.push_screen(
-            ShippedReviewScreen(content=self._content, lode_title=self._lode_title),
-            capture_result,
-        )
+@pytest.fixture
+def ship_ready_lode(ship_diff):
+    """A ship/ready lode with a worktree on disk, so enter opens ShipReviewScreen."""
+    lode = {
+        "id": "aaaa1111",
+        "stage": "ship",
+        "state": "ready",
+        "created_at": 1000,
+        "project": "testproj",
+    }
+    (get_lode_dir(lode["id"]) / "worktree").mkdir(parents=True)
+    return lode
 
 
-@pytest.mark.asyncio
-async def test_ship_review_shows_diff_stat():
+async def test_ship_review_shows_diff_stat(open_screen):
     """ShipReviewScreen should display the diff stat."""
-    from textual.widgets import Static
-
     diff = " file.py | 10 ++++------\n 1 file changed"
-    app = ShipReviewTestApp(diff_stat=diff)
-    async with app.run_test():
-        body = app.screen.query_one("#ship-diff", Static)
-        text = str(body.render())
-        assert "file.py" in text
+    pilot, _ = await open_screen(ShipReviewScreen(diff_stat=diff))
+    body = pilot.app.screen.query_one("#ship-diff", Static)
+    text = str(body.content)
+    assert "file.py" in text
 
 
-@pytest.mark.asyncio
-async def test_ship_review_shows_no_changes():
+async def test_ship_review_shows_no_changes(open_screen):
     """ShipReviewScreen should show 'No changes' when diff is empty."""
-    from textual.widgets import Static
-
-    app = ShipReviewTestApp(diff_stat="")
-    async with app.run_test():
-        body = app.screen.query_one("#ship-diff", Static)
-        text = str(body.render())
-        assert "No changes" in text
+    pilot, _ = await open_screen(ShipReviewScreen(diff_stat=""))
+    body = pilot.app.screen.query_one("#ship-diff", Static)
+    text = str(body.content)
+    assert "No changes" in text
 
 
-@pytest.mark.asyncio
-async def test_ship_review_cancel_escape():
+async def test_ship_review_cancel_escape(open_screen):
     """Escape should dismiss the review screen with None."""
-    app = ShipReviewTestApp(diff_stat="file.py | 1 +")
-    async with app.run_test() as pilot:
-        await pilot.press("escape")
-        assert app.review_result is None
+    pilot, result = await open_screen(ShipReviewScreen(diff_stat=SHIP_DIFF))
+    await pilot.press("escape")
+    assert await result is None
 
 
-@pytest.mark.asyncio
-async def test_ship_review_cancel_button():
+async def test_ship_review_cancel_button(open_screen):
     """Cancel button should dismiss with None."""
-    app = ShipReviewTestApp(diff_stat="file.py | 1 +")
-    async with app.run_test() as pilot:
-        await pilot.press("left")  # Ship -> Refine
-        await pilot.press("left")  # Refine -> Cancel
-        await pilot.press("enter")
-        assert app.review_result is None
+    pilot, result = await open_screen(ShipReviewScreen(diff_stat=SHIP_DIFF))
+    await pilot.press("left", "left", "enter")  # Ship -> Refine, Refine -> Cancel
+    assert await result is None
 
 
-@pytest.mark.asyncio
-async def test_ship_review_ship_button():
+async def test_ship_review_ship_button(open_screen):
     """Ship button should return 'ship'."""
-    app = ShipReviewTestApp(diff_stat="file.py | 1 +")
-    async with app.run_test() as pilot:
-        # Ship button is focused by default
-        await pilot.press("enter")
-        assert app.review_result == "ship"
+    pilot, result = await open_screen(ShipReviewScreen(diff_stat=SHIP_DIFF))
+    # Ship button is focused by default
+    await pilot.press("enter")
+    assert await result == "ship"
 
 
-@pytest.mark.asyncio
-async def test_ship_review_refine_button():
+async def test_ship_review_refine_button(open_screen):
     """Refine button should return 'refine'."""
-    app = ShipReviewTestApp(diff_stat="file.py | 1 +")
-    async with app.run_test() as pilot:
-        await pilot.press("left")  # Ship -> Refine
-        await pilot.press("enter")
-        assert app.review_result == "refine"
+    pilot, result = await open_screen(ShipReviewScreen(diff_stat=SHIP_DIFF))
+    await pilot.press("left", "enter")  # Ship -> Refine
+    assert await result == "refine"
 
 
-@pytest.mark.asyncio
-async def test_ship_review_arrow_navigation():
+async def test_ship_review_arrow_navigation(open_screen):
     """Arrow keys should navigate between buttons."""
-    app = ShipReviewTestApp(diff_stat="file.py | 1 +")
-    async with app.run_test() as pilot:
-        # Ship is focused by default
-        assert app.screen.focused.id == "btn-ship"
-        await pilot.press("left")
-        assert app.screen.focused.id == "btn-refine"
-        await pilot.press("left")
-        assert app.screen.focused.id == "btn-cancel"
-        await pilot.press("left")  # wraps
-        assert app.screen.focused.id == "btn-ship"
-        await pilot.press("right")  # wraps other way
-        assert app.screen.focused.id == "btn-cancel"
+    pilot, _ = await open_screen(ShipReviewScreen(diff_stat=SHIP_DIFF))
+    # Ship is focused by default
+    assert pilot.app.screen.focused.id == "btn-ship"
+    trail = await press_focus_trail(pilot, "left", "left", "left", "right")
+    assert trail == [
+        "btn-refine",
+        "btn-cancel",
+        "btn-ship",  # left wraps
+        "btn-cancel",  # right wraps the other way
+    ]
 
 
-@pytest.mark.asyncio
-async def test_enter_on_ship_ready_opens_ship_review(temp_config):
+async def test_enter_on_ship_ready_opens_ship_review(ship_ready_lode):
     """Enter on a ship/ready session should open ShipReviewScreen."""
-    from hopper.lodes import get_lode_dir
-    from hopper.tui import ShipReviewScreen
-
-    session = {"id": "aaaa1111", "stage": "ship", "state": "ready", "created_at": 1000}
-    # Create worktree directory for this session
-    session_dir = get_lode_dir(session["id"])
-    worktree = session_dir / "worktree"
-    worktree.mkdir(parents=True, exist_ok=True)
-
-    server = MockServer([session])
+    server = MockServer([ship_ready_lode])
     app = HopperApp(server=server)
 
-    with patch("hopper.tui.get_diff_stat", return_value=" file.py | 5 +++++"):
-        async with app.run_test() as pilot:
-            await pilot.press("enter")
-            assert isinstance(app.screen, ShipReviewScreen)
+    async with app.run_test() as pilot:
+        await pilot.press("enter")
+        assert isinstance(app.screen, ShipReviewScreen)
 
 
-@pytest.mark.asyncio
-async def test_ship_review_ship_spawns_ship(monkeypatch, temp_config):
+async def test_ship_review_ship_spawns_ship(no_project, ship_ready_lode):
     """Ship from review should enqueue a background spawn."""
-    from hopper.lodes import get_lode_dir
-    from hopper.tui import ShipReviewScreen
-
-    session = {
-        "id": "aaaa1111",
-        "stage": "ship",
-        "state": "ready",
-        "created_at": 1000,
-        "project": "testproj",
-    }
-    session_dir = get_lode_dir(session["id"])
-    worktree = session_dir / "worktree"
-    worktree.mkdir(parents=True, exist_ok=True)
-
-    monkeypatch.setattr("hopper.tui.find_project", lambda name: None)
-
-    server = MockServer([session])
+    server = MockServer([ship_ready_lode])
     app = HopperApp(server=server)
 
-    with patch("hopper.tui.get_diff_stat", return_value=" file.py | 5 +++++"):
-        async with app.run_test() as pilot:
-            await pilot.press("enter")
-            assert isinstance(app.screen, ShipReviewScreen)
-            # Ship is focused by default
-            await pilot.press("enter")
+    async with app.run_test() as pilot:
+        await pilot.press("enter")
+        assert isinstance(app.screen, ShipReviewScreen)
+        # Ship is focused by default
+        await pilot.press("enter")
 
-            assert server.events == [
-                {"type": "lode_spawn", "lode_id": session["id"], "foreground": False}
-            ]
+        assert server.events == [
+            {"type": "lode_spawn", "lode_id": ship_ready_lode["id"], "foreground": False}
+        ]
 
 
-@pytest.mark.asyncio
-async def test_ship_review_refine_changes_stage_and_spawns(monkeypatch, temp_config):
+async def test_ship_review_refine_changes_stage_and_spawns(no_project, ship_ready_lode):
     """Refine from review should enqueue lode_resume_refine."""
-    from hopper.lodes import get_lode_dir
-    from hopper.tui import ShipReviewScreen
-
-    session = {
-        "id": "aaaa1111",
-        "stage": "ship",
-        "state": "ready",
-        "created_at": 1000,
-        "project": "testproj",
-    }
-    session_dir = get_lode_dir(session["id"])
-    worktree = session_dir / "worktree"
-    worktree.mkdir(parents=True, exist_ok=True)
-
-    monkeypatch.setattr("hopper.tui.find_project", lambda name: None)
-
-    server = MockServer([session])
+    server = MockServer([ship_ready_lode])
     app = HopperApp(server=server)
 
-    with patch("hopper.tui.get_diff_stat", return_value=" file.py | 5 +++++"):
-        async with app.run_test() as pilot:
-            await pilot.press("enter")
-            assert isinstance(app.screen, ShipReviewScreen)
-            await pilot.press("left")  # Ship -> Refine
-            await pilot.press("enter")
+    async with app.run_test() as pilot:
+        await pilot.press("enter")
+        assert isinstance(app.screen, ShipReviewScreen)
+        await pilot.press("left", "enter")  # Ship -> Refine
 
-            assert server.events == [{"type": "lode_resume_refine", "lode_id": "aaaa1111"}]
+        assert server.events == [{"type": "lode_resume_refine", "lode_id": "aaaa1111"}]
 
 
-@pytest.mark.asyncio
-async def test_shipped_review_has_buttons():
+async def test_shipped_review_has_buttons(open_screen):
     """ShippedReviewScreen renders Cancel and Archive buttons."""
-    from textual.widgets import Button
-
-    app = ShippedReviewTestApp(content="Done", lode_title="Ship Title")
-    async with app.run_test():
-        cancel = app.screen.query_one("#shipped-cancel", Button)
-        archive = app.screen.query_one("#shipped-archive", Button)
-        assert cancel.label == "Cancel"
-        assert archive.label == "Archive"
+    pilot, _ = await open_screen(ShippedReviewScreen(content="Done", lode_title="Ship Title"))
+    cancel = pilot.app.screen.query_one("#shipped-cancel", Button)
+    archive = pilot.app.screen.query_one("#shipped-archive", Button)
+    assert cancel.label == "Cancel"
+    assert archive.label == "Archive"
 
 
-@pytest.mark.asyncio
-async def test_shipped_review_cancel_button():
+async def test_shipped_review_cancel_button(open_screen):
     """Cancel button dismisses shipped review with None."""
-    app = ShippedReviewTestApp(content="Done")
-    async with app.run_test() as pilot:
-        # Cancel is focused by default
-        await pilot.press("enter")
-        assert app.review_result is None
+    pilot, result = await open_screen(ShippedReviewScreen(content="Done", lode_title=""))
+    # Cancel is focused by default
+    await pilot.press("enter")
+    assert await result is None
 
 
-@pytest.mark.asyncio
-async def test_shipped_review_archive_button():
+async def test_shipped_review_archive_button(open_screen):
     """Archive button dismisses shipped review with True."""
-    app = ShippedReviewTestApp(content="Done")
-    async with app.run_test() as pilot:
-        await pilot.press("right")
-        await pilot.press("enter")
-        assert app.review_result is True
-
-
-def test_action_view_files_noop_when_backlog_focused():
-    """action_view_files is a no-op when BacklogTable is focused."""
-    from hopper.tui import BacklogTable
-
-    app = HopperApp()
-    with (
-        patch.object(HopperApp, "focused", new_callable=PropertyMock, return_value=BacklogTable()),
-        patch.object(app, "_get_selected_lode_id") as mock_selected,
-        patch.object(app, "push_screen") as mock_push,
-    ):
-        app.action_view_files()
-    mock_selected.assert_not_called()
-    mock_push.assert_not_called()
-
+    pilot, result = await open_screen(ShippedReviewScreen(content="Done", lode_title=""))
+    await pilot.press("right", "enter")
+    assert await result is True
 
-def test_action_view_files_noop_when_no_lode_selected():
-    """action_view_files is a no-op when no lode is selected."""
-    from hopper.tui import LodeTable
 
+@pytest.mark.parametrize(
+    "table,looks_up_selection",
+    [(BACKLOG_TABLE, False), (LODE_TABLE, True)],
+    ids=["backlog-focused", "no-lode-selected"],
+)
+def test_action_view_files_noop(focus, table, looks_up_selection):
+    """action_view_files is a no-op off the lode table or with no lode selected."""
     app = HopperApp()
+    focus(table)
     with (
-        patch.object(HopperApp, "focused", new_callable=PropertyMock, return_value=LodeTable()),
         patch.object(app, "_get_selected_lode_id", return_value=None) as mock_selected,
         patch.object(app, "push_screen") as mock_push,
     ):
         app.action_view_files()
-    mock_selected.assert_called_once()
+    assert mock_selected.called is looks_up_selection
     mock_push.assert_not_called()
 
 
@@ -3089,68 +1980,37 @@ def test_file_viewer_screen_init(tmp_path):
     assert screen.lode_id == "test123"
 
 
-class FileViewerTestApp(App):
-    """Test app wrapper for FileViewerScreen."""
-
-    def __init__(self, lode_dir, lode_id="test123"):
-        super().__init__()
-        self._lode_dir = lode_dir
-        self._lode_id = lode_id
-
-    def on_mount(self) -> None:
-        self.push_screen(FileViewerScreen(self._lode_dir, self._lode_id))
-
-
-@pytest.mark.asyncio
-async def test_file_viewer_auto_selects_refine_out(tmp_path):
+async def test_file_viewer_auto_selects_refine_out(open_screen, tmp_path):
     """FileViewerScreen auto-displays refine_out.md on mount."""
-    from textual.widgets import Static
-
     refine_out = tmp_path / "refine_out.md"
     refine_out.write_text("# Refinement Output\nHello world")
-    app = FileViewerTestApp(tmp_path)
-    async with app.run_test():
-        screen = app.screen
-        assert screen.path == str(refine_out)
-        code_view = screen.query_one("#code-view", Static)
-        assert "Hello world" in str(code_view.content)
+    pilot, _ = await open_screen(FileViewerScreen(tmp_path, "test123"))
+    screen = pilot.app.screen
+    assert screen.path == str(refine_out)
+    code_view = screen.query_one("#code-view", Static)
+    assert "Hello world" in str(code_view.content)
 
 
-@pytest.mark.asyncio
-async def test_file_viewer_no_auto_select_without_refine_out(tmp_path):
+async def test_file_viewer_no_auto_select_without_refine_out(open_screen, tmp_path):
     """FileViewerScreen leaves path empty when refine_out.md is absent."""
-    app = FileViewerTestApp(tmp_path)
-    async with app.run_test():
-        screen = app.screen
-        assert screen.path == ""
+    pilot, _ = await open_screen(FileViewerScreen(tmp_path, "test123"))
+    screen = pilot.app.screen
+    assert screen.path == ""
 
 
-@pytest.mark.asyncio
-async def test_file_viewer_initial_file(tmp_path):
+async def test_file_viewer_initial_file(open_screen, tmp_path):
     """FileViewerScreen auto-selects initial_file when provided."""
-    from textual.app import App
-    from textual.widgets import Static
-
     gate_doc = tmp_path / "gate.md"
     gate_doc.write_text("# Design Review\nLooks good")
-
-    class TestApp(App):
-        def on_mount(self):
-            self.push_screen(FileViewerScreen(tmp_path, "test123", initial_file="gate.md"))
-
-    app = TestApp()
-    async with app.run_test():
-        screen = app.screen
-        assert screen.path == str(gate_doc)
-        code_view = screen.query_one("#code-view", Static)
-        assert "Looks good" in str(code_view.content)
+    pilot, _ = await open_screen(FileViewerScreen(tmp_path, "test123", initial_file="gate.md"))
+    screen = pilot.app.screen
+    assert screen.path == str(gate_doc)
+    code_view = screen.query_one("#code-view", Static)
+    assert "Looks good" in str(code_view.content)
 
 
-def test_review_gate_on_dismiss_noop(temp_config):
+def test_review_gate_on_dismiss_noop():
     """Reviewing a gate should not enqueue any state mutation on dismiss."""
-    from hopper.lodes import get_lode_dir
-    from hopper.tui import GateReviewScreen
-
     lode = {"id": "gate1234", "stage": "refine", "state": "gated", "created_at": 1000}
     lode_dir = get_lode_dir(lode["id"])
     lode_dir.mkdir(parents=True, exist_ok=True)
@@ -3167,9 +2027,7 @@ def test_review_gate_on_dismiss_noop(temp_config):
     assert isinstance(mock_push.call_args.args[0], GateReviewScreen)
 
 
-def test_review_gate_reopen_enqueues_foreground_spawn(temp_config):
-    from hopper.lodes import get_lode_dir
-
+def test_review_gate_reopen_enqueues_foreground_spawn():
     lode = {
         "id": "gate1234",
         "stage": "refine",
@@ -3194,48 +2052,44 @@ def test_review_gate_reopen_enqueues_foreground_spawn(temp_config):
     assert server.events == [{"type": "lode_spawn", "lode_id": "gate1234", "foreground": True}]
 
 
-@pytest.mark.asyncio
-async def test_gate_review_switch_button():
+async def test_gate_review_switch_button(open_screen):
     """GateReviewScreen should return switch when pane is alive."""
-    app = GateReviewTestApp(gate_text="# Design Review\nPlan summary", pane_alive=True)
-    async with app.run_test() as pilot:
-        assert app.screen.focused.id == "btn-switch"
-        await pilot.press("enter")
-        assert app.review_result == "switch"
+    pilot, result = await open_screen(
+        GateReviewScreen(gate_text="# Design Review\nPlan summary", pane_alive=True)
+    )
+    assert pilot.app.screen.focused.id == "btn-switch"
+    await pilot.press("enter")
+    assert await result == "switch"
 
 
-@pytest.mark.asyncio
-async def test_gate_review_reopen_when_pane_dead():
+async def test_gate_review_reopen_when_pane_dead(open_screen):
     """GateReviewScreen should offer reopen when pane capture fails."""
-    app = GateReviewTestApp(gate_text="# Design Review\nPlan summary", pane_alive=False)
-    async with app.run_test() as pilot:
-        assert list(app.screen.query("#btn-switch")) == []
-        assert app.screen.focused.id == "btn-reopen"
-        await pilot.press("enter")
-        assert app.review_result == "reopen"
+    pilot, result = await open_screen(
+        GateReviewScreen(gate_text="# Design Review\nPlan summary", pane_alive=False)
+    )
+    assert list(pilot.app.screen.query("#btn-switch")) == []
+    assert pilot.app.screen.focused.id == "btn-reopen"
+    await pilot.press("enter")
+    assert await result == "reopen"
 
 
-@pytest.mark.asyncio
-async def test_gate_review_cancel_escape():
+async def test_gate_review_cancel_escape(open_screen):
     """GateReviewScreen should dismiss with None on escape or cancel."""
-    app = GateReviewTestApp(gate_text="# Design Review\nPlan summary", pane_alive=True)
-    async with app.run_test() as pilot:
-        await pilot.press("escape")
-        assert app.review_result is None
+    pilot, result = await open_screen(
+        GateReviewScreen(gate_text="# Design Review\nPlan summary", pane_alive=True)
+    )
+    await pilot.press("escape")
+    assert await result is None
 
-    app = GateReviewTestApp(gate_text="# Design Review\nPlan summary", pane_alive=True)
-    async with app.run_test() as pilot:
-        await pilot.press("left")
-        await pilot.press("enter")
-        assert app.review_result is None
+    pilot, result = await open_screen(
+        GateReviewScreen(gate_text="# Design Review\nPlan summary", pane_alive=True)
+    )
+    await pilot.press("left", "enter")
+    assert await result is None
 
 
-@pytest.mark.asyncio
-async def test_enter_on_gated_opens_gate_review(monkeypatch, temp_config):
+async def test_enter_on_gated_opens_gate_review(monkeypatch):
     """Enter on a gated lode opens GateReviewScreen."""
-    from hopper.lodes import get_lode_dir
-    from hopper.tui import GateReviewScreen
-
     lode = {
         "id": "gate1234",
         "stage": "refine",
@@ -3256,8 +2110,7 @@ async def test_enter_on_gated_opens_gate_review(monkeypatch, temp_config):
         assert isinstance(app.screen, GateReviewScreen)
 
 
-@pytest.mark.asyncio
-async def test_gate_review_missing_gate_md(temp_config):
+async def test_gate_review_missing_gate_md():
     """Missing gate.md should notify and leave the main screen active."""
     lode = {"id": "gate1234", "stage": "refine", "state": "gated", "created_at": 1000}
     server = MockServer([lode])
@@ -3271,7 +2124,6 @@ async def test_gate_review_missing_gate_md(temp_config):
     assert server.events == []
 
 
-@pytest.mark.asyncio
 async def test_project_filter_toggle(make_lode):
     """Setting filter then calling action_filter_project clears it."""
     projects = [Project(name="alpha", path="/a")]
@@ -3292,7 +2144,6 @@ async def test_project_filter_toggle(make_lode):
         assert app._project_filter is None
 
 
-@pytest.mark.asyncio
 async def test_project_filter_lode_table(make_lode):
     """Project filter should show only matching lodes."""
     server = MockServer(
@@ -3303,7 +2154,7 @@ async def test_project_filter_lode_table(make_lode):
     )
     app = HopperApp(server=server)
     async with app.run_test():
-        table = app.query_one("#lode-table")
+        table = app.lode_table
         assert table.row_count == 3  # 2 lodes + hint
         app._project_filter = "alpha"
         app.refresh_table()
@@ -3313,29 +2164,24 @@ async def test_project_filter_lode_table(make_lode):
         assert "beta0001" not in row_keys
 
 
-@pytest.mark.asyncio
 async def test_project_filter_backlog_table():
     """Project filter should show only matching backlog items."""
     items = [
-        BacklogItem(id="bl01", project="alpha", description="task 1", created_at=1000),
-        BacklogItem(id="bl02", project="beta", description="task 2", created_at=2000),
+        replace(BACKLOG_ITEM, id="bl01", project="alpha", description="task 1"),
+        replace(BACKLOG_ITEM, id="bl02", project="beta", description="task 2", created_at=2000),
     ]
     server = MockServer(backlog=items)
     app = HopperApp(server=server)
     async with app.run_test():
-        table = app.query_one("#backlog-table")
+        table = app.backlog_table
         assert table.row_count == 3  # 2 items + hint
         app._project_filter = "alpha"
         app.refresh_backlog()
         assert table.row_count == 2  # 1 item + hint
 
 
-@pytest.mark.asyncio
-async def test_project_filter_shipped_table(make_lode):
+async def test_project_filter_shipped_table(make_lode, now):
     """Project filter should show only matching shipped lodes."""
-    from hopper.lodes import current_time_ms
-
-    now = current_time_ms()
     archived = [
         make_lode(id="ship0001", stage="shipped", project="alpha", updated_at=now),
         make_lode(id="ship0002", stage="shipped", project="beta", updated_at=now),
@@ -3344,14 +2190,13 @@ async def test_project_filter_shipped_table(make_lode):
     app = HopperApp(server=server)
     with patch("hopper.tui.read_diff_totals", return_value=(0, 0)):
         async with app.run_test():
-            table = app.query_one("#shipped-table")
+            table = app.shipped_table
             assert table.row_count == 2  # 2 shipped
             app._project_filter = "alpha"
             app.refresh_shipped()
             assert table.row_count == 1  # 1 shipped
 
 
-@pytest.mark.asyncio
 async def test_project_filter_with_archive_view(make_lode):
     """Project filter should compose with archive view."""
     archived = [
@@ -3361,10 +2206,9 @@ async def test_project_filter_with_archive_view(make_lode):
     server = MockServer([], archived_lodes=archived)
     app = HopperApp(server=server)
     with patch("hopper.tui.read_diff_totals", return_value=(0, 0)):
-        async with app.run_test() as pilot:
-            # Enter archive view
-            await pilot.press("left")
-            table = app.query_one("#lode-table")
+        async with app.run_test():
+            app.set_archive_view(True)
+            table = app.lode_table
             assert table.row_count == 3  # 2 archived + hint
             # Apply filter
             app._project_filter = "alpha"
@@ -3375,7 +2219,6 @@ async def test_project_filter_with_archive_view(make_lode):
             assert "arch0002" not in row_keys
 
 
-@pytest.mark.asyncio
 async def test_project_filter_sub_title():
     """Sub_title should include project name when filter is active."""
     server = MockServer([], git_hash="abc1234", started_at=None)
@@ -3390,13 +2233,9 @@ async def test_project_filter_sub_title():
         assert app.sub_title == "abc1234"
 
 
-@pytest.mark.asyncio
-async def test_project_filter_section_labels(make_lode):
+async def test_project_filter_section_labels(make_lode, now):
     """Section labels should include project name when filter is active."""
-    from hopper.lodes import current_time_ms
-
-    now = current_time_ms()
-    items = [BacklogItem(id="bl01", project="alpha", description="t", created_at=1000)]
+    items = [replace(BACKLOG_ITEM, id="bl01", project="alpha", description="t")]
     archived = [make_lode(id="ship01", stage="shipped", project="alpha", updated_at=now)]
     server = MockServer(
         [make_lode(id="lode01", project="alpha")],
@@ -3416,7 +2255,6 @@ async def test_project_filter_section_labels(make_lode):
             assert backlog_label.content == "backlog · alpha"
 
 
-@pytest.mark.asyncio
 async def test_project_filter_archive_label_with_loc(make_lode):
     """Archive label with LOC and filter shows correct ordering."""
     archived = [
@@ -3428,14 +2266,13 @@ async def test_project_filter_archive_label_with_loc(make_lode):
     diff_totals = {"arch0001": (10, 2), "arch0002": (3, 5)}
 
     with patch("hopper.tui.read_diff_totals", side_effect=lambda lid: diff_totals[lid]):
-        async with app.run_test() as pilot:
+        async with app.run_test():
             app._project_filter = "alpha"
-            await pilot.press("left")  # enter archive view, triggers refresh_table
+            app.set_archive_view(True)  # triggers refresh_table
             label = app.query_one("#lodes_label")
             assert label.content == "lodes · archived · 20 lines · alpha"
 
 
-@pytest.mark.asyncio
 async def test_project_filter_escape_no_filter():
     """Dismissing the picker with escape should not set a filter."""
     projects = [Project(name="alpha", path="/a")]
@@ -0,0 +1,325 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2026 sol pbc
+
+"""Tests for the TUI's pure formatting helpers; none of these start an app."""
+
+from dataclasses import astuple
+
+import pytest
+from rich.text import Span, Text
+
+from hopper.lodes import (
+    STATUS_DISCONNECTED,
+    STATUS_ERROR,
+    STATUS_GATED,
+    STATUS_NEW,
+    STATUS_RUNNING,
+    STATUS_SHIPPED,
+    STATUS_STUCK,
+    format_age,
+)
+from hopper.projects import Project
+from hopper.tui_format import (
+    Row,
+    format_diff_stat,
+    format_diff_summary,
+    format_project_label,
+    format_stage_text,
+    format_status_label,
+    format_status_text,
+    lode_to_row,
+    strip_ansi,
+)
+
+# Tests for lode_to_row
+
+
+@pytest.mark.parametrize(
+    ("stage", "state", "active", "expected_status"),
+    [
+        ("mill", "new", True, STATUS_NEW),
+        ("mill", "running", True, STATUS_RUNNING),
+        ("mill", "stuck", True, STATUS_STUCK),
+        ("mill", "error", True, STATUS_ERROR),
+        # Completed, ready, and task-name states are transient active work
+        ("mill", "completed", True, STATUS_RUNNING),
+        ("refine", "ready", True, STATUS_RUNNING),
+        ("refine", "audit", True, STATUS_RUNNING),
+        # Inactive non-shipped lodes are disconnected unless gated
+        ("refine", "running", False, STATUS_DISCONNECTED),
+        ("mill", "error", False, STATUS_DISCONNECTED),
+        ("refine", "gated", False, STATUS_GATED),
+        # Shipped always shows the shipped icon regardless of state
+        ("shipped", "ready", False, STATUS_SHIPPED),
+        ("shipped", "running", False, STATUS_SHIPPED),
+    ],
+    ids=[
+        "new",
+        "running",
+        "stuck",
+        "error",
+        "completed",
+        "ready",
+        "task_state",
+        "disconnected",
+        "disconnected_error",
+        "gated",
+        "shipped",
+        "shipped_inactive",
+    ],
+)
+def test_lode_to_row_status(stage, state, active, expected_status):
+    """lode_to_row maps stage, state, and active flag to the status icon."""
+    session = {
+        "id": "abcd1234",
+        "stage": stage,
+        "created_at": 1000,
+        "updated_at": 1000,
+        "state": state,
+        "active": active,
+    }
+    row = lode_to_row(session)
+    assert (row.id, row.status, row.stage) == ("abcd1234", expected_status, stage)
+
+
+def test_lode_to_row_new():
+    """New session formats its age and a zero run time."""
+    session = {
+        "id": "abcd1234",
+        "stage": "mill",
+        "created_at": 1000,
+        "updated_at": 1000,
+        "state": "new",
+        "active": True,
+    }
+    row = lode_to_row(session)
+    assert (row.id, row.status, row.stage, row.age, row.run) == (
+        "abcd1234",
+        STATUS_NEW,
+        "mill",
+        format_age(1000),
+        "0s",
+    )
+
+
+def test_lode_to_row_uses_progress_summary_when_active():
+    """Active lodes prefer last_progress_summary for the status text."""
+    session = {
+        "id": "abcd1234",
+        "stage": "refine",
+        "created_at": 1000,
+        "updated_at": 1000,
+        "state": "running",
+        "status": "Working",
+        "last_progress_summary": "codex thinking",
+        "active": True,
+    }
+    row = lode_to_row(session)
+    assert row.status_text == "codex thinking"
+
+
+@pytest.mark.parametrize(
+    "status",
+    [
+        "spawn refused: tmux unreachable — verify tmux is running, then retry",
+        "spawn failed: tmux could not create a runner pane — verify tmux is running, then retry",
+    ],
+)
+def test_lode_to_row_spawn_status_overrides_stale_progress(status):
+    session = {
+        "id": "abcd1234",
+        "stage": "refine",
+        "created_at": 1000,
+        "state": "running",
+        "status": status,
+        "last_progress_summary": "stale runner progress",
+        "active": True,
+    }
+
+    assert lode_to_row(session).status_text == status
+
+
+def test_lode_to_row_title():
+    """lode_to_row maps title and defaults missing title to empty string."""
+    session_with_title = {
+        "id": "abcd1234",
+        "stage": "mill",
+        "created_at": 1000,
+        "updated_at": 1000,
+        "state": "new",
+        "title": "Auth Flow",
+    }
+    row_with_title = lode_to_row(session_with_title)
+    assert row_with_title.title == "Auth Flow"
+
+    session_without_title = {
+        "id": "efgh5678",
+        "stage": "mill",
+        "created_at": 1000,
+        "updated_at": 1000,
+        "state": "new",
+    }
+    row_without_title = lode_to_row(session_without_title)
+    assert row_without_title.title == ""
+
+
+# Tests for format_status_text
+
+
+@pytest.mark.parametrize(
+    ("status", "style"),
+    [
+        (STATUS_RUNNING, "bright_green"),
+        (STATUS_STUCK, "bright_yellow"),
+        (STATUS_ERROR, "bright_red"),
+        (STATUS_NEW, "bright_black"),
+    ],
+    ids=["running", "stuck", "error", "new"],
+)
+def test_format_status_text(status, style):
+    """format_status_text colors each status icon."""
+    text = format_status_text(status)
+    assert str(text) == status
+    assert text.style == style
+
+
+# Tests for format_stage_text
+
+
+@pytest.mark.parametrize(
+    ("stage", "style"),
+    [
+        ("mill", "bright_blue"),
+        ("refine", "bright_yellow"),
+        ("ship", "bright_green"),
+        ("shipped", "bright_green"),
+        ("unknown", ""),
+    ],
+)
+def test_format_stage_text(stage, style):
+    """format_stage_text colors each stage name."""
+    text = format_stage_text(stage)
+    assert str(text) == stage
+    assert text.style == style
+
+
+def test_status_and_stage_text_are_cached():
+    """Repeated renders of the same status or stage reuse one Text."""
+    assert format_status_text(STATUS_RUNNING) is format_status_text(STATUS_RUNNING)
+    assert format_stage_text("mill") is format_stage_text("mill")
+
+
+def test_format_diff_summary():
+    """format_diff_summary colorizes summary counts and handles empty input."""
+    text = format_diff_summary("+30 -8")
+    assert text.plain == "+30 -8"
+    assert text.spans == [Span(0, 3, "bright_green"), Span(4, 6, "bright_red")]
+
+    assert format_diff_summary("") == Text("")
+    assert format_diff_summary(None) == Text("")  # type: ignore[arg-type]
+
+
+# Tests for format_status_label
+
+
+@pytest.mark.parametrize(
+    ("label", "status", "expected", "style"),
+    [
+        ("Claude running", STATUS_RUNNING, "Claude running", "bright_green"),
+        ("No output for 30s", STATUS_STUCK, "No output for 30s", "bright_yellow"),
+        ("Process exited", STATUS_ERROR, "Process exited", "bright_red"),
+        ("", STATUS_NEW, "", "bright_black"),
+        ("line1\nline2", STATUS_RUNNING, "line1 line2", "bright_green"),
+        (
+            "\x1b[31mError: Something failed\x1b[39m",
+            STATUS_ERROR,
+            "Error: Something failed",
+            "bright_red",
+        ),
+        (
+            "\x1b[31mError: line1\x1b[39m\n\x1b[31mline2\x1b[39m",
+            STATUS_ERROR,
+            "Error: line1 line2",
+            "bright_red",
+        ),
+    ],
+    ids=["running", "stuck", "error", "new", "newlines", "ansi", "ansi-and-newlines"],
+)
+def test_format_status_label(label, status, expected, style):
+    """format_status_label flattens newlines, strips ANSI, and colors by status."""
+    text = format_status_label(label, status)
+    assert str(text) == expected
+    assert text.style == style
+
+
+# Tests for strip_ansi
+
+
+def test_strip_ansi_removes_color_codes():
+    """strip_ansi removes ANSI color codes."""
+    assert strip_ansi("\x1b[31mred\x1b[0m") == "red"
+    assert strip_ansi("\x1b[1;32mbold green\x1b[0m") == "bold green"
+
+
+def test_strip_ansi_preserves_plain_text():
+    """strip_ansi leaves plain text unchanged."""
+    assert strip_ansi("plain text") == "plain text"
+    assert strip_ansi("") == ""
+
+
+# Tests for Row dataclass
+
+
+def test_row_dataclass():
+    """Row dataclass stores all fields."""
+    row = Row(
+        id="test1234",
+        stage="mill",
+        age="1m",
+        run="5m",
+        status=STATUS_RUNNING,
+        project="proj",
+        title="Auth Flow",
+        status_text="Working on it",
+    )
+    assert astuple(row) == (
+        "test1234",
+        "mill",
+        "1m",
+        "5m",
+        STATUS_RUNNING,
+        "proj",
+        "Auth Flow",
+        "Working on it",
+    )
+
+
+# Tests for format_project_label
+
+
+def test_format_project_label_marks_disabled():
+    """Disabled projects are marked in picker labels."""
+    active = Project(path="/path/to/proj1", name="proj1")
+    disabled = Project(path="/path/to/proj2", name="proj2", disabled=True)
+
+    assert format_project_label(active) == "proj1"
+    assert format_project_label(disabled) == "proj2 (disabled)"
+
+
+# Tests for format_diff_stat
+
+
+def test_format_diff_stat():
+    """format_diff_stat colorizes +/- characters."""
+    result = format_diff_stat(" file.py | 3 ++-")
+    assert isinstance(result, Text)
+    plain = result.plain
+    assert "file.py" in plain
+    assert "+" in plain
+    assert "-" in plain
+
+
+def test_format_diff_stat_empty():
+    """format_diff_stat returns 'No changes' for empty input."""
+    result = format_diff_stat("")
+    assert "No changes" in result.plain